@@ -0,0 +1,94 @@
+"""Context injection micro-benchmark.
+
+Measures the cost of `Context()`, `Header()` and `Path()` parameters per
+handler call: the same message is processed by a handler without parameters
+and by a handler with them, and the difference is the injection cost.
+It uses the in-memory `TestKafkaBroker`, so no real broker is required.
+
+Run it from the benchmarks dir on two revisions to compare them:
+
+    python context.py --messages 50000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from faststream import Context, Header
+from faststream._internal.logger.logger_proxy import EmptyLoggerObject
+from faststream.kafka import KafkaBroker, TestKafkaBroker
+from faststream.kafka.testing import build_message
+
+
+async def plain_handler(body: Any) -> None:
+    pass
+
+
+async def context_handler(
+    body: Any,
+    message: Any = Context(),
+    correlation_id: str = Context("message.correlation_id"),
+    headers: Any = Context("message.headers"),
+    user: str = Header(),
+    tenant: str = Header(),
+    logger: Any = Context(),
+) -> None:
+    pass
+
+
+async def measure(handler: Any, messages: int) -> float:
+    broker = KafkaBroker(logger=None)
+    broker.subscriber("in")(handler)
+
+    async with TestKafkaBroker(broker):
+        subscriber = broker.subscribers[0]
+
+        # disable TestClient mocks to measure pure injection overhead
+        broker.config.logger.logger = EmptyLoggerObject()
+        for call in subscriber.calls:
+            call.handler.reset_test()
+
+        record = build_message(
+            {"name": "John", "age": 39},
+            topic="in",
+            headers={"user": "john", "tenant": "acme"},
+            serializer=broker.config.fd_config._serializer,
+        )
+
+        # warmup
+        for _ in range(min(1_000, messages)):
+            await subscriber.process_message(record)
+
+        start = time.perf_counter()
+        for _ in range(messages):
+            await subscriber.process_message(record)
+        elapsed = time.perf_counter() - start
+
+    return elapsed / messages * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    plain = min(
+        asyncio.run(measure(plain_handler, args.messages)) for _ in range(args.rounds)
+    )
+    with_context = min(
+        asyncio.run(measure(context_handler, args.messages))
+        for _ in range(args.rounds)
+    )
+
+    print(
+        f"messages: {args.messages}, best of {args.rounds}\n"
+        f"handler without parameters: {plain:.2f} us/call\n"
+        f"handler with 6 context parameters: {with_context:.2f} us/call\n"
+        f"injection cost: {with_context - plain:.2f} us/call",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Import time regression benchmark.
+
+Measures the cold import time of `faststream` and every broker package using
+`python -X importtime` in a fresh interpreter, so worker startup regressions
+(e.g. an eager import of test clients or AsyncAPI generation) are visible.
+
+Run it from the benchmarks dir:
+
+    python importtime.py
+    python importtime.py --module faststream.kafka --top 15
+    python importtime.py --save baseline.json
+    python importtime.py --compare baseline.json --threshold 0.2
+
+`--compare` exits with code 1 if any module imports slower than the baseline
+by more than `--threshold`.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+MODULES = (
+    "faststream",
+    "faststream.kafka",
+    "faststream.confluent",
+    "faststream.rabbit",
+    "faststream.nats",
+    "faststream.redis",
+)
+
+LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return self and cumulative import time (us) for every imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if match := LINE_RE.match(line):
+            self_us, cumulative_us, _, name = match.groups()
+            times[name] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def measure(module: str, rounds: int) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Return the best cumulative import time (ms) and the detailed times."""
+    best_ms, best_times = float("inf"), {}
+
+    for _ in range(rounds):
+        times = import_times(module)
+        if (total := times[module][1] / 1000) < best_ms:
+            best_ms, best_times = total, times
+
+    return best_ms, best_times
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Return the names of the modules regressed against the baseline."""
+    regressions = []
+
+    for module, ms in results.items():
+        if (base := baseline.get(module)) is None:
+            continue
+
+        diff = ms / base - 1
+        print(f"{module:<24} {diff:+8.1%}")
+
+        if diff > threshold:
+            regressions.append(module)
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        help="module to import, can be used multiple times",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=0,
+        help="show the slowest imported modules by self time",
+    )
+    parser.add_argument("--save", type=Path, help="save results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{'module':<24} {'import, ms':>12}")
+
+    results: dict[str, float] = {}
+    for module in args.module or MODULES:
+        try:
+            ms, times = measure(module, args.rounds)
+        except ImportError as e:
+            print(f"{module:<24} {'skipped':>12}  ({e})")
+            continue
+
+        results[module] = ms
+        print(f"{module:<24} {ms:>12.1f}")
+
+        for name, (self_us, cumulative_us) in sorted(
+            times.items(),
+            key=lambda item: item[1][0],
+            reverse=True,
+        )[: args.top]:
+            print(
+                f"    {name:<56} self {self_us / 1000:>7.1f} ms  "
+                f"cumulative {cumulative_us / 1000:>7.1f} ms",
+            )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        print()
+        baseline = json.loads(args.compare.read_text())
+        if regressions := compare(results, baseline, args.threshold):
+            print(f"\nRegressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""In-memory broker throughput and latency benchmark.
+
+Drives the whole subscriber pipeline of every broker (fake producer, parser,
+decoder, middlewares, context, handler call and acknowledgement) through the
+in-memory `TestBroker`, so no running broker is required. It is intended to
+catch framework-overhead regressions in CI.
+
+Every case reports:
+
+* messages per second;
+* p50 / p99 latency of a single publish call (a whole batch for batch cases);
+* peak memory allocated per message, measured in a separate `tracemalloc` pass.
+
+Run it from the benchmarks dir:
+
+    python inmemory.py --list
+    python inmemory.py --case kafka --case "*-batch" --save baseline.json
+    python inmemory.py --compare baseline.json --threshold 0.2
+
+`--compare` exits with code 1 if any case is slower or allocates more than the
+baseline by more than `--threshold`.
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from faststream._internal.broker import BrokerUsecase
+from faststream._internal.logger.logger_proxy import EmptyLoggerObject
+from faststream._internal.testing.broker import TestBroker
+
+MESSAGE = {
+    "name": "John",
+    "age": 39,
+    "fullname": "LongString" * 8,
+    "children": [{"name": "Mike", "age": 8, "fullname": "LongString" * 8}],
+}
+
+PublishFunc = Callable[[BrokerUsecase[Any, Any], Sequence[Any]], Awaitable[Any]]
+
+
+@dataclass
+class Case:
+    name: str
+    build: Callable[[], tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]]
+    publish: PublishFunc
+    batch: bool = False
+    concurrent: bool = False
+
+
+@dataclass
+class CaseResult:
+    msgs_per_sec: float
+    p50_us: float
+    p99_us: float
+    alloc_bytes_per_msg: float
+
+
+async def _noop(body: Any) -> None:
+    pass
+
+
+def _kafka(batch: bool) -> tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]:
+    from faststream.kafka import KafkaBroker, TestKafkaBroker
+
+    broker = KafkaBroker(logger=None)
+    broker.subscriber("in", batch=batch)(_noop)
+    return broker, TestKafkaBroker
+
+
+def _confluent(batch: bool) -> tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]:
+    from faststream.confluent import KafkaBroker, TestKafkaBroker
+
+    broker = KafkaBroker(logger=None)
+    broker.subscriber("in", batch=batch)(_noop)
+    return broker, TestKafkaBroker
+
+
+def _rabbit(batch: bool) -> tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]:
+    from faststream.rabbit import RabbitBroker, TestRabbitBroker
+
+    broker = RabbitBroker(logger=None)
+    broker.subscriber("in", batch=batch)(_noop)
+    return broker, TestRabbitBroker
+
+
+def _nats(batch: bool) -> tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]:
+    from faststream.nats import NatsBroker, PullSub, TestNatsBroker
+
+    broker = NatsBroker(logger=None)
+    if batch:
+        broker.subscriber("in", stream="bench", pull_sub=PullSub(batch=True))(_noop)
+    else:
+        broker.subscriber("in")(_noop)
+    return broker, TestNatsBroker
+
+
+def _redis(batch: bool) -> tuple[BrokerUsecase[Any, Any], type[TestBroker[Any]]]:
+    from faststream.redis import ListSub, RedisBroker, TestRedisBroker
+
+    broker = RedisBroker(logger=None)
+    broker.subscriber(list=ListSub("in", batch=batch))(_noop)
+    return broker, TestRedisBroker
+
+
+BROKERS: dict[str, tuple[Callable[..., Any], dict[str, str]]] = {
+    "kafka": (_kafka, {"topic": "in"}),
+    "confluent": (_confluent, {"topic": "in"}),
+    "rabbit": (_rabbit, {"queue": "in"}),
+    "nats": (_nats, {"subject": "in"}),
+    "redis": (_redis, {"list": "in"}),
+}
+
+
+def _make_publish(destination: dict[str, str], batch: bool) -> PublishFunc:
+    if batch:
+
+        async def publish(broker: BrokerUsecase[Any, Any], msgs: Sequence[Any]) -> Any:
+            return await broker.publish_batch(*msgs, **destination)
+
+    else:
+
+        async def publish(broker: BrokerUsecase[Any, Any], msgs: Sequence[Any]) -> Any:
+            return await broker.publish(msgs[0], **destination)
+
+    return publish
+
+
+def get_cases() -> list[Case]:
+    cases = []
+    for name, (build, destination) in BROKERS.items():
+        cases.extend((
+            Case(
+                name=f"{name}-single",
+                build=lambda b=build: b(batch=False),
+                publish=_make_publish(destination, batch=False),
+            ),
+            Case(
+                name=f"{name}-batch",
+                build=lambda b=build: b(batch=True),
+                publish=_make_publish(destination, batch=True),
+                batch=True,
+            ),
+            Case(
+                name=f"{name}-concurrent",
+                build=lambda b=build: b(batch=False),
+                publish=_make_publish(destination, batch=False),
+                concurrent=True,
+            ),
+        ))
+    return cases
+
+
+def _disable_test_mocks(broker: BrokerUsecase[Any, Any]) -> None:
+    # TestClient mocks store every call, so they distort both time and memory
+    broker.config.logger.logger = EmptyLoggerObject()
+    for subscriber in broker.subscribers:
+        for call in subscriber.calls:
+            call.handler.reset_test()
+
+
+async def _run_case(
+    case: Case,
+    *,
+    messages: int,
+    batch_size: int,
+    concurrency: int,
+    alloc_messages: int,
+) -> CaseResult:
+    broker, test_client = case.build()
+    msgs = [MESSAGE] * (batch_size if case.batch else 1)
+    calls = max(messages // len(msgs), 1)
+
+    async with test_client(broker):
+        _disable_test_mocks(broker)
+
+        latencies: list[float] = []
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                await case.publish(broker, msgs)
+                latencies.append(time.perf_counter() - start)
+
+        # warmup
+        await worker(min(calls, 1_000))
+        latencies.clear()
+
+        start = time.perf_counter()
+        if case.concurrent:
+            await asyncio.gather(*(
+                worker(calls // concurrency) for _ in range(concurrency)
+            ))
+        else:
+            await worker(calls)
+        elapsed = time.perf_counter() - start
+
+        alloc_calls = max(alloc_messages // len(msgs), 1)
+        peaks: list[int] = []
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_calls):
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                await case.publish(broker, msgs)
+                peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        finally:
+            tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return CaseResult(
+        msgs_per_sec=len(latencies) * len(msgs) / elapsed,
+        p50_us=quantiles[49] * 1e6,
+        p99_us=quantiles[98] * 1e6,
+        alloc_bytes_per_msg=statistics.fmean(peaks) / len(msgs),
+    )
+
+
+def select_cases(cases: list[Case], patterns: Sequence[str]) -> list[Case]:
+    if not patterns:
+        return cases
+
+    return [
+        c
+        for c in cases
+        if any(fnmatch.fnmatch(c.name, p) or c.name.startswith(p) for p in patterns)
+    ]
+
+
+def compare(
+    results: dict[str, CaseResult],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Return the names of the cases regressed against the baseline."""
+    regressions = []
+
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+
+        speed = result.msgs_per_sec / base["msgs_per_sec"] - 1
+        alloc = result.alloc_bytes_per_msg / max(base["alloc_bytes_per_msg"], 1) - 1
+        print(f"{name:<24} msgs/s {speed:+8.1%}   alloc {alloc:+8.1%}")
+
+        if speed < -threshold or alloc > threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="case name, prefix or glob pattern, can be used multiple times",
+    )
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--alloc-messages", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save", type=Path, help="save results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    cases = select_cases(get_cases(), args.case)
+
+    if args.list or not cases:
+        print("\n".join(c.name for c in cases) or "no cases selected")
+        return
+
+    print(
+        f"{'case':<24} {'msgs/s':>12} {'p50, us':>10} {'p99, us':>10} "
+        f"{'alloc, B/msg':>14}",
+    )
+
+    results: dict[str, CaseResult] = {}
+    for case in cases:
+        rounds = [
+            asyncio.run(
+                _run_case(
+                    case,
+                    messages=args.messages,
+                    batch_size=args.batch_size,
+                    concurrency=args.concurrency,
+                    alloc_messages=args.alloc_messages,
+                ),
+            )
+            for _ in range(args.rounds)
+        ]
+        result = results[case.name] = max(rounds, key=lambda r: r.msgs_per_sec)
+
+        print(
+            f"{case.name:<24} {result.msgs_per_sec:>12.1f} {result.p50_us:>10.1f} "
+            f"{result.p99_us:>10.1f} {result.alloc_bytes_per_msg:>14.1f}",
+        )
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({n: asdict(r) for n, r in results.items()}, indent=2),
+        )
+
+    if args.compare:
+        print()
+        baseline = json.loads(args.compare.read_text())
+        if regressions := compare(results, baseline, args.threshold):
+            print(f"\nRegressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
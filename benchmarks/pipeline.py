@@ -0,0 +1,89 @@
+"""Subscriber pipeline micro-benchmark.
+
+Measures the framework overhead of `SubscriberUsecase.process_message`
+(acknowledgement, logging and broker middlewares, context scopes and handler
+call) using the in-memory `TestKafkaBroker`, so no real broker is required.
+
+Run it from the benchmarks dir on two revisions to compare them:
+
+    python pipeline.py --messages 100000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from faststream import BaseMiddleware
+from faststream._internal.logger.logger_proxy import EmptyLoggerObject
+from faststream.kafka import KafkaBroker, TestKafkaBroker
+from faststream.kafka.testing import build_message
+
+
+class NoopMiddleware(BaseMiddleware):
+    async def consume_scope(self, call_next: Any, msg: Any) -> Any:
+        return await call_next(msg)
+
+
+def make_broker(middlewares: int) -> KafkaBroker:
+    broker = KafkaBroker(
+        logger=None,
+        middlewares=[NoopMiddleware] * middlewares,
+    )
+
+    @broker.subscriber("in")
+    async def handler(body: Any) -> None:
+        pass
+
+    return broker
+
+
+async def measure(messages: int, middlewares: int) -> float:
+    broker = make_broker(middlewares)
+
+    async with TestKafkaBroker(broker):
+        subscriber = broker.subscribers[0]
+
+        # disable TestClient mocks to measure pure pipeline overhead
+        broker.config.logger.logger = EmptyLoggerObject()
+        for call in subscriber.calls:
+            call.handler.reset_test()
+
+        record = build_message(
+            {"name": "John", "age": 39},
+            topic="in",
+            serializer=broker.config.fd_config._serializer,
+        )
+
+        # warmup
+        for _ in range(min(1_000, messages)):
+            await subscriber.process_message(record)
+
+        start = time.perf_counter()
+        for _ in range(messages):
+            await subscriber.process_message(record)
+        elapsed = time.perf_counter() - start
+
+    return messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--middlewares", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(measure(args.messages, args.middlewares))
+        for _ in range(args.rounds)
+    ]
+
+    print(
+        f"messages: {args.messages}, broker middlewares: {args.middlewares}, "
+        f"best of {args.rounds}: {max(results):.2f} msg/s",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """A Python framework for building services interacting with Apache Kafka, RabbitMQ, NATS and Redis."""
 
-from faststream._internal.testing.app import TestApp
+from typing import TYPE_CHECKING, Any
+
+from faststream._internal.endpoint.subscriber.filters import HeaderEquals
 from faststream._internal.utils import apply_types
 from faststream.annotations import ContextRepo, Logger
 from faststream.app import FastStream
@@ -8,7 +10,10 @@ from faststream.message import SourceType, StreamMessage
 from faststream.middlewares import AckPolicy, BaseMiddleware, ExceptionMiddleware
 from faststream.params import Context, Depends, Header, NoCast, Path
 from faststream.response import BatchPublishCommand, PublishCommand, PublishType, Response
-from faststream.specification import AsyncAPI
+
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
+    from faststream.specification import AsyncAPI
 
 __all__ = (
     "AckPolicy",
@@ -21,6 +26,7 @@ __all__ = (
     "ExceptionMiddleware",
     "FastStream",
     "Header",
+    "HeaderEquals",
     "Logger",
     "NoCast",
     "Path",
@@ -32,3 +38,19 @@ __all__ = (
     "TestApp",
     "apply_types",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # test client and specification are not required to run the application
+    if name == "TestApp":
+        from faststream._internal.testing.app import TestApp
+
+        return TestApp
+
+    if name == "AsyncAPI":
+        from faststream.specification.asyncapi import AsyncAPI
+
+        return AsyncAPI
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -5,6 +5,7 @@ from collections import UserString
 from collections.abc import Callable, Iterable, Mapping
 from importlib.util import find_spec
 from typing import (
+    TYPE_CHECKING,
     Any,
     TypeVar,
 )
@@ -12,6 +13,9 @@ from typing import (
 from pydantic import BaseModel
 from pydantic.version import VERSION as PYDANTIC_VERSION
 
+if TYPE_CHECKING:
+    from pydantic import EmailStr
+
 IS_WINDOWS = sys.platform in {"win32", "cygwin", "msys"}
 IS_MACOS = sys.platform == "darwin"
 
@@ -159,84 +163,101 @@ if sys.version_info >= (3, 11):
 else:
     from exceptiongroup import ExceptionGroup
 
-try:
-    import email_validator
 
-    if email_validator is None:
-        raise ImportError
-    from pydantic import EmailStr
-except ImportError:  # pragma: no cover
-    # NOTE: EmailStr mock was copied from the FastAPI
-    # https://github.com/tiangolo/fastapi/blob/master/fastapi/openapi/models.py#24
-    class EmailStr(UserString):  # type: ignore[no-redef]
-        """EmailStr is a string that should be an email.
-
-        Note: EmailStr mock was copied from the FastAPI:
-        https://github.com/tiangolo/fastapi/blob/master/fastapi/openapi/models.py#24
-        """
-
-        @classmethod
-        def __get_validators__(cls) -> Iterable[Callable[..., Any]]:
-            """Returns the validators for the EmailStr class."""
-            yield cls.validate
-
-        @classmethod
-        def validate(cls, v: Any) -> str:
-            """Validates the EmailStr class."""
-            warnings.warn(
-                "email-validator bot installed, email fields will be treated as str.\n"
-                "To install, run: pip install email-validator",
-                category=RuntimeWarning,
-                stacklevel=1,
-            )
-            return str(v)
-
-        @classmethod
-        def _validate(cls, __input_value: Any, _: Any) -> str:
-            warnings.warn(
-                "email-validator bot installed, email fields will be treated as str.\n"
-                "To install, run: pip install email-validator",
-                category=RuntimeWarning,
-                stacklevel=1,
-            )
-            return str(__input_value)
-
-        @classmethod
-        def __get_pydantic_json_schema__(
-            cls,
-            core_schema: CoreSchema,
-            handler: GetJsonSchemaHandler,
-        ) -> JsonSchemaValue:
-            """Returns the JSON schema for the EmailStr class.
-
-            Args:
-                core_schema : the core schema
-                handler : the handler
-            """
-            return {"type": "string", "format": "email"}
-
-        @classmethod
-        def __get_pydantic_core_schema__(
-            cls,
-            source: type[Any],
-            handler: Callable[[Any], CoreSchema],
-        ) -> JsonSchemaValue:
-            """Returns the core schema for the EmailStr class.
-
-            Args:
-                source : the source
-                handler : the handler
-            """
-            return with_info_plain_validator_function(cls._validate)
+def _get_email_str() -> Any:
+    try:
+        import email_validator
 
+        if email_validator is None:
+            raise ImportError
+        from pydantic import EmailStr
+    except ImportError:  # pragma: no cover
+        # NOTE: EmailStr mock was copied from the FastAPI
+        # https://github.com/tiangolo/fastapi/blob/master/fastapi/openapi/models.py#24
+        class EmailStr(UserString):  # type: ignore[no-redef]
+            """EmailStr is a string that should be an email.
 
-uvicorn: Any
+            Note: EmailStr mock was copied from the FastAPI:
+            https://github.com/tiangolo/fastapi/blob/master/fastapi/openapi/models.py#24
+            """
 
-try:
-    import uvicorn
+            @classmethod
+            def __get_validators__(cls) -> Iterable[Callable[..., Any]]:
+                """Returns the validators for the EmailStr class."""
+                yield cls.validate
+
+            @classmethod
+            def validate(cls, v: Any) -> str:
+                """Validates the EmailStr class."""
+                warnings.warn(
+                    "email-validator bot installed, email fields will be treated as str.\n"
+                    "To install, run: pip install email-validator",
+                    category=RuntimeWarning,
+                    stacklevel=1,
+                )
+                return str(v)
+
+            @classmethod
+            def _validate(cls, __input_value: Any, _: Any) -> str:
+                warnings.warn(
+                    "email-validator bot installed, email fields will be treated as str.\n"
+                    "To install, run: pip install email-validator",
+                    category=RuntimeWarning,
+                    stacklevel=1,
+                )
+                return str(__input_value)
+
+            @classmethod
+            def __get_pydantic_json_schema__(
+                cls,
+                core_schema: CoreSchema,
+                handler: GetJsonSchemaHandler,
+            ) -> JsonSchemaValue:
+                """Returns the JSON schema for the EmailStr class.
+
+                Args:
+                    core_schema : the core schema
+                    handler : the handler
+                """
+                return {"type": "string", "format": "email"}
+
+            @classmethod
+            def __get_pydantic_core_schema__(
+                cls,
+                source: type[Any],
+                handler: Callable[[Any], CoreSchema],
+            ) -> JsonSchemaValue:
+                """Returns the core schema for the EmailStr class.
+
+                Args:
+                    source : the source
+                    handler : the handler
+                """
+                return with_info_plain_validator_function(cls._validate)
+
+    return EmailStr
 
-    HAS_UVICORN = True
 
+try:
+    HAS_UVICORN = find_spec("uvicorn") is not None
 except ImportError:
-    uvicorn = None
     HAS_UVICORN = False
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy optional dependencies on first access only."""
+    if name == "EmailStr":
+        value = _get_email_str()
+
+    elif name == "uvicorn":
+        try:
+            import uvicorn as value
+        except ImportError:
+            value = None
+
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    globals()[name] = value
+    return value
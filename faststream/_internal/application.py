@@ -11,7 +11,6 @@ from faststream._internal.logger import logger
 from faststream._internal.utils import apply_types
 from faststream._internal.utils.functions import fake_context, to_async
 from faststream.exceptions import SetupError
-from faststream.specification import AsyncAPI
 
 if TYPE_CHECKING:
     from faststream._internal.basic_types import (
@@ -88,7 +87,12 @@ class StartAbleApplication:
 
         self.brokers = [broker] if broker else []
 
-        self.schema: SpecificationFactory = specification or AsyncAPI()
+        if specification is None:
+            from faststream.specification.asyncapi import AsyncAPI
+
+            specification = AsyncAPI()
+
+        self.schema: SpecificationFactory = specification
 
         for b in self.brokers:
             b._update_fd_config(self.config)
@@ -1,5 +1,9 @@
+import asyncio
+import logging
+import time
 from abc import abstractmethod
-from collections.abc import Iterable, Sequence
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Generic, Optional
 
 from fast_depends import Provider
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
 
     from faststream._internal.context.repository import ContextRepo
     from faststream._internal.di import FastDependsConfig
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream._internal.producer import ProducerProto
     from faststream.specification.schema import BrokerSpec
 
@@ -89,14 +94,63 @@ class BrokerUsecase(
 
     async def start(self) -> None:
         # TODO: filter by already running handlers after TestClient refactor
-        for sub in self.subscribers:
-            await sub.start()
+        started: list[SubscriberUsecase[Any]] = []
+
+        async def start(sub: "SubscriberUsecase[Any]") -> None:
+            await self._start_subscriber(sub)
+            started.append(sub)
+
+        try:
+            await self._gather_subscribers(start)
+
+        except BaseException:
+            # do not leave already started subscribers consuming
+            with suppress(Exception):
+                await self._gather_subscribers(lambda sub: sub.stop(), started)
+            raise
 
         for pub in self.publishers:
             await pub.start()
 
         self.running = True
 
+    async def _start_subscriber(self, sub: "SubscriberUsecase[Any]") -> None:
+        start_time = time.perf_counter()
+        await sub.start()
+        self.config.logger.log(
+            f"`{sub.specification.call_name}` started in "
+            f"{time.perf_counter() - start_time:.3f}s",
+            log_level=logging.DEBUG,
+            extra=sub.get_log_context(None),
+        )
+
+    async def _gather_subscribers(
+        self,
+        func: Callable[["SubscriberUsecase[Any]"], Awaitable[None]],
+        subscribers: Iterable["SubscriberUsecase[Any]"] | None = None,
+    ) -> None:
+        """Call `func` for subscribers up to `startup_concurrency` at a time.
+
+        Waits for all calls to complete and raises the first occurred error.
+        """
+        if subscribers is None:
+            subscribers = self.subscribers
+
+        limiter = asyncio.Semaphore(self.config.startup_concurrency)
+
+        async def call(sub: "SubscriberUsecase[Any]") -> None:
+            async with limiter:
+                await func(sub)
+
+        results = await asyncio.gather(
+            *(call(sub) for sub in subscribers),
+            return_exceptions=True,
+        )
+
+        for r in results:
+            if isinstance(r, BaseException):
+                raise r
+
     def _setup_logger(self) -> None:
         for sub in self.subscribers:
             log_context = sub.get_log_context(None)
@@ -124,8 +178,7 @@ class BrokerUsecase(
         exc_tb: Optional["TracebackType"] = None,
     ) -> None:
         """Closes the object."""
-        for sub in self.subscribers:
-            await sub.stop()
+        await self._gather_subscribers(lambda sub: sub.stop())
 
         self.running = False
 
@@ -30,6 +30,7 @@ class BrokerConfig:
     # subscriber options
     broker_dependencies: Iterable["Dependant"] = ()
     graceful_timeout: float | None = None
+    startup_concurrency: int = 1
     extra_context: dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self) -> str:
@@ -49,6 +50,11 @@ class BrokerConfig:
     def insert_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_middlewares = (middleware, *self.broker_middlewares)
 
+    @property
+    def middlewares_key(self) -> Any:
+        """Changes identity each time middlewares are added or inserted."""
+        return self.broker_middlewares
+
 
 BrokerConfigType = TypeVar313(
     "BrokerConfigType",
@@ -142,6 +148,10 @@ class ConfigComposition(Generic[BrokerConfigType]):
     def broker_middlewares(self) -> Sequence["BrokerMiddleware[Any]"]:
         return [m for c in self.configs for m in c.broker_middlewares]
 
+    @property
+    def middlewares_key(self) -> tuple[Any, ...]:
+        return tuple(c.middlewares_key for c in self.configs)
+
     @property
     def broker_dependencies(self) -> Iterable["Dependant"]:
         return (b for c in self.configs for b in c.broker_dependencies)
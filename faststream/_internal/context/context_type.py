@@ -1,12 +1,16 @@
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fast_depends.library import CustomField
+from typing_extensions import Self
 
 from faststream._internal.constants import EMPTY
 
 from .resolve import resolve_context_by_name
 
+if TYPE_CHECKING:
+    from .repository import ContextRepo
+
 
 class Context(CustomField):
     """A class to represent a context.
@@ -50,6 +54,11 @@ class Context(CustomField):
             cast=cast,
             required=(default is EMPTY),
         )
+        self._full_name = f"{prefix}{real_name}"
+
+    def set_param_name(self, name: str) -> Self:
+        self._full_name = f"{self.prefix}{self.name or name}"
+        return super().set_param_name(name)
 
     def use(self, /, **kwargs: Any) -> dict[str, Any]:
         """Use the given keyword arguments.
@@ -60,19 +69,25 @@ class Context(CustomField):
         Returns:
             A dictionary containing the updated keyword arguments
         """
-        name = f"{self.prefix}{self.name or self.param_name}"
+        self.inject(kwargs, kwargs["context__"])
+        return kwargs
+
+    def inject(self, kwargs: dict[str, Any], context: "ContextRepo") -> None:
+        """Set the resolved context value to the keyword arguments in-place.
 
+        Args:
+            kwargs: Keyword arguments of the call
+            context: The context repository to resolve the value from
+        """
         if EMPTY != (  # noqa: SIM300
             v := resolve_context_by_name(
-                name=name,
+                name=self._full_name,
                 default=self.default,
                 initial=self.initial,
-                context=kwargs["context__"],
+                context=context,
             )
         ):
             kwargs[self.param_name] = v
 
         else:
             kwargs.pop(self.param_name, None)
-
-        return kwargs
@@ -1,4 +1,4 @@
-from collections.abc import Iterator, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from typing import Any
@@ -10,6 +10,8 @@ from faststream.exceptions import ContextError
 class ContextRepo:
     """A class to represent a context repository."""
 
+    max_cached_resolvers = 1024
+
     def __init__(self, initial: dict[str, Any] | None = None, /) -> None:
         """Initialize the class.
 
@@ -19,12 +21,17 @@ class ContextRepo:
         """
         self._global_context: dict[str, Any] = {"context": self} | (initial or {})
         self._scope_context: dict[str, ContextVar[Any]] = {}
+        self._resolvers: dict[str, Callable[[], Any]] = {}
 
     @property
     def context(self) -> dict[str, Any]:
         return {
             **self._global_context,
-            **{i: j.get() for i, j in self._scope_context.items()},
+            **{
+                i: v
+                for i, j in self._scope_context.items()
+                if (v := j.get()) is not EMPTY
+            },
         }
 
     def set_global(self, key: str, v: Any) -> None:
@@ -153,16 +160,37 @@ class ContextRepo:
         Raises:
             AttributeError, KeyError: If the argument does not exist in the context.
         """
+        if (resolver := self._resolvers.get(argument)) is None:
+            if len(self._resolvers) >= self.max_cached_resolvers:
+                self._resolvers.clear()
+
+            resolver = self._resolvers[argument] = self._compile_resolver(argument)
+
+        return resolver()
+
+    def _compile_resolver(self, argument: str) -> Callable[[], Any]:
+        """Build an accessor with pre-split path."""
         first, *keys = argument.split(".")
+        path = tuple(keys)
+
+        global_context = self._global_context
+        scope_context = self._scope_context
+
+        def resolver() -> Any:
+            if (v := global_context.get(first, EMPTY)) is EMPTY and (
+                (context_var := scope_context.get(first)) is None
+                or (v := context_var.get()) is EMPTY
+            ):
+                raise ContextError(self.context, first)
 
-        if (v := self.get(first, EMPTY)) is EMPTY:
-            raise ContextError(self.context, first)
+            for i in path:
+                v = v[i] if isinstance(v, Mapping) else getattr(v, i)
 
-        for i in keys:
-            v = v[i] if isinstance(v, Mapping) else getattr(v, i)
+            return v
 
-        return v
+        return resolver
 
     def clear(self) -> None:
         self._global_context = {"context": self}
         self._scope_context.clear()
+        self._resolvers.clear()
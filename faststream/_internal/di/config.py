@@ -1,13 +1,15 @@
 import inspect
 from collections.abc import Awaitable, Callable, Mapping, Reversible, Sequence
+from copy import copy
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 from fast_depends import Provider, dependency_provider
 from fast_depends.core import CallModel, build_call_model
+from fast_depends.library import CustomField
 
 from faststream._internal.constants import EMPTY
-from faststream._internal.context import ContextRepo
+from faststream._internal.context import Context, ContextRepo
 from faststream._internal.utils import apply_types, to_async
 
 if TYPE_CHECKING:
@@ -84,10 +86,28 @@ class FastDependsConfig:
             )
 
             if self.use_fastdepends:
+                model, context_fields = _split_context_fields(dependent)
+
+                has_dependencies = bool(model.dependencies or model.extra_dependencies)
+
+                if context_fields and has_dependencies:
+                    # dependencies must not get context values as their own arguments
+                    model.custom_fields["context__"] = _ContextFields(
+                        context_fields,
+                        self.context,
+                    )
+
                 wrapper: InjectWrapper[..., Any] = apply_types(
                     None, context__=self.context
                 )
-                wrapped_call = wrapper(func=wrapped_call, model=dependent)
+                wrapped_call = wrapper(func=wrapped_call, model=model)
+
+                if context_fields and not has_dependencies:
+                    wrapped_call = _resolve_context_decorator(
+                        wrapped_call,
+                        context_fields,
+                        self.context,
+                    )
 
             wrapped_call = _unwrap_message_to_fast_depends_decorator(
                 wrapped_call,
@@ -101,6 +121,71 @@ class FastDependsConfig:
         )
 
 
+def _split_context_fields(
+    dependent: "CallModel",
+) -> tuple["CallModel", tuple[Context, ...]]:
+    """Take `Context` fields out of the model to resolve them inline.
+
+    FastDepends calls sync custom fields in a threadpool, which costs much more
+    than the context lookup itself. The original model is kept untouched, because
+    it is used to build the message schema.
+    """
+    if dependent.is_generator:
+        return dependent, ()
+
+    context_fields = tuple(
+        f for f in dependent.custom_fields.values() if _is_plain_context(f)
+    )
+    if not context_fields:
+        return dependent, ()
+
+    model = copy(dependent)
+    model.custom_fields = {
+        name: f for name, f in dependent.custom_fields.items() if not _is_plain_context(f)
+    }
+    return model, context_fields
+
+
+def _is_plain_context(custom_field: CustomField) -> bool:
+    """Fields with overridden `use` are left to FastDepends to not skip the override."""
+    return isinstance(custom_field, Context) and type(custom_field).use is Context.use
+
+
+def _resolve_context_decorator(
+    func: Callable[..., Awaitable[Any]],
+    context_fields: Sequence[Context],
+    context: "ContextRepo",
+) -> Callable[..., Awaitable[Any]]:
+    async def resolve_wrapper(*args: Any, **kwargs: Any) -> Any:
+        for context_field in context_fields:
+            context_field.inject(kwargs, context)
+        return await func(*args, **kwargs)
+
+    return resolve_wrapper
+
+
+class _ContextFields(CustomField):
+    """Resolves all `Context` fields of a call with dependencies at once.
+
+    Being async, it is awaited by FastDepends directly. Like any custom field,
+    it runs after the dependencies, so they don't see the context values.
+    Calls without dependencies resolve them before the solving instead, to skip
+    FastDepends custom fields machinery.
+    """
+
+    __slots__ = ("context", "fields")
+
+    def __init__(self, fields: Sequence[Context], context: "ContextRepo") -> None:
+        super().__init__(cast=False, required=False)
+        self.fields = fields
+        self.context = context
+
+    async def use(self, /, **kwargs: Any) -> dict[str, Any]:  # type: ignore[override]
+        for context_field in self.fields:
+            context_field.inject(kwargs, self.context)
+        return kwargs
+
+
 def _unwrap_message_to_fast_depends_decorator(
     func: Callable[..., Any],
     dependent: "CallModel",
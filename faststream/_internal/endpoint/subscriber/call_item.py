@@ -11,6 +11,7 @@ from typing import (
     cast,
 )
 
+from faststream._internal.endpoint.subscriber.filters import HeaderEquals
 from faststream._internal.types import MsgType
 from faststream.exceptions import IgnoredException, SetupError
 from faststream.specification.asyncapi.utils import to_camelcase
@@ -158,9 +159,108 @@ class HandlerItem(Generic[MsgType]):
             return result
 
 
+class _HeaderIndex(Generic[MsgType]):
+    """Sequential handlers filtered by the same header, compiled to a dict lookup."""
+
+    __slots__ = ("header", "parser", "table")
+
+    def __init__(self, header: str, parser: "AsyncCallable") -> None:
+        self.header = header
+        self.parser = parser
+        self.table: dict[Any, HandlerItem[MsgType]] = {}
+
+    async def find(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any],
+    ) -> tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"] | None:
+        message = cache[self.parser] = cast(
+            "StreamMessage[MsgType]",
+            cache.get(self.parser) or await self.parser(msg),
+        )
+
+        try:
+            h = self.table.get(message.headers.get(self.header))
+        except TypeError:  # unhashable header value
+            return None
+
+        if h is not None and (message := await h.is_suitable(msg, cache)) is not None:
+            return h, message
+
+        return None
+
+
 class CallsCollection(UserList[HandlerItem[MsgType]]):
+    def __init__(self, initlist: Iterable[HandlerItem[MsgType]] | None = None) -> None:
+        super().__init__(initlist)
+        self._dispatch: (
+            tuple[HandlerItem[MsgType] | _HeaderIndex[MsgType], ...] | None
+        ) = None
+
     def add_call(self, call: "HandlerItem[MsgType]") -> None:
         self.data.append(call)
+        self._dispatch = None
+
+    def compile_dispatch(self) -> None:
+        """Group sequential `HeaderEquals` filters by the same header to dict lookups.
+
+        Should be called after handlers setup, because only handlers with the
+        same parser can share the parsed message headers.
+        """
+        steps: list[HandlerItem[MsgType] | _HeaderIndex[MsgType]] = []
+        run: list[HandlerItem[MsgType]] = []
+
+        def flush_run() -> None:
+            if len(run) > 1:
+                first = cast("HeaderEquals", run[0].filter)
+                index = _HeaderIndex[MsgType](
+                    first.name,
+                    cast("AsyncCallable", run[0].item_parser),
+                )
+                for h in run:
+                    # the first handler wins, as in sequential check
+                    index.table.setdefault(cast("HeaderEquals", h.filter).value, h)
+                steps.append(index)
+            else:
+                steps.extend(run)
+            run.clear()
+
+        for h in self.data:
+            f = h.filter
+            if (
+                isinstance(f, HeaderEquals)
+                and _is_hashable(f.value)
+                and h.item_parser is not None
+            ):
+                if run and (
+                    cast("HeaderEquals", run[0].filter).name != f.name
+                    or run[0].item_parser is not h.item_parser
+                ):
+                    flush_run()
+                run.append(h)
+
+            else:
+                flush_run()
+                steps.append(h)
+
+        flush_run()
+        self._dispatch = tuple(steps)
+
+    async def find_suitable(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any],
+    ) -> tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"] | None:
+        """Return the first suitable handler with the parsed message."""
+        for step in self.data if self._dispatch is None else self._dispatch:
+            if isinstance(step, _HeaderIndex):
+                if (found := await step.find(msg, cache)) is not None:
+                    return found
+
+            elif (message := await step.is_suitable(msg, cache)) is not None:
+                return step, message
+
+        return None
 
     @property
     def name(self) -> str | None:
@@ -184,3 +284,11 @@ class CallsCollection(UserList[HandlerItem[MsgType]]):
         return "\n".join(
             f"{to_camelcase(h.name)}: {h.description or ''}" for h in self.data
         )
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
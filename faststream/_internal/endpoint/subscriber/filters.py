@@ -0,0 +1,39 @@
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from faststream.message import StreamMessage
+
+
+class HeaderEquals:
+    """A filter to select messages by exact header value.
+
+    Acts as a regular filter, but subscriber compiles sequential handlers
+    filtered by the same header into a single dict lookup, so it doesn't
+    check them one by one.
+
+    Example:
+        ```python
+        subscriber = broker.subscriber("events")
+
+
+        @subscriber(filter=HeaderEquals("type", "order.created"))
+        async def order_created(msg): ...
+
+
+        @subscriber(filter=HeaderEquals("type", "order.paid"))
+        async def order_paid(msg): ...
+        ```
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str, value: Hashable) -> None:
+        self.name = name
+        self.value = value
+
+    async def __call__(self, msg: "StreamMessage[Any]") -> bool:
+        return msg.headers.get(self.name) == self.value
+
+    def __repr__(self) -> str:
+        return f"HeaderEquals({self.name!r}, {self.value!r})"
@@ -1,6 +1,5 @@
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterable, Sequence
-from contextlib import AbstractContextManager, AsyncExitStack
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -35,10 +34,14 @@ from .call_item import (
 from .utils import MultiLock, default_filter
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from contextvars import Token
+
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import Decorator
     from faststream._internal.configs import SubscriberUsecaseConfig
+    from faststream._internal.context import ContextRepo
     from faststream._internal.endpoint.call_wrapper import HandlerCallWrapper
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.types import (
@@ -99,6 +102,11 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         self.running = False
         self.lock = FakeContext()
 
+        # compiled at `_build_fastdepends_model` call
+        self._middlewares_stack: tuple[BrokerMiddleware[MsgType], ...] | None = None
+        self._middlewares_key: Any = None
+        self._extra_context: tuple[tuple[str, Any], ...] = ()
+
         self.extra_watcher_options = {}
 
     @property
@@ -158,6 +166,8 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         return async_parser, async_decoder
 
     def _build_fastdepends_model(self) -> None:
+        self._compile_pipeline()
+
         for call in self.calls:
             async_parser, async_decoder = self._get_parser_and_decoder(
                 call.item_parser, call.item_decoder
@@ -173,6 +183,8 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
             call.handler.refresh(with_mock=False)
 
+        self.calls.compile_dispatch()
+
     def _post_start(self) -> None:
         self.running = True
 
@@ -320,85 +332,114 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
     async def process_message(self, msg: MsgType) -> "Response":
         """Execute all message processing stages."""
-        context = self._outer_config.fd_config.context
-        logger_state = self._outer_config.logger
+        if (
+            middlewares_stack := self._middlewares_stack
+        ) is None or self._middlewares_key != self._outer_config.middlewares_key:
+            # broker or router middlewares were changed after start
+            middlewares_stack = self._compile_pipeline()
 
-        async with AsyncExitStack() as stack:
-            stack.enter_context(self.lock)
+        context = self._outer_config.fd_config.context
 
+        with self.lock:
             # Enter context before middlewares
-            stack.enter_context(context.scope("handler_", self))
-            stack.enter_context(context.scope("logger", logger_state.logger.logger))
-            for k, v in self._outer_config.extra_context.items():
-                stack.enter_context(context.scope(k, v))
-
-            # enter all middlewares
-            middlewares: list[BaseMiddleware] = []
-            for base_m in self.__build__middlewares_stack():
-                middleware = base_m(msg, context=context)
-                middlewares.append(middleware)
-                await middleware.__aenter__()
-
-            cache: dict[Any, Any] = {}
-            parsing_error: Exception | None = None
-            for h in self.calls:
+            scopes: list[tuple[str, Token[Any]]] = [
+                ("handler_", context.set_local("handler_", self)),
+                (
+                    "logger",
+                    context.set_local("logger", self._outer_config.logger.logger.logger),
+                ),
+            ]
+
+            try:
+                for k, v in self._extra_context:
+                    scopes.append((k, context.set_local(k, v)))
+
+                # enter all middlewares
+                middlewares: list[BaseMiddleware] = []
+                for base_m in middlewares_stack:
+                    middleware = base_m(msg, context=context)
+                    await middleware.__aenter__()
+                    middlewares.append(middleware)
+
                 try:
-                    message = await h.is_suitable(msg, cache)
-                except Exception as e:
-                    parsing_error = e
-                    break
-
-                if message is not None:
-                    stack.enter_context(
-                        context.scope("log_context", self.get_log_context(message)),
+                    result_msg = await self.__call_handler(
+                        msg,
+                        middlewares,
+                        context,
+                        scopes,
                     )
-                    stack.enter_context(context.scope("message", message))
 
+                except BaseException as e:
                     # Middlewares should be exited before scope release
-                    for m in middlewares:
-                        stack.push_async_exit(m.__aexit__)
-
-                    result_msg = ensure_response(
-                        await h.call(
-                            message=message,
-                            # consumer middlewares
-                            _extra_middlewares=(
-                                m.consume_scope for m in middlewares[::-1]
-                            ),
-                        ),
-                    )
+                    if await _exit_middlewares(middlewares, e):
+                        # An error was raised and processed by some middleware
+                        return ensure_response(None)
+                    raise
 
-                    if not result_msg.correlation_id:
-                        result_msg.correlation_id = message.correlation_id
+                await _exit_middlewares(middlewares, None)
+                return result_msg
 
-                    for p in chain(
-                        self.__get_response_publisher(message),
-                        h.handler._publishers,
-                    ):
-                        await p._publish(
-                            result_msg.as_publish_command(),
-                            _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
-                            ),
-                        )
+            finally:
+                for k, token in reversed(scopes):
+                    context.reset_local(k, token)
 
-                    # Return data for tests
-                    return result_msg
+    async def __call_handler(
+        self,
+        msg: MsgType,
+        middlewares: Sequence["BaseMiddleware"],
+        context: "ContextRepo",
+        scopes: list[tuple[str, "Token[Any]"]],
+    ) -> "Response":
+        cache: dict[Any, Any] = {}
+        if (found := await self.calls.find_suitable(msg, cache)) is not None:
+            h, message = found
+
+            scopes.extend((
+                (
+                    "log_context",
+                    context.set_local("log_context", self.get_log_context(message)),
+                ),
+                ("message", context.set_local("message", message)),
+            ))
+
+            result_msg = ensure_response(
+                await h.call(
+                    message=message,
+                    # consumer middlewares
+                    _extra_middlewares=(m.consume_scope for m in reversed(middlewares)),
+                ),
+            )
+
+            if not result_msg.correlation_id:
+                result_msg.correlation_id = message.correlation_id
 
-            # Suitable handler was not found or
-            # parsing/decoding exception occurred
-            for m in middlewares:
-                stack.push_async_exit(m.__aexit__)
+            for p in chain(
+                self.__get_response_publisher(message),
+                h.handler._publishers,
+            ):
+                await p._publish(
+                    result_msg.as_publish_command(),
+                    _extra_middlewares=(m.publish_scope for m in reversed(middlewares)),
+                )
 
-            # Reraise it to catch in tests
-            if parsing_error:
-                raise parsing_error
+            # Return data for tests
+            return result_msg
 
-            error_msg = f"There is no suitable handler for {msg=}"
-            raise SubscriberNotFound(error_msg)
+        # Suitable handler was not found
+        error_msg = f"There is no suitable handler for {msg=}"
+        raise SubscriberNotFound(error_msg)
 
-        # An error was raised and processed by some middleware
-        return ensure_response(None)
+    def _compile_pipeline(self) -> tuple["BrokerMiddleware[MsgType]", ...]:
+        """Build message processing chain options once per subscriber start.
+
+        Broker-level middlewares and extra context are merged from all included
+        routers, so we resolve them here instead of doing it for each message.
+        The chain is rebuilt if middlewares are added to the broker later.
+        """
+        self._extra_context = tuple(self._outer_config.extra_context.items())
+        self._middlewares_key = self._outer_config.middlewares_key
+        self._middlewares_stack = stack = self.__build__middlewares_stack()
+        return stack
 
     def __build__middlewares_stack(self) -> tuple["BrokerMiddleware[MsgType]", ...]:
         logger_state = self._outer_config.logger
@@ -472,3 +513,36 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
     def schema(self) -> dict[str, "SubscriberSpec"]:
         self._build_fastdepends_model()
         return self.specification.get_schema()
+
+
+async def _exit_middlewares(
+    middlewares: Sequence["BaseMiddleware"],
+    exc: BaseException | None,
+) -> bool:
+    """Exit middlewares in reverse order the same way `AsyncExitStack` does.
+
+    Returns `True` if the passed exception was suppressed by any middleware.
+    """
+    pending = exc
+    suppressed = False
+
+    for m in reversed(middlewares):
+        try:
+            if pending is None:
+                await m.__aexit__(None, None, None)
+
+            elif await m.__aexit__(type(pending), pending, pending.__traceback__):
+                pending = None
+                suppressed = True
+
+        except BaseException as new_exc:  # noqa: PERF203
+            if pending is not None and new_exc is not pending:
+                new_exc.__context__ = pending
+
+            pending = new_exc
+            suppressed = False
+
+    if pending is not None and pending is not exc:
+        raise pending
+
+    return suppressed
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Optional, Protocol
 import anyio
 from fast_depends import Provider, dependency_provider
 
-from faststream._internal._compat import HAS_TYPER, HAS_UVICORN, ExceptionGroup, uvicorn
+from faststream._internal._compat import HAS_TYPER, HAS_UVICORN, ExceptionGroup
 from faststream._internal.application import Application
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
@@ -206,6 +206,8 @@ class AsgiFastStream(Application):
         if not HAS_UVICORN:
             raise ImportError(INSTALL_UVICORN)
 
+        import uvicorn
+
         self._log_level = log_level
         self._run_extra_options = cast_uvicorn_params(run_extra_options or {})
 
@@ -94,6 +94,7 @@ class KafkaBroker(
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -199,6 +200,8 @@ class KafkaBroker(
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency: Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder: Custom decoder object.
             parser: Custom parser object.
             dependencies: Dependencies to apply to all broker subscribers.
@@ -283,6 +286,7 @@ class KafkaBroker(
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
+                startup_concurrency=startup_concurrency,
                 broker_dependencies=dependencies,
                 extra_context={
                     "broker": self,
@@ -80,6 +80,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
@@ -140,6 +141,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: Literal[True] = ...,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
@@ -200,6 +202,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
@@ -260,6 +263,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
@@ -324,6 +328,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
@@ -464,6 +469,8 @@ class KafkaRegistrator(
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch by a single consume call for
+                a non-batch subscriber to process them one by one. Disabled by default.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -491,6 +498,7 @@ class KafkaRegistrator(
             partitions=partitions,
             batch=batch,
             max_records=max_records,
+            prefetch=prefetch,
             group_id=group_id,
             connection_data={
                 "group_instance_id": group_instance_id,
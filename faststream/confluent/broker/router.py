@@ -137,6 +137,7 @@ class KafkaRoute(SubscriberRoute):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -274,6 +275,8 @@ class KafkaRoute(SubscriberRoute):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch by a single consume call for
+                a non-batch subscriber to process them one by one. Disabled by default.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -310,6 +313,7 @@ class KafkaRoute(SubscriberRoute):
             heartbeat_interval_ms=heartbeat_interval_ms,
             isolation_level=isolation_level,
             max_records=max_records,
+            prefetch=prefetch,
             batch=batch,
             # basic args
             dependencies=dependencies,
@@ -94,6 +94,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
@@ -217,6 +218,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency: Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder: Custom decoder object.
             parser: Custom parser object.
             middlewares: Middlewares to apply to all broker publishers/subscribers.
@@ -363,6 +366,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             transaction_timeout_ms=transaction_timeout_ms,
             # broker args
             graceful_timeout=graceful_timeout,
+            startup_concurrency=startup_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -432,6 +436,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -499,6 +504,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -566,6 +572,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: Literal[True] = ...,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -624,6 +631,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -695,6 +703,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -838,6 +847,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch by a single consume call for
+                a non-batch subscriber to process them one by one. Disabled by default.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -952,6 +963,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             isolation_level=isolation_level,
             batch=batch,
             max_records=max_records,
+            prefetch=prefetch,
             # broker args
             dependencies=dependencies,
             parser=parser,
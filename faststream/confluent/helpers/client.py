@@ -1,12 +1,13 @@
 import asyncio
 import logging
+from collections import deque
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from functools import partial
 from time import time
 from typing import TYPE_CHECKING, Any
 
-import anyio
 from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer
 
 from faststream._internal.utils.functions import call_or_await, run_in_executor
@@ -48,6 +49,13 @@ class AsyncConfluentProducer:
             logger=self.logger_state.logger.logger,
         )
 
+        # delivery reports are collected in the polling thread
+        # and resolved at once in the event loop after each poll
+        self._delivered: deque[
+            tuple[asyncio.Future[Message | None], Any, Message | None]
+        ] = deque()
+        self._drained = asyncio.Event()
+
         self.__running = True
         self._poll_task = asyncio.create_task(self._poll_loop())
 
@@ -55,6 +63,8 @@ class AsyncConfluentProducer:
         while self.__running:
             with suppress(Exception):
                 await call_or_await(self.producer.poll, 0.1)
+            self._resolve_delivered()
+            self._drained.set()
 
     async def stop(self) -> None:
         """Stop the Kafka producer and flush remaining messages."""
@@ -63,9 +73,54 @@ class AsyncConfluentProducer:
             if not self._poll_task.done():
                 self._poll_task.cancel()
             await call_or_await(self.producer.flush)
+            self._resolve_delivered()
 
     async def flush(self) -> None:
         await call_or_await(self.producer.flush)
+        self._resolve_delivered()
+
+    def _on_delivery(
+        self,
+        result_future: "asyncio.Future[Message | None]",
+        err: Any,
+        msg: Message | None,
+    ) -> None:
+        self._delivered.append((result_future, err, msg))
+
+    def _resolve_delivered(self) -> None:
+        while self._delivered:
+            result_future, err, msg = self._delivered.popleft()
+
+            if result_future.done():
+                continue
+
+            if err or (msg is not None and (err := msg.error())):
+                result_future.set_exception(KafkaException(err))
+            else:
+                result_future.set_result(msg)
+
+    async def _produce(
+        self,
+        topic: str,
+        kwargs: "_SendKwargs",
+    ) -> "asyncio.Future[Message | None]":
+        result_future: asyncio.Future[Message | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        kwargs["on_delivery"] = partial(self._on_delivery, result_future)
+
+        while True:
+            try:
+                # should be sync to prevent segfault
+                self.producer.produce(topic, **kwargs)
+
+            except BufferError:  # noqa: PERF203
+                # local queue is full - wait for delivery reports to free it
+                self._drained.clear()
+                await self._drained.wait()
+
+            else:
+                return result_future
 
     async def send(
         self,
@@ -90,22 +145,7 @@ class AsyncConfluentProducer:
         if timestamp_ms is not None:
             kwargs["timestamp"] = timestamp_ms
 
-        loop = asyncio.get_running_loop()
-        result_future: asyncio.Future[Message | None] = loop.create_future()
-
-        def ack_callback(err: Any, msg: Message | None) -> None:
-            if err or (msg is not None and (err := msg.error())):
-                loop.call_soon_threadsafe(
-                    result_future.set_exception,
-                    KafkaException(err),
-                )
-            else:
-                loop.call_soon_threadsafe(result_future.set_result, msg)
-
-        kwargs["on_delivery"] = ack_callback
-
-        # should be sync to prevent segfault
-        self.producer.produce(topic, **kwargs)
+        result_future = await self._produce(topic, kwargs)
 
         if no_confirm:
             return result_future
@@ -124,18 +164,23 @@ class AsyncConfluentProducer:
         no_confirm: bool = False,
     ) -> None:
         """Sends a batch of messages to a Kafka topic."""
-        async with anyio.create_task_group() as tg:
-            for msg in batch._builder:
-                tg.start_soon(
-                    self.send,
-                    topic,
-                    msg["value"],
-                    msg["key"],
-                    partition,
-                    msg["timestamp_ms"],
-                    msg["headers"],
-                    no_confirm,
-                )
+        futures: list[asyncio.Future[Message | None]] = []
+
+        for msg in batch._builder:
+            kwargs: _SendKwargs = {
+                "value": msg["value"],
+                "key": msg["key"],
+                "headers": msg["headers"],
+                "timestamp": msg["timestamp_ms"],
+            }
+
+            if partition is not None:
+                kwargs["partition"] = partition
+
+            futures.append(await self._produce(topic, kwargs))
+
+        if not no_confirm:
+            await asyncio.gather(*futures)
 
     async def ping(
         self,
@@ -191,6 +236,8 @@ class AsyncConfluentConsumer:
         connections_max_idle_ms: int = 540000,
         isolation_level: str = "read_uncommitted",
         allow_auto_create_topics: bool = True,
+        # prefetch options
+        prefetch: int | None = None,
     ) -> None:
         self.admin_client = admin_service
         self.logger_state = logger
@@ -232,6 +279,13 @@ class AsyncConfluentConsumer:
             "isolation.level": isolation_level,
         } | config.consumer_config
 
+        self.prefetch = prefetch or 1
+        self._buffer: deque[Message] = deque()
+        if self.prefetch > 1:
+            # offsets are stored when a buffered message is taken,
+            # not when the whole batch is fetched
+            config_from_params["enable.auto.offset.store"] = False
+
         self.config = config_from_params
         self.consumer = Consumer(self.config, logger=self.logger_state.logger.logger)
 
@@ -318,14 +372,46 @@ class AsyncConfluentConsumer:
         # Now it works without lock due `ThreadPoolExecutor(max_workers=1)`
         # that makes all calls to consumer sequential
         await run_in_executor(self._thread_pool, self.consumer.close)
+        self._buffer.clear()
 
         self._thread_pool.shutdown(wait=False)
 
     async def getone(self, timeout: float = 0.1) -> Message | None:
         """Consumes a single message from Kafka."""
+        if self.prefetch > 1:
+            return await self._get_buffered(timeout)
+
         msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
         return check_msg_error(msg)
 
+    async def _get_buffered(self, timeout: float) -> Message | None:
+        """Takes a message from the local buffer and refills it with a single consume call."""
+        if not self._buffer:
+            raw_messages: list[Message | None] = await run_in_executor(
+                self._thread_pool,
+                self.consumer.consume,
+                num_messages=self.prefetch,
+                timeout=timeout,
+            )
+            self._buffer.extend(
+                x for x in map(check_msg_error, raw_messages) if x is not None
+            )
+
+        while self._buffer:
+            msg = self._buffer.popleft()
+
+            try:
+                # local non-blocking call, so it doesn't need the consumer thread
+                self.consumer.store_offsets(message=msg)
+
+            except KafkaException:
+                # partition was revoked - the message will be redelivered to a new owner
+                continue
+
+            return msg
+
+        return None
+
     async def getmany(
         self,
         timeout: float = 0.1,
@@ -347,6 +433,15 @@ class AsyncConfluentConsumer:
             partition=partition,
             offset=offset,
         )
+
+        if self._buffer:
+            # already fetched messages of the partition will be consumed again after seek
+            self._buffer = deque(
+                m
+                for m in self._buffer
+                if m.topic() != topic or m.partition() != partition
+            )
+
         await run_in_executor(
             self._thread_pool,
             self.consumer.seek,
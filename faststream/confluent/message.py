@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from confluent_kafka import Message
@@ -44,6 +45,8 @@ class KafkaMessage(
     This class extends `StreamMessage` and is specialized for handling confluent_kafka.Message objects.
     """
 
+    __slots__ = ("consumer", "is_manual")
+
     def __init__(
         self,
         *args: Any,
@@ -59,6 +62,11 @@ class KafkaMessage(
         if not is_manual:
             self.committed = AckStatus.ACKED
 
+    def _decode_headers(self) -> dict[str, str]:
+        if isinstance(self.raw_message, tuple):
+            return {}
+        return parse_msg_headers(self.raw_message.headers() or ())
+
     async def ack(self) -> None:
         """Acknowledge the Kafka message."""
         if self.is_manual and not self.committed:
@@ -79,3 +87,9 @@ class KafkaMessage(
                 offset=raw_message.offset(),
             )
         await super().nack()
+
+
+def parse_msg_headers(
+    headers: Sequence[tuple[str, bytes | str]],
+) -> dict[str, str]:
+    return {i: j if isinstance(j, str) else j.decode() for i, j in headers}
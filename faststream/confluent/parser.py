@@ -1,9 +1,8 @@
-from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
-from faststream.message import StreamMessage, decode_message
+from faststream.message import StreamMessage, decode_batch_message, decode_message
 
-from .message import FAKE_CONSUMER, KafkaMessage
+from .message import FAKE_CONSUMER, KafkaMessage, parse_msg_headers
 
 if TYPE_CHECKING:
     from confluent_kafka import Message
@@ -13,6 +12,10 @@ if TYPE_CHECKING:
     from .message import ConsumerProtocol
 
 
+# headers required to build a message, the others are decoded lazily
+SERVICE_HEADERS = frozenset(("content-type", "correlation_id", "reply_to"))
+
+
 class AsyncConfluentParser:
     """A class to parse Kafka messages."""
 
@@ -28,7 +31,11 @@ class AsyncConfluentParser:
         message: "Message",
     ) -> KafkaMessage:
         """Parses a Kafka message."""
-        headers = _parse_msg_headers(message.headers() or ())
+        headers = {
+            i: j if isinstance(j, str) else j.decode()
+            for i, j in message.headers() or ()
+            if i in SERVICE_HEADERS
+        }
 
         body = message.value() or b""
         offset = message.offset()
@@ -36,7 +43,6 @@ class AsyncConfluentParser:
 
         return KafkaMessage(
             body=body,
-            headers=headers,
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
             message_id=f"{offset}-{timestamp}",
@@ -59,7 +65,7 @@ class AsyncConfluentParser:
 
         for m in message:
             body.append(m.value() or b"")
-            batch_headers.append(_parse_msg_headers(m.headers() or ()))
+            batch_headers.append(parse_msg_headers(m.headers() or ()))
 
         headers = next(iter(batch_headers), {})
 
@@ -90,10 +96,4 @@ class AsyncConfluentParser:
         msg: "StreamMessage[tuple[Message, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        return [decode_message(await self.parse_message(m)) for m in msg.raw_message]
-
-
-def _parse_msg_headers(
-    headers: Sequence[tuple[str, bytes | str]],
-) -> dict[str, str]:
-    return {i: j if isinstance(j, str) else j.decode() for i, j in headers}
+        return decode_batch_message(msg)
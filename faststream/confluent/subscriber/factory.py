@@ -26,6 +26,7 @@ def create_subscriber(
     polling_interval: float,
     batch: bool,
     max_records: int | None,
+    prefetch: int | None,
     # Kafka information
     group_id: str | None,
     connection_data: dict[str, Any],
@@ -79,6 +80,9 @@ def create_subscriber(
         ),
     )
 
+    if not batch and prefetch:
+        subscriber_config.connection_data["prefetch"] = prefetch
+
     if batch:
         return BatchSubscriber(
             subscriber_config,
@@ -1,4 +1,4 @@
-from faststream._internal.testing.app import TestApp
+from typing import TYPE_CHECKING, Any
 
 try:
     from aiokafka import ConsumerRecord, TopicPartition
@@ -7,7 +7,6 @@ try:
     from .annotations import KafkaMessage
     from .broker import KafkaBroker, KafkaPublisher, KafkaRoute, KafkaRouter
     from .response import KafkaPublishCommand, KafkaResponse
-    from .testing import TestKafkaBroker
 
 except ImportError as e:
     if "'aiokafka'" not in e.msg:
@@ -17,6 +16,11 @@ except ImportError as e:
 
     raise ImportError(INSTALL_FASTSTREAM_KAFKA) from e
 
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
+
+    from .testing import TestKafkaBroker
+
 __all__ = (
     "ConsumerRecord",
     "KafkaBroker",
@@ -31,3 +35,19 @@ __all__ = (
     "TestKafkaBroker",
     "TopicPartition",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # test clients are not required to run the application
+    if name == "TestKafkaBroker":
+        from .testing import TestKafkaBroker
+
+        return TestKafkaBroker
+
+    if name == "TestApp":
+        from faststream._internal.testing.app import TestApp
+
+        return TestApp
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -212,6 +212,7 @@ class KafkaBroker(
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -310,6 +311,9 @@ class KafkaBroker(
                 Transaction timeout in milliseconds.
             graceful_timeout (Optional[float]):
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency (int):
+                Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder (Optional[CustomCallable]):
                 Custom decoder object.
             parser (Optional[CustomCallable]):
@@ -425,6 +429,7 @@ class KafkaBroker(
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
+                startup_concurrency=startup_concurrency,
                 broker_dependencies=dependencies,
                 extra_context={
                     "broker": self,
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentOrderedSubscriber,
         DefaultSubscriber,
     )
 
@@ -91,6 +92,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -114,6 +117,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -159,6 +163,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -182,6 +188,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -227,6 +234,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -250,6 +259,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -295,6 +305,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -318,6 +330,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -363,6 +376,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -386,6 +401,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -397,6 +413,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentOrderedSubscriber",
     ]: ...
 
     @override
@@ -436,6 +453,8 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -459,6 +478,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -470,6 +490,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentOrderedSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -618,6 +639,15 @@ class KafkaRegistrator(
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            commit_interval_ms:
+                Milliseconds between background commits of processed
+                offsets. If set, acknowledged messages are not committed one by one,
+                but the subscriber tracks processed offsets per partition and
+                commits the contiguous processed range only. Can't be used with
+                `AckPolicy.ACK_FIRST`.
+            commit_batch_size:
+                Number of processed messages to trigger the background
+                commit before `commit_interval_ms` is passed.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -649,6 +679,10 @@ class KafkaRegistrator(
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by:
+                Process messages of the same partition (`"partition"`) or the same
+                message key (`"key"`) in the consuming order, while `max_workers` lanes
+                run concurrently with a single consumer.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -663,8 +697,11 @@ class KafkaRegistrator(
             *topics,
             batch=batch,
             max_workers=workers,
+            ordered_by=ordered_by,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
             group_id=group_id,
             listener=listener,
             pattern=pattern,
@@ -715,6 +752,8 @@ class KafkaRegistrator(
             return cast("BatchSubscriber", subscriber)
 
         if workers > 1:
+            if ordered_by is not None:
+                return cast("ConcurrentOrderedSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
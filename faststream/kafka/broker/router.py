@@ -153,6 +153,8 @@ class KafkaRoute(SubscriberRoute):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Iterable["TopicPartition"] | None = (),
@@ -181,6 +183,7 @@ class KafkaRoute(SubscriberRoute):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -332,6 +335,15 @@ class KafkaRoute(SubscriberRoute):
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            commit_interval_ms:
+                Milliseconds between background commits of processed
+                offsets. If set, acknowledged messages are not committed one by one,
+                but the subscriber tracks processed offsets per partition and
+                commits the contiguous processed range only. Can't be used with
+                `AckPolicy.ACK_FIRST`.
+            commit_batch_size:
+                Number of processed messages to trigger the background
+                commit before `commit_interval_ms` is passed.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -369,12 +381,17 @@ class KafkaRoute(SubscriberRoute):
                 Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by:
+                Process messages of the same partition (`"partition"`) or the same
+                message key (`"key"`) in the consuming order, while `max_workers` lanes
+                run concurrently with a single consumer.
         """
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            ordered_by=ordered_by,
             group_id=group_id,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
@@ -396,6 +413,8 @@ class KafkaRoute(SubscriberRoute):
             exclude_internal_topics=exclude_internal_topics,
             isolation_level=isolation_level,
             max_records=max_records,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
             batch_timeout_ms=batch_timeout_ms,
             batch=batch,
             listener=listener,
@@ -56,6 +56,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentOrderedSubscriber,
         DefaultSubscriber,
     )
     from faststream.security import BaseSecurity
@@ -102,6 +103,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         transaction_timeout_ms: int = 60 * 1000,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
@@ -234,6 +236,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 explicitly set by the user it will be chosen.
             # broker base args
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency: Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder: Custom decoder object.
             parser: Custom parser object.
             middlewares: Middlewares to apply to all broker publishers/subscribers.
@@ -350,6 +354,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             transaction_timeout_ms=transaction_timeout_ms,
             # broker args
             graceful_timeout=graceful_timeout,
+            startup_concurrency=startup_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -424,6 +429,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -446,6 +453,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -499,6 +507,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -521,6 +531,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -574,6 +585,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -596,6 +609,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -649,6 +663,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -671,6 +687,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -724,6 +741,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -746,6 +765,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -765,6 +785,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentOrderedSubscriber",
     ]: ...
 
     @override
@@ -804,6 +825,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        commit_interval_ms: int | None = None,
+        commit_batch_size: int = 1000,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -826,6 +849,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by: Literal["partition", "key"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -845,6 +869,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentOrderedSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -993,6 +1018,15 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            commit_interval_ms:
+                Milliseconds between background commits of processed
+                offsets. If set, acknowledged messages are not committed one by one,
+                but the subscriber tracks processed offsets per partition and
+                commits the contiguous processed range only. Can't be used with
+                `AckPolicy.ACK_FIRST`.
+            commit_batch_size:
+                Number of processed messages to trigger the background
+                commit before `commit_interval_ms` is passed.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -1024,6 +1058,10 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by:
+                Process messages of the same partition (`"partition"`) or the same
+                message key (`"key"`) in the consuming order, while `max_workers` lanes
+                run concurrently with a single consumer.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -1095,6 +1133,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             *topics,
             group_id=group_id,
             max_workers=max_workers,
+            ordered_by=ordered_by,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -1116,6 +1155,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             isolation_level=isolation_level,
             batch=batch,
             max_records=max_records,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
             batch_timeout_ms=batch_timeout_ms,
             listener=listener,
             pattern=pattern,
@@ -1147,6 +1188,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             return cast("BatchSubscriber", subscriber)
 
         if workers > 1:
+            if ordered_by is not None:
+                return cast("ConcurrentOrderedSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
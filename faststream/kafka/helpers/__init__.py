@@ -1,3 +1,8 @@
+from .offsets import OffsetsCommitListener, OffsetsTracker
 from .rebalance_listener import make_logging_listener
 
-__all__ = ("make_logging_listener",)
+__all__ = (
+    "OffsetsCommitListener",
+    "OffsetsTracker",
+    "make_logging_listener",
+)
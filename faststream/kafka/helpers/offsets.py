@@ -0,0 +1,150 @@
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional
+
+import anyio
+from aiokafka import ConsumerRebalanceListener, TopicPartition
+
+from faststream._internal.utils.functions import call_or_await
+
+if TYPE_CHECKING:
+    from aiokafka import ConsumerRecord
+
+    from faststream.kafka.message import ConsumerProtocol
+
+
+class _PartitionOffsets:
+    __slots__ = ("committed", "order", "pending", "position")
+
+    def __init__(self) -> None:
+        # in-flight offsets in the fetch order
+        self.order: deque[int] = deque()
+        # in-flight offset -> processed flag
+        self.pending: dict[int, bool] = {}
+        # next offset to consume after the contiguous processed range
+        self.position: int | None = None
+        self.committed: int | None = None
+
+
+class OffsetsTracker:
+    """Tracks processed records offsets to commit them in the background.
+
+    Records should be registered by `add` in the fetch order and can be marked
+    processed by `done` in any order. Only the contiguous processed range of
+    each partition is committed, so an unprocessed record is never committed
+    even if the following ones are processed concurrently.
+    """
+
+    def __init__(
+        self,
+        consumer: "ConsumerProtocol",
+        *,
+        interval: float,
+        max_pending: int,
+    ) -> None:
+        self.consumer = consumer
+        self.interval = interval
+        self.max_pending = max_pending
+
+        self._partitions: dict[TopicPartition, _PartitionOffsets] = {}
+        self._processed = 0
+
+        self._lock = anyio.Lock()
+        self._wakeup = anyio.Event()
+
+    def add(self, *records: "ConsumerRecord") -> None:
+        """Register fetched records."""
+        for record in records:
+            tp = TopicPartition(record.topic, record.partition)
+
+            if (state := self._partitions.get(tp)) is None:
+                state = self._partitions[tp] = _PartitionOffsets()
+
+            state.order.append(record.offset)
+            state.pending[record.offset] = False
+
+    def done(self, *records: "ConsumerRecord") -> None:
+        """Mark records processed and move the partitions commit position."""
+        for record in records:
+            state = self._partitions.get(TopicPartition(record.topic, record.partition))
+
+            # record is not tracked: revoked partition or replayed offset
+            if state is None or state.pending.get(record.offset) is not False:
+                continue
+
+            state.pending[record.offset] = True
+
+            order, pending = state.order, state.pending
+            while order and pending[order[0]]:
+                offset = order.popleft()
+                del pending[offset]
+                state.position = offset + 1
+
+            self._processed += 1
+
+        if self._processed >= self.max_pending:
+            self._wakeup.set()
+
+    def reset(self, tp: TopicPartition, offset: int) -> None:
+        """Forget in-flight records starting from the offset consumer seeks to."""
+        if (state := self._partitions.get(tp)) is None:
+            return
+
+        while state.order and state.order[-1] >= offset:
+            del state.pending[state.order.pop()]
+
+    def revoke(self, partitions: Iterable[TopicPartition]) -> None:
+        for tp in partitions:
+            self._partitions.pop(tp, None)
+
+    async def flush(self) -> None:
+        """Commit processed offsets of all partitions."""
+        async with self._lock:
+            offsets = {
+                tp: state.position
+                for tp, state in self._partitions.items()
+                if state.position is not None and state.position != state.committed
+            }
+
+            if not offsets:
+                return
+
+            self._processed = 0
+            await self.consumer.commit(offsets)
+
+            for tp, position in offsets.items():
+                if (state := self._partitions.get(tp)) is not None:
+                    state.committed = position
+
+    async def run(self) -> None:
+        """Commit processed offsets each `interval` seconds or `max_pending` messages."""
+        while True:
+            with anyio.move_on_after(self.interval):
+                await self._wakeup.wait()
+
+            self._wakeup = anyio.Event()
+            await self.flush()
+
+
+class OffsetsCommitListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Commits processed offsets of revoked partitions before rebalance."""
+
+    def __init__(
+        self,
+        *,
+        tracker: OffsetsTracker,
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.tracker = tracker
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: set["TopicPartition"]) -> None:
+        await self.tracker.flush()
+        self.tracker.revoke(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(self, assigned: set["TopicPartition"]) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
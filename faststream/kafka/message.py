@@ -1,4 +1,4 @@
-from typing import Any, Protocol, Union
+from typing import TYPE_CHECKING, Any, Optional, Protocol, Union
 
 from aiokafka import (
     AIOKafkaConsumer,
@@ -8,11 +8,17 @@ from aiokafka import (
 
 from faststream.message import AckStatus, StreamMessage
 
+if TYPE_CHECKING:
+    from faststream.kafka.helpers import OffsetsTracker
+
 
 class ConsumerProtocol(Protocol):
     """A protocol for Kafka consumers."""
 
-    async def commit(self) -> None: ...
+    async def commit(
+        self,
+        offsets: dict[AIOKafkaTopicPartition, int] | None = None,
+    ) -> None: ...
 
     def seek(
         self,
@@ -25,7 +31,10 @@ class ConsumerProtocol(Protocol):
 class FakeConsumer:
     """A fake Kafka consumer."""
 
-    async def commit(self) -> None:
+    async def commit(
+        self,
+        offsets: dict[AIOKafkaTopicPartition, int] | None = None,
+    ) -> None:
         pass
 
     def seek(
@@ -56,13 +65,35 @@ class KafkaMessage(
     This class extends `StreamMessage` and is specialized for handling Kafka ConsumerRecord objects.
     """
 
-    def __init__(self, *args: Any, consumer: ConsumerProtocol, **kwargs: Any) -> None:
+    __slots__ = ("consumer", "offsets_tracker")
+
+    def __init__(
+        self,
+        *args: Any,
+        consumer: ConsumerProtocol,
+        offsets_tracker: Optional["OffsetsTracker"] = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.consumer = consumer
+        self.offsets_tracker = offsets_tracker
         self.committed = AckStatus.ACKED
 
+    def _decode_headers(self) -> dict[str, str]:
+        if isinstance(self.raw_message, tuple):
+            return {}
+        return {i: j.decode() for i, j in self.raw_message.headers}
+
+    @property
+    def _records(self) -> tuple["ConsumerRecord", ...]:
+        if isinstance(self.raw_message, tuple):
+            return self.raw_message
+        return (self.raw_message,)
+
 
 class KafkaAckableMessage(KafkaMessage):
+    __slots__ = ()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.committed = None
@@ -70,12 +101,33 @@ class KafkaAckableMessage(KafkaMessage):
     async def ack(self) -> None:
         """Acknowledge the Kafka message."""
         if not self.committed:
-            await self.consumer.commit()
+            if self.offsets_tracker is None:
+                await self.consumer.commit()
+            else:
+                # processed offsets are committed in the background
+                self.offsets_tracker.done(*self._records)
         await super().ack()
 
+    async def reject(self) -> None:
+        """Skip the Kafka message."""
+        if not self.committed and self.offsets_tracker is not None:
+            self.offsets_tracker.done(*self._records)
+        await super().reject()
+
     async def nack(self) -> None:
         """Reject the Kafka message."""
-        if not self.committed:
+        if not self.committed and self.offsets_tracker is not None:
+            # seek each partition of the batch to consume its records again
+            partitions: dict[AIOKafkaTopicPartition, int] = {}
+            for record in self._records:
+                tp = AIOKafkaTopicPartition(record.topic, record.partition)
+                partitions[tp] = min(partitions.get(tp, record.offset), record.offset)
+
+            for tp, offset in partitions.items():
+                self.offsets_tracker.reset(tp, offset)
+                self.consumer.seek(partition=tp, offset=offset)
+
+        elif not self.committed:
             raw_message = (
                 self.raw_message[0]
                 if isinstance(self.raw_message, tuple)
@@ -16,6 +16,7 @@ class KafkaTelemetryMiddleware(TelemetryMiddleware[KafkaPublishCommand]):
         meter_provider: MeterProvider | None = None,
         meter: Meter | None = None,
         include_messages_counters: bool = True,
+        include_traces: bool = True,
     ) -> None:
         super().__init__(
             settings_provider_factory=telemetry_attributes_provider_factory,
@@ -23,4 +24,5 @@ class KafkaTelemetryMiddleware(TelemetryMiddleware[KafkaPublishCommand]):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=include_messages_counters,
+            include_traces=include_traces,
         )
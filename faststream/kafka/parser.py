@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from faststream.kafka.message import (
     FAKE_CONSUMER,
@@ -6,7 +6,7 @@ from faststream.kafka.message import (
     KafkaMessage,
     KafkaRawMessage,
 )
-from faststream.message import decode_message
+from faststream.message import decode_batch_message, decode_message
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -14,9 +14,14 @@ if TYPE_CHECKING:
     from aiokafka import ConsumerRecord
 
     from faststream._internal.basic_types import DecodedMessage
+    from faststream.kafka.helpers import OffsetsTracker
     from faststream.message import StreamMessage
 
 
+# headers required to build a message, the others are decoded lazily
+SERVICE_HEADERS = frozenset(("content-type", "correlation_id", "reply_to"))
+
+
 class AioKafkaParser:
     """A class to parse Kafka messages."""
 
@@ -29,20 +34,25 @@ class AioKafkaParser:
         self.regex = regex
 
         self._consumer: ConsumerProtocol = FAKE_CONSUMER
+        self._offsets_tracker: OffsetsTracker | None = None
 
-    def _setup(self, consumer: ConsumerProtocol) -> None:
+    def _setup(
+        self,
+        consumer: ConsumerProtocol,
+        offsets_tracker: Optional["OffsetsTracker"] = None,
+    ) -> None:
         self._consumer = consumer
+        self._offsets_tracker = offsets_tracker
 
     async def parse_message(
         self,
         message: Union["ConsumerRecord", "KafkaRawMessage"],
     ) -> "StreamMessage[ConsumerRecord]":
         """Parses a Kafka message."""
-        headers = {i: j.decode() for i, j in message.headers}
+        headers = {i: j.decode() for i, j in message.headers if i in SERVICE_HEADERS}
 
         return self.msg_class(
             body=message.value or b"",
-            headers=headers,
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
             message_id=f"{message.offset}-{message.timestamp}",
@@ -50,6 +60,7 @@ class AioKafkaParser:
             raw_message=message,
             path=self.get_path(message.topic),
             consumer=getattr(message, "consumer", self._consumer),
+            offsets_tracker=self._offsets_tracker,
         )
 
     async def decode_message(
@@ -94,6 +105,7 @@ class AioKafkaBatchParser(AioKafkaParser):
             raw_message=message,
             path=self.get_path(first.topic),
             consumer=self._consumer,
+            offsets_tracker=self._offsets_tracker,
         )
 
     async def decode_message(
@@ -101,7 +113,4 @@ class AioKafkaBatchParser(AioKafkaParser):
         msg: "StreamMessage[tuple[ConsumerRecord, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        # super() should be here due python can't find it in comprehension
-        super_obj = cast("AioKafkaParser", super())
-
-        return [decode_message(await super_obj.parse_message(m)) for m in msg.raw_message]
+        return decode_batch_message(msg)
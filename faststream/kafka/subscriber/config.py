@@ -32,6 +32,9 @@ class KafkaSubscriberConfig(SubscriberUsecaseConfig):
     pattern: str | None = None
     partitions: Iterable["TopicPartition"] = field(default_factory=list)
 
+    commit_interval_ms: int | None = None
+    commit_batch_size: int = 1000
+
     _auto_commit: bool = field(default_factory=lambda: EMPTY, repr=False)
     _no_ack: bool = field(default_factory=lambda: EMPTY, repr=False)
 
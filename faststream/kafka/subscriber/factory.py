@@ -1,6 +1,6 @@
 import warnings
 from collections.abc import Collection, Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
@@ -13,6 +13,7 @@ from .usecase import (
     BatchSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentOrderedSubscriber,
     DefaultSubscriber,
 )
 
@@ -28,6 +29,8 @@ def create_subscriber(
     batch: bool,
     batch_timeout_ms: int,
     max_records: int | None,
+    commit_interval_ms: int | None,
+    commit_batch_size: int,
     # Kafka information
     group_id: str | None,
     listener: Optional["ConsumerRebalanceListener"],
@@ -38,6 +41,7 @@ def create_subscriber(
     # Subscriber args
     ack_policy: "AckPolicy",
     max_workers: int,
+    ordered_by: Literal["partition", "key"] | None,
     no_ack: bool,
     no_reply: bool,
     config: "KafkaBrokerConfig",
@@ -50,6 +54,7 @@ def create_subscriber(
     "BatchSubscriber",
     "ConcurrentDefaultSubscriber",
     "ConcurrentBetweenPartitionsSubscriber",
+    "ConcurrentOrderedSubscriber",
 ]:
     _validate_input_for_misconfigure(
         *topics,
@@ -59,6 +64,9 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        ordered_by=ordered_by,
+        batch=batch,
+        commit_interval_ms=commit_interval_ms,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -68,6 +76,8 @@ def create_subscriber(
         group_id=group_id,
         listener=listener,
         pattern=pattern,
+        commit_interval_ms=commit_interval_ms,
+        commit_batch_size=commit_batch_size,
         no_reply=no_reply,
         _outer_config=config,
         _ack_policy=ack_policy,
@@ -100,7 +110,18 @@ def create_subscriber(
         )
 
     if max_workers > 1:
-        if subscriber_config.ack_first:
+        if ordered_by is not None:
+            return ConcurrentOrderedSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                ordered_by=ordered_by,
+            )
+
+        # tracked offsets are committed in order, so one consumer can process
+        # messages concurrently without commits of unprocessed ones
+        if subscriber_config.ack_first or commit_interval_ms is not None:
             return ConcurrentDefaultSubscriber(
                 subscriber_config,
                 specification,
@@ -125,8 +146,11 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    ordered_by: Literal["partition", "key"] | None,
+    batch: bool,
     pattern: str | None,
     partitions: Iterable["TopicPartition"],
+    commit_interval_ms: int | None,
 ) -> None:
     if auto_commit is not EMPTY:
         warnings.warn(
@@ -157,7 +181,28 @@ def _validate_input_for_misconfigure(
     if ack_policy is EMPTY:
         ack_policy = AckPolicy.ACK_FIRST
 
-    if max_workers > 1 and ack_policy is not AckPolicy.ACK_FIRST:
+    if commit_interval_ms is not None and ack_policy is AckPolicy.ACK_FIRST:
+        msg = "You can't use `commit_interval_ms` with `AckPolicy.ACK_FIRST`. Please, use another `ack_policy`."
+        raise SetupError(msg)
+
+    if ordered_by is not None:
+        if batch:
+            msg = "You can't use `ordered_by` with a batch subscriber."
+            raise SetupError(msg)
+
+        if (
+            max_workers > 1
+            and ack_policy is not AckPolicy.ACK_FIRST
+            and commit_interval_ms is None
+        ):
+            msg = "You should set `commit_interval_ms` to use `ordered_by` with manual commit mode."
+            raise SetupError(msg)
+
+    if (
+        max_workers > 1
+        and ack_policy is not AckPolicy.ACK_FIRST
+        and commit_interval_ms is None
+    ):
         if len(topics) > 1:
             msg = "You must use a single topic with concurrent manual commit mode."
             raise SetupError(msg)
@@ -1,8 +1,9 @@
+import asyncio
 import logging
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Sequence
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast
 
 import anyio
 from aiokafka import ConsumerRecord, TopicPartition
@@ -14,13 +15,18 @@ from faststream._internal.endpoint.subscriber.usecase import SubscriberUsecase
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream._internal.utils.path import compile_path
-from faststream.kafka.helpers import make_logging_listener
+from faststream.kafka.helpers import (
+    OffsetsCommitListener,
+    OffsetsTracker,
+    make_logging_listener,
+)
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage, KafkaRawMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
 from faststream.kafka.publisher.fake import KafkaFakePublisher
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
@@ -57,6 +63,10 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
         self._listener = config.listener
         self._connection_args = config.connection_args
 
+        self._commit_interval_ms = config.commit_interval_ms
+        self._commit_batch_size = config.commit_batch_size
+        self.offsets_tracker: OffsetsTracker | None = None
+
         self.consumer = None
 
     @property
@@ -97,7 +107,19 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             **self._connection_args,
         )
 
-        self.parser._setup(consumer)
+        listener = self._listener
+        if self._commit_interval_ms is not None:
+            self.offsets_tracker = OffsetsTracker(
+                consumer,
+                interval=self._commit_interval_ms / 1000,
+                max_pending=self._commit_batch_size,
+            )
+            listener = OffsetsCommitListener(
+                tracker=self.offsets_tracker,
+                listener=listener,
+            )
+
+        self.parser._setup(consumer, self.offsets_tracker)
 
         if self.topics or self.pattern:
             consumer.subscribe(
@@ -107,7 +129,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
                     consumer=consumer,
                     logger=self._outer_config.logger.logger.logger,
                     log_extra=self.get_log_context(None),
-                    listener=self._listener,
+                    listener=listener,
                 ),
             )
 
@@ -118,12 +140,22 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
 
         self._post_start()
 
+        if self.offsets_tracker is not None:
+            self.add_task(self.offsets_tracker.run)
+
         if self.calls:
             self.add_task(self._run_consume_loop, (self.consumer,))
 
     async def stop(self) -> None:
         await super().stop()
 
+        if self.offsets_tracker is not None:
+            try:
+                await self.offsets_tracker.flush()
+            except KafkaError as e:
+                self._log(logging.ERROR, "Processed offsets commit failed", exc_info=e)
+            self.offsets_tracker = None
+
         if self.consumer is not None:
             await self.consumer.stop()
             self.consumer = None
@@ -150,6 +182,9 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
 
         ((raw_message,),) = raw_messages.values()
 
+        if self.offsets_tracker is not None:
+            self.offsets_tracker.add(raw_message)
+
         context = self._outer_config.fd_config.context
 
         async_parser, async_decoder = self._get_parser_and_decoder()
@@ -175,6 +210,9 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
         async_parser, async_decoder = self._get_parser_and_decoder()
 
         async for raw_message in self.consumer:
+            if self.offsets_tracker is not None:
+                self.offsets_tracker.add(raw_message)
+
             msg: KafkaMessage = await process_msg(  # type: ignore[assignment]
                 msg=raw_message,
                 middlewares=(
@@ -234,6 +272,12 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
                     connected = True
 
                 if msg:
+                    if self.offsets_tracker is not None:
+                        # register records in the fetch order before concurrent processing
+                        self.offsets_tracker.add(
+                            *(msg if isinstance(msg, tuple) else (msg,))
+                        )
+
                     await self.consume_one(msg)
 
     async def consume_one(self, msg: MsgType) -> None:
@@ -384,6 +428,76 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin["ConsumerRecord"], DefaultSubs
         await self._put_msg(msg)
 
 
+class ConcurrentOrderedSubscriber(DefaultSubscriber):
+    """Single consumer subscriber processing messages concurrently in ordered lanes.
+
+    Each message is dispatched to one of `max_workers` lanes by its partition or key,
+    so messages with the same partition (key) are processed one by one in the consuming
+    order, while different lanes are processed concurrently.
+    """
+
+    def __init__(
+        self,
+        config: "KafkaSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[ConsumerRecord]",
+        max_workers: int,
+        ordered_by: Literal["partition", "key"],
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_workers = max_workers
+        self.ordered_by = ordered_by
+
+        self._lanes: list[MemoryObjectSendStream[ConsumerRecord]] = []
+        self._lane_tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        for _ in range(self.max_workers):
+            send_stream, receive_stream = anyio.create_memory_object_stream(
+                max_buffer_size=self.max_workers,
+            )
+            self._lanes.append(send_stream)
+            self._lane_tasks.append(self.add_task(self._serve_lane, (receive_stream,)))
+
+        await super().start()
+
+    async def stop(self) -> None:
+        self.running = False
+
+        # stop reading at first, so no more messages are routed to lanes
+        if readers := [t for t in self.tasks if t not in self._lane_tasks]:
+            for task in readers:
+                task.cancel()
+            await asyncio.wait(readers)
+
+        for lane in self._lanes:
+            lane.close()
+        self._lanes = []
+
+        # process already routed messages before lanes cancellation
+        if self._lane_tasks and (timeout := self._outer_config.graceful_timeout):
+            await asyncio.wait(self._lane_tasks, timeout=timeout)
+        self._lane_tasks = []
+
+        await super().stop()
+
+    async def _serve_lane(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[ConsumerRecord]",
+    ) -> None:
+        async for msg in receive_stream:
+            await self.consume(msg)
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        if self.ordered_by == "key" and msg.key is not None:
+            lane = hash(msg.key)
+        else:
+            lane = hash((msg.topic, msg.partition))
+
+        await self._lanes[lane % self.max_workers].send(msg)
+
+
 class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
     consumer_subgroup: list["AIOKafkaConsumer"]
 
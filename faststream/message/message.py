@@ -26,6 +26,25 @@ class AckStatus(str, Enum):
 class StreamMessage(Generic[MsgType]):
     """Generic class to represent a stream message."""
 
+    # `__dict__` is created on demand only to keep custom attributes working
+    __slots__ = (
+        "__dict__",
+        "_batch_headers",
+        "_correlation_id",
+        "_decoded_caches",
+        "_decoder",
+        "_headers",
+        "_message_id",
+        "_path",
+        "body",
+        "committed",
+        "content_type",
+        "processed",
+        "raw_message",
+        "reply_to",
+        "source_type",
+    )
+
     def __init__(
         self,
         raw_message: "MsgType",
@@ -46,27 +65,81 @@ class StreamMessage(Generic[MsgType]):
         self.content_type = content_type
         self.source_type = source_type
 
-        self.headers = headers or {}
-        self.batch_headers = batch_headers or []
-        self.path = path or {}
-        self.correlation_id = correlation_id or str(uuid4())
-        self.message_id = message_id or self.correlation_id
+        # containers and ids are created at the first access only
+        self._headers = headers
+        self._batch_headers = batch_headers or None
+        self._path = path or None
+        self._correlation_id = correlation_id or None
+        self._message_id = message_id or None
 
         self.committed: AckStatus | None = None
         self.processed = False
 
         # Setup later
-        self.__decoder: AsyncCallable | None = None
-        self.__decoded_caches: dict[
-            Any,
-            Any,
-        ] = {}  # Cache values between filters and tests
+        self._decoder: AsyncCallable | None = None
+        # Cache values between filters and tests
+        self._decoded_caches: dict[Any, Any] | None = None
+
+    @property
+    def headers(self) -> dict[str, Any]:
+        if self._headers is None:
+            self._headers = self._decode_headers()
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict[str, Any]) -> None:
+        self._headers = value
+
+    def _decode_headers(self) -> dict[str, Any]:
+        """Build headers from the raw message if they were not passed explicitly."""
+        return {}
+
+    @property
+    def batch_headers(self) -> list[dict[str, Any]]:
+        if self._batch_headers is None:
+            self._batch_headers = []
+        return self._batch_headers
+
+    @batch_headers.setter
+    def batch_headers(self, value: list[dict[str, Any]]) -> None:
+        self._batch_headers = value
+
+    @property
+    def path(self) -> dict[str, Any]:
+        if self._path is None:
+            self._path = {}
+        return self._path
+
+    @path.setter
+    def path(self, value: dict[str, Any]) -> None:
+        self._path = value
+
+    @property
+    def correlation_id(self) -> str:
+        if self._correlation_id is None:
+            self._correlation_id = str(uuid4())
+        return self._correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: str) -> None:
+        self._correlation_id = value
+
+    @property
+    def message_id(self) -> str:
+        if self._message_id is None:
+            self._message_id = str(uuid4())
+        return self._message_id
+
+    @message_id.setter
+    def message_id(self, value: str) -> None:
+        self._message_id = value
 
     def set_decoder(self, decoder: "AsyncCallable") -> None:
-        self.__decoder = decoder
+        self._decoder = decoder
 
     def clear_cache(self) -> None:
-        self.__decoded_caches.clear()
+        if self._decoded_caches:
+            self._decoded_caches.clear()
 
     def __repr__(self) -> str:
         inner = ", ".join(
@@ -94,11 +167,15 @@ class StreamMessage(Generic[MsgType]):
         Returns a cache after first usage. To prevent such behavior, please call
         `message.clear_cache()` after `message.body` changes.
         """
-        assert self.__decoder, "You should call `set_decoder()` method first."
+        assert self._decoder, "You should call `set_decoder()` method first."
+
+        if self._decoded_caches is None:
+            self._decoded_caches = {}
 
-        if (result := self.__decoded_caches.get(self.__decoder)) is None:
-            result = self.__decoded_caches[self.__decoder] = await self.__decoder(self)
+        elif (result := self._decoded_caches.get(self._decoder)) is not None:
+            return result
 
+        result = self._decoded_caches[self._decoder] = await self._decoder(self)
         return result
 
     async def ack(self) -> None:
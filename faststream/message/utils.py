@@ -1,7 +1,7 @@
 import json
 from collections.abc import Sequence
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import uuid4
 
 from faststream._internal._compat import json_dumps, json_loads
@@ -23,15 +23,32 @@ def gen_cor_id() -> str:
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
+    return _decode_body(body, getattr(message, "content_type", None))
+
+
+def decode_batch_message(message: "StreamMessage[Any]") -> list["DecodedMessage"]:
+    """Decodes a batch message bodies using content-type of each batch item."""
+    batch_headers = message.batch_headers
+
+    return [
+        _decode_body(
+            body,
+            batch_headers[i].get("content-type") if i < len(batch_headers) else None,
+        )
+        for i, body in enumerate(message.body)
+    ]
+
+
+def _decode_body(body: Any, content_type: str | None) -> "DecodedMessage":
     m: DecodedMessage = body
 
-    if content_type := getattr(message, "content_type", False):
-        content_type = ContentTypes(cast("str", content_type))
+    if content_type:
+        known_type = ContentTypes(content_type)
 
-        if content_type is ContentTypes.TEXT:
+        if known_type is ContentTypes.TEXT:
             m = body.decode()
 
-        elif content_type is ContentTypes.JSON:
+        elif known_type is ContentTypes.JSON:
             m = json_loads(body)
 
     else:
@@ -1,4 +1,4 @@
-from faststream._internal.testing.app import TestApp
+from typing import TYPE_CHECKING, Any
 
 try:
     from nats.js.api import (
@@ -20,7 +20,6 @@ try:
     from .broker import NatsBroker, NatsPublisher, NatsRoute, NatsRouter
     from .response import NatsPublishCommand, NatsResponse
     from .schemas import JStream, KvWatch, ObjWatch, PubAck, PullSub
-    from .testing import TestNatsBroker
 
 except ImportError as e:
     if "'nats'" not in e.msg:
@@ -30,6 +29,10 @@ except ImportError as e:
 
     raise ImportError(INSTALL_FASTSTREAM_NATS) from e
 
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
+
+    from .testing import TestNatsBroker
 
 __all__ = (
     "AckPolicy",
@@ -59,3 +62,19 @@ __all__ = (
     "TestApp",
     "TestNatsBroker",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # test clients are not required to run the application
+    if name == "TestNatsBroker":
+        from .testing import TestNatsBroker
+
+        return TestNatsBroker
+
+    if name == "TestApp":
+        from faststream._internal.testing.app import TestApp
+
+        return TestApp
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -3,6 +3,7 @@ from collections.abc import Iterable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
     Optional,
     Union,
     cast,
@@ -49,6 +50,7 @@ from .logging import make_nats_logger_state
 from .registrator import NatsRegistrator
 
 if TYPE_CHECKING:
+    import asyncio
     from types import TracebackType
 
     from fast_depends.dependencies import Dependant
@@ -210,6 +212,7 @@ class NatsBroker(
         flush_timeout: float | None = None,
         js_options: Union["JsInitOptions", dict[str, Any], None] = None,
         graceful_timeout: float | None = None,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -293,8 +296,13 @@ class NatsBroker(
                 Max duration to wait for a forced flush to occur
             js_options:
                 JetStream initialization options.
+                `publish_async_max_pending` also limits the number of PubAcks
+                awaited in the background for `no_confirm` publishing.
             graceful_timeout:
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency:
+                Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder:
                 Custom decoder object
             parser:
@@ -345,6 +353,7 @@ class NatsBroker(
         js_producer = NatsJSFastProducer(
             parser=parser,
             decoder=decoder,
+            max_pending=(js_options or {}).get("publish_async_max_pending", 4000),
         )
 
         producer = NatsFastProducerImpl(
@@ -409,6 +418,7 @@ class NatsBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                startup_concurrency=startup_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -523,6 +533,7 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: None = None,
         timeout: float | None = None,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -535,8 +546,22 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -547,7 +572,8 @@ class NatsBroker(
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
-    ) -> Optional["PubAck"]:
+        no_confirm: bool = False,
+    ) -> Union["PubAck", "asyncio.Future[PubAck]", None]:
         """Publish message directly.
 
         This method allows you to publish message in not AsyncAPI-documented way. You can use it in another frameworks
@@ -574,29 +600,138 @@ class NatsBroker(
                 Can be omitted without any effect if you doesn't want PubAck frame.
             timeout:
                 Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for JetStream PubAck frame.
+                The number of PubAcks awaited in the background is limited by
+                `js_options["publish_async_max_pending"]` broker option.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future[PubAck]` if you publishes a message to stream with no_confirm = True.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             correlation_id=correlation_id or gen_cor_id(),
             subject=subject,
             headers=headers,
             reply_to=reply_to,
             stream=stream,
             timeout=timeout or 0.5,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        result: PubAck | None
+        result: PubAck | asyncio.Future[PubAck] | None
         if stream:
             result = await super()._basic_publish(cmd, producer=self.config.js_producer)
         else:
             result = await super()._basic_publish(cmd, producer=self.config.producer)
         return result
 
+    @overload  # type: ignore[override]
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> None: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[False] = False,
+    ) -> list["PubAck"]: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> list["asyncio.Future[PubAck]"]: ...
+
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> list["PubAck"] | list["asyncio.Future[PubAck]"] | None:
+        """Publish multiple messages at once.
+
+        Core NATS messages are written to the connection by a single flush.
+        JetStream messages are sent without waiting for each PubAck one by one.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            subject:
+                NATS subject to send messages.
+            headers:
+                Message headers to store metainformation.
+                **content-type** and **correlation_id** will be set automatically by framework anyway.
+            reply_to:
+                NATS subject name to send response.
+            correlation_id:
+                Manual message **correlation_id** setter.
+                **correlation_id** is a useful option to trace messages.
+            stream:
+                This option validates that the target subject is in presented stream.
+                Can be omitted without any effect if you doesn't want PubAck frame.
+            timeout:
+                Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for JetStream PubAck frames.
+
+        Returns:
+            `None` if you publishes regular messages.
+            `list[faststream.nats.PubAck]` if you publishes messages to stream.
+            `list[asyncio.Future[PubAck]]` if you publishes messages to stream with no_confirm = True.
+        """
+        cmd = NatsPublishCommand(
+            *messages,
+            correlation_id=correlation_id or gen_cor_id(),
+            subject=subject,
+            headers=headers,
+            reply_to=reply_to,
+            stream=stream,
+            timeout=timeout or 0.5,
+            no_confirm=no_confirm,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[PubAck] | list[asyncio.Future[PubAck]] | None
+        if stream:
+            result = await self._basic_publish_batch(
+                cmd,
+                producer=self.config.js_producer,
+            )
+        else:
+            result = await self._basic_publish_batch(cmd, producer=self.config.producer)
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -633,7 +768,7 @@ class NatsBroker(
             `faststream.nats.message.NatsMessage` object as an outer subscriber response.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             correlation_id=correlation_id or gen_cor_id(),
             subject=subject,
             headers=headers,
@@ -797,6 +797,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         reply_to: str = "",
         stream: Union[str, "JStream", None] = None,
         timeout: float | None = None,
+        batch: bool = False,
         persistent: bool = True,
         middlewares: Annotated[
             Sequence["PublisherMiddleware"],
@@ -826,6 +827,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             stream: This option validates that the target `subject` is in presented stream.
                 Can be omitted without any effect.
             timeout: Timeout to send message to NATS.
+            batch: Whether to send messages in batches or not.
             middlewares: Publisher middlewares to wrap outgoing messages.
             title: AsyncAPI publisher object title.
             description: AsyncAPI publisher object description.
@@ -845,6 +847,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             timeout=timeout,
             stream=stream,
             # Specific
+            batch=batch,
             broker_config=cast("NatsBrokerConfig", self.config),
             middlewares=middlewares,
             # AsyncAPI
@@ -45,6 +45,7 @@ class NatsPublisher(ArgsContainer):
         stream: Union[str, "JStream", None] = None,
         timeout: float | None = None,
         # basic args
+        batch: bool = False,
         middlewares: Sequence["PublisherMiddleware"] = (),
         # AsyncAPI information
         title: str | None = None,
@@ -67,6 +68,8 @@ class NatsPublisher(ArgsContainer):
                 Can be omitted without any effect.
             timeout:
                 Timeout to send message to NATS.
+            batch:
+                Whether to send messages in batches or not.
             middlewares:
                 Publisher middlewares to wrap outgoing messages.
             title:
@@ -85,6 +88,7 @@ class NatsPublisher(ArgsContainer):
             reply_to=reply_to,
             stream=stream,
             timeout=timeout,
+            batch=batch,
             middlewares=middlewares,
             title=title,
             description=description,
@@ -129,6 +129,7 @@ class NatsRouter(StreamRouter["Msg"]):
         flush_timeout: float | None = None,
         # broker args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Msg, Any]"] = (),
@@ -216,6 +217,8 @@ class NatsRouter(StreamRouter["Msg"]):
             pending_size: Max size of the pending buffer for publishing commands.
             flush_timeout: Max duration to wait for a forced flush to occur.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency: Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder: Custom decoder object.
             parser: Custom parser object.
             middlewares: Middlewares to apply to all broker publishers/subscribers.
@@ -330,6 +333,7 @@ class NatsRouter(StreamRouter["Msg"]):
             specification=specification,
             # broker options
             graceful_timeout=graceful_timeout,
+            startup_concurrency=startup_concurrency,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
@@ -1247,6 +1251,7 @@ class NatsRouter(StreamRouter["Msg"]):
         stream: Union[str, "JStream", None] = None,
         timeout: float | None = None,
         # specific
+        batch: bool = False,
         middlewares: Annotated[
             Sequence["PublisherMiddleware"],
             deprecated(
@@ -1271,6 +1276,7 @@ class NatsRouter(StreamRouter["Msg"]):
             stream: This option validates that the target `subject` is in presented stream.
                 Can be omitted without any effect.
             timeout: Timeout to send message to NATS.
+            batch: Whether to send messages in batches or not.
             middlewares: Publisher middlewares to wrap outgoing messages.
             title: AsyncAPI publisher object title.
             description: AsyncAPI publisher object description.
@@ -1284,6 +1290,7 @@ class NatsRouter(StreamRouter["Msg"]):
             reply_to=reply_to,
             stream=stream,
             timeout=timeout,
+            batch=batch,
             middlewares=middlewares,
             title=title,
             description=description,
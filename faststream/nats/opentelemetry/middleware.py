@@ -14,6 +14,7 @@ class NatsTelemetryMiddleware(TelemetryMiddleware[NatsPublishCommand]):
         meter_provider: MeterProvider | None = None,
         meter: Meter | None = None,
         include_messages_counters: bool = True,
+        include_traces: bool = True,
     ) -> None:
         super().__init__(
             settings_provider_factory=telemetry_attributes_provider_factory,
@@ -21,4 +22,5 @@ class NatsTelemetryMiddleware(TelemetryMiddleware[NatsPublishCommand]):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=include_messages_counters,
+            include_traces=include_traces,
         )
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any
 
 from faststream.message import (
     StreamMessage,
+    decode_batch_message,
     decode_message,
 )
 from faststream.nats.message import (
@@ -80,7 +81,7 @@ class NatsParser(NatsBaseParser):
             reply_to=message.reply,
             headers=headers,
             content_type=headers.get("content-type", ""),
-            message_id=headers.get("message_id"),
+            message_id=headers.get("message_id") or headers.get("correlation_id"),
             correlation_id=headers.get("correlation_id"),
         )
 
@@ -106,7 +107,7 @@ class JsParser(NatsBaseParser):
             reply_to=headers.get("reply_to", ""),  # differ from core
             headers=headers,
             content_type=headers.get("content-type"),
-            message_id=headers.get("message_id"),
+            message_id=headers.get("message_id") or headers.get("correlation_id"),
             correlation_id=headers.get("correlation_id"),
         )
 
@@ -145,16 +146,7 @@ class BatchParser(JsParser):
         self,
         msg: "StreamMessage[list[Msg]]",
     ) -> list["DecodedMessage"]:
-        data: list[DecodedMessage] = []
-
-        path: dict[str, Any] | None = None
-        for m in msg.raw_message:
-            one_msg = await self.parse_message(m, path=path)
-            path = one_msg.path
-
-            data.append(decode_message(one_msg))
-
-        return data
+        return decode_batch_message(msg)
 
 
 class KvParser(NatsBaseParser):
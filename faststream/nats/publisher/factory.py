@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from .config import NatsPublisherConfig, NatsPublisherSpecificationConfig
 from .specification import NatsPublisherSpecification
-from .usecase import LogicPublisher
+from .usecase import BatchPublisher, LogicPublisher
 
 if TYPE_CHECKING:
     from faststream._internal.types import PublisherMiddleware
@@ -18,6 +18,7 @@ def create_publisher(
     headers: dict[str, str] | None,
     stream: Optional["JStream"],
     timeout: float | None,
+    batch: bool,
     # Publisher args
     broker_config: "NatsBrokerConfig",
     middlewares: Sequence["PublisherMiddleware"],
@@ -48,4 +49,7 @@ def create_publisher(
         ),
     )
 
+    if batch:
+        return BatchPublisher(publisher_config, specification)
+
     return LogicPublisher(publisher_config, specification)
@@ -1,6 +1,8 @@
 import asyncio
+import json
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
 import nats
@@ -8,7 +10,6 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
 from faststream.message import encode_message
 from faststream.nats.helpers.state import (
     ConnectedState,
@@ -46,9 +47,11 @@ class NatsFastProducer(ProducerProto[NatsPublishCommand]):
     @abstractmethod
     async def request(self, cmd: "NatsPublishCommand") -> "Msg": ...
 
-    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> Any: ...
+
+    async def flush(self) -> None:
+        """Wait for all messages published without confirmation."""
 
 
 class NatsFastProducerImpl(NatsFastProducer):
@@ -97,6 +100,25 @@ class NatsFastProducerImpl(NatsFastProducer):
             headers=headers_to_send,
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        connection = self.__state.connection
+        headers_to_send = cmd.headers_to_publish()
+
+        # `publish` just appends the message to the client pending buffer,
+        # so all the batch is written to the socket by a single flush
+        for body in cmd.batch_bodies:
+            payload, content_type = encode_message(body, self.serializer)
+
+            await connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                reply=cmd.reply_to,
+                headers={"content-type": content_type or "", **headers_to_send},
+            )
+
+        await connection.flush()
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
@@ -125,6 +147,7 @@ class NatsJSFastProducer(NatsFastProducer):
         *,
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        max_pending: int = 4000,
     ) -> None:
         self.serializer: SerializerProto | None = None
 
@@ -134,6 +157,10 @@ class NatsJSFastProducer(NatsFastProducer):
 
         self.__state: ConnectionState[JetStreamContext] = EmptyConnectionState()
 
+        self._inbox = ReplyInbox()
+        self._pending: set[asyncio.Future[PubAck]] = set()
+        self._pending_window = asyncio.Semaphore(max_pending)
+
     def connect(
         self,
         connection: "JetStreamContext",
@@ -141,12 +168,19 @@ class NatsJSFastProducer(NatsFastProducer):
     ) -> None:
         self.serializer = serializer
         self.__state = ConnectedState(connection)
+        self._inbox.close()
+        self._inbox = ReplyInbox()
 
     def disconnect(self) -> None:
         self.__state = EmptyConnectionState()
+        # fail awaiting replies to release their publishing window slots
+        self._inbox.close()
 
     @override
-    async def publish(self, cmd: "NatsPublishCommand") -> "PubAck":
+    async def publish(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> "PubAck | asyncio.Future[PubAck]":
         payload, content_type = encode_message(cmd.body, self.serializer)
 
         headers_to_send = {
@@ -154,6 +188,13 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=True),
         }
 
+        if cmd.no_confirm:
+            return await self._publish_async(
+                cmd,
+                payload=payload,
+                headers=headers_to_send,
+            )
+
         return await self.__state.connection.publish(
             subject=cmd.destination,
             payload=payload,
@@ -162,18 +203,104 @@ class NatsJSFastProducer(NatsFastProducer):
             timeout=cmd.timeout,
         )
 
+    async def _publish_async(
+        self,
+        cmd: "NatsPublishCommand",
+        *,
+        payload: bytes,
+        headers: dict[str, str],
+    ) -> "asyncio.Future[PubAck]":
+        """Publish a message and collect its PubAck in the background."""
+        await self._pending_window.acquire()
+
+        try:
+            js = self.__state.connection
+            nc = js._nc
+            reply_to, reply = await self._inbox.new_reply(
+                nc,
+                # the slot is released by PubAck only, so the lost one must expire
+                timeout=js._timeout if cmd.timeout is None else cmd.timeout,
+            )
+
+            if cmd.stream:
+                headers[nats.js.api.Header.EXPECTED_STREAM] = cmd.stream
+
+            await nc.publish(
+                subject=cmd.destination,
+                payload=payload,
+                reply=reply_to,
+                headers=headers,
+            )
+
+        except BaseException:
+            self._pending_window.release()
+            raise
+
+        ack_future: asyncio.Future[PubAck] = asyncio.get_running_loop().create_future()
+        self._pending.add(ack_future)
+        reply.add_done_callback(partial(self._on_pub_ack, ack_future))
+        return ack_future
+
+    @override
+    async def publish_batch(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> "list[PubAck] | list[asyncio.Future[PubAck]]":
+        headers_to_send = cmd.headers_to_publish(js=True)
+
+        futures = []
+        for body in cmd.batch_bodies:
+            payload, content_type = encode_message(body, self.serializer)
+
+            futures.append(
+                await self._publish_async(
+                    cmd,
+                    payload=payload,
+                    headers={"content-type": content_type or "", **headers_to_send},
+                ),
+            )
+
+        if cmd.no_confirm:
+            return futures
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return cast("list[PubAck]", results)
+
+    def _on_pub_ack(
+        self,
+        ack_future: "asyncio.Future[PubAck]",
+        reply: "asyncio.Future[Msg]",
+    ) -> None:
+        self._pending.discard(ack_future)
+        self._pending_window.release()
+
+        if ack_future.done():
+            return
+
+        try:
+            ack_future.set_result(parse_pub_ack(reply.result()))
+        except Exception as e:
+            ack_future.set_exception(e)
+
+    @override
+    async def flush(self) -> None:
+        """Wait for all pending PubAcks and raise the first publishing error."""
+        results = await asyncio.gather(*self._pending, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
 
-        reply_to = self.__state.connection._nc.new_inbox()
-        future: asyncio.Future[Msg] = asyncio.Future()
-        sub = await self.__state.connection._nc.subscribe(
-            reply_to,
-            future=future,
-            max_msgs=1,
-        )
-        await sub.unsubscribe(limit=1)
+        reply_to, future = await self._inbox.new_reply(self.__state.connection._nc)
 
         headers_to_send = {
             "content-type": content_type or "",
@@ -181,27 +308,104 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=False),
         }
 
-        with anyio.fail_after(cmd.timeout):
-            await self.__state.connection.publish(
-                subject=cmd.destination,
-                payload=payload,
-                headers=headers_to_send,
-                stream=cmd.stream,
-                timeout=cmd.timeout,
+        try:
+            with anyio.fail_after(cmd.timeout):
+                await self.__state.connection.publish(
+                    subject=cmd.destination,
+                    payload=payload,
+                    headers=headers_to_send,
+                    stream=cmd.stream,
+                    timeout=cmd.timeout,
+                )
+
+                msg = await future
+
+        finally:
+            # drop the reply waiter on timeout
+            future.cancel()
+
+        if (  # pragma: no cover
+            msg.headers
+            and (
+                msg.headers.get(nats.js.api.Header.STATUS)
+                == nats.aio.client.NO_RESPONDERS_STATUS
             )
+        ):
+            raise nats.errors.NoRespondersError
 
-            msg = await future
+        return msg
 
-            if (  # pragma: no cover
-                msg.headers
-                and (
-                    msg.headers.get(nats.js.api.Header.STATUS)
-                    == nats.aio.client.NO_RESPONDERS_STATUS
-                )
-            ):
-                raise nats.errors.NoRespondersError
 
-            return msg
+class ReplyInbox:
+    """A single wildcard inbox subscription routing replies to futures by token."""
+
+    def __init__(self) -> None:
+        self._prefix: str | None = None
+        self._replies: dict[str, asyncio.Future[Msg]] = {}
+        self._lock = asyncio.Lock()
+
+    async def new_reply(
+        self,
+        nc: "Client",
+        *,
+        timeout: float | None = None,
+    ) -> tuple[str, "asyncio.Future[Msg]"]:
+        """Create a unique reply subject and a future for the reply to it."""
+        if self._prefix is None:
+            async with self._lock:
+                if self._prefix is None:
+                    prefix = f"{nc.new_inbox()}."
+                    await nc.subscribe(f"{prefix}*", cb=self._handle_reply)
+                    self._prefix = prefix
+
+        token = nc._nuid.next().decode()
+        reply: asyncio.Future[Msg] = asyncio.get_running_loop().create_future()
+        self._replies[token] = reply
+        reply.add_done_callback(lambda _: self._replies.pop(token, None))
+
+        if timeout is not None:
+            handle = asyncio.get_running_loop().call_later(
+                timeout,
+                _set_timeout,
+                reply,
+            )
+            reply.add_done_callback(lambda _: handle.cancel())
+
+        return f"{self._prefix}{token}", reply
+
+    async def _handle_reply(self, msg: "Msg") -> None:
+        reply = self._replies.get(msg.subject[len(self._prefix or "") :])
+
+        if reply is not None and not reply.done():
+            reply.set_result(msg)
+
+    def close(self) -> None:
+        """Fail all awaiting replies, the inbox subscription is closed with the connection."""
+        for reply in tuple(self._replies.values()):
+            if not reply.done():
+                reply.set_exception(nats.errors.ConnectionClosedError)
+
+        self._replies.clear()
+        self._prefix = None
+
+
+def _set_timeout(future: "asyncio.Future[Any]") -> None:
+    if not future.done():
+        future.set_exception(nats.errors.TimeoutError)
+
+
+def parse_pub_ack(msg: "Msg") -> "PubAck":
+    """Build a PubAck from a JetStream publish reply."""
+    if msg.headers and (
+        msg.headers.get(nats.js.api.Header.STATUS) == nats.aio.client.NO_RESPONDERS_STATUS
+    ):
+        raise nats.js.errors.NoStreamResponseError
+
+    resp = json.loads(msg.data)
+    if "error" in resp:
+        raise nats.js.errors.APIError.from_error(resp["error"])
+
+    return nats.js.api.PubAck.from_response(resp)
 
 
 class FakeNatsFastProducer(NatsFastProducer):
@@ -221,5 +425,4 @@ class FakeNatsFastProducer(NatsFastProducer):
 
     @override
     async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+        raise NotImplementedError
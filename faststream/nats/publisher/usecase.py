@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Union, cast
 
 from typing_extensions import overload, override
 
@@ -10,6 +10,8 @@ from faststream.nats.schemas.js_stream import compile_nats_wildcard
 from faststream.response.publish_type import PublishType
 
 if TYPE_CHECKING:
+    import asyncio
+
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.endpoint.publisher import PublisherSpecification
     from faststream._internal.producer import ProducerProto
@@ -61,6 +63,7 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: None = None,
         timeout: float | None = None,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -73,8 +76,22 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -85,7 +102,8 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
-    ) -> Optional["PubAck"]:
+        no_confirm: bool = False,
+    ) -> Union["PubAck", "asyncio.Future[PubAck]", None]:
         """Publish message directly.
 
         Args:
@@ -107,10 +125,15 @@ class LogicPublisher(PublisherUsecase):
                 Can be omitted without any effect if you doesn't want PubAck frame.
             timeout:
                 Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for JetStream PubAck frame.
+                The number of PubAcks awaited in the background is limited by
+                `js_options["publish_async_max_pending"]` broker option.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future[PubAck]` if you publishes a message to stream with no_confirm = True.
         """
         cmd = NatsPublishCommand(
             message,
@@ -120,13 +143,14 @@ class LogicPublisher(PublisherUsecase):
             correlation_id=correlation_id or gen_cor_id(),
             stream=stream or getattr(self.stream, "name", None),
             timeout=timeout or self.timeout,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        response: PubAck | None
+        response: PubAck | asyncio.Future[PubAck] | None
         if cmd.stream:
             response = cast(
-                "PubAck",
+                "PubAck | asyncio.Future[PubAck]",
                 await self._basic_publish(
                     cmd,
                     producer=self._outer_config.js_producer,
@@ -142,6 +166,13 @@ class LogicPublisher(PublisherUsecase):
 
         return response
 
+    async def flush(self) -> None:
+        """Wait for all messages published to stream with `no_confirm=True`.
+
+        Raises the first publishing error if any.
+        """
+        await self._outer_config.js_producer.flush()
+
     @override
     async def _publish(
         self,
@@ -207,7 +238,7 @@ class LogicPublisher(PublisherUsecase):
             `faststream.nats.message.NatsMessage` object as an outer subscriber response.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             subject=subject or self.subject,
             headers=self.headers | (headers or {}),
             timeout=timeout or self.timeout,
@@ -223,3 +254,141 @@ class LogicPublisher(PublisherUsecase):
 
         msg: NatsMessage = await self._basic_request(cmd, producer=producer)
         return msg
+
+
+class BatchPublisher(LogicPublisher):
+    """A class to represent a NATS publisher sending messages in batches."""
+
+    @overload  # type: ignore[override]
+    async def publish(
+        self,
+        *messages: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> None: ...
+
+    @overload
+    async def publish(
+        self,
+        *messages: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[False] = False,
+    ) -> list["PubAck"]: ...
+
+    @overload
+    async def publish(
+        self,
+        *messages: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> list["asyncio.Future[PubAck]"]: ...
+
+    async def publish(
+        self,
+        *messages: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> list["PubAck"] | list["asyncio.Future[PubAck]"] | None:
+        """Publish messages batch directly.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            subject:
+                NATS subject to send messages.
+            headers:
+                Message headers to store metainformation.
+                **content-type** and **correlation_id** will be set automatically by framework anyway.
+            reply_to:
+                NATS subject name to send response.
+            correlation_id:
+                Manual message **correlation_id** setter.
+                **correlation_id** is a useful option to trace messages.
+            stream:
+                This option validates that the target subject is in presented stream.
+                Can be omitted without any effect if you doesn't want PubAck frame.
+            timeout:
+                Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for JetStream PubAck frames.
+
+        Returns:
+            `None` if you publishes regular messages.
+            `list[faststream.nats.PubAck]` if you publishes messages to stream.
+            `list[asyncio.Future[PubAck]]` if you publishes messages to stream with no_confirm = True.
+        """
+        cmd = NatsPublishCommand(
+            *messages,
+            subject=subject or self.subject,
+            headers=self.headers | (headers or {}),
+            reply_to=reply_to or self.reply_to,
+            correlation_id=correlation_id or gen_cor_id(),
+            stream=stream or getattr(self.stream, "name", None),
+            timeout=timeout or self.timeout,
+            no_confirm=no_confirm,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        producer: ProducerProto[Any]
+        if cmd.stream:
+            producer = self._outer_config.js_producer
+        else:
+            producer = self._outer_config.producer
+
+        result: (
+            list[PubAck] | list[asyncio.Future[PubAck]] | None
+        ) = await self._basic_publish_batch(
+            cmd,
+            producer=producer,
+            _extra_middlewares=(),
+        )
+        return result
+
+    @override
+    async def _publish(
+        self,
+        cmd: Union["PublishCommand", "NatsPublishCommand"],
+        *,
+        _extra_middlewares: Iterable["PublisherMiddleware"],
+    ) -> None:
+        """This method should be called in subscriber flow only."""
+        cmd = NatsPublishCommand.from_cmd(cmd, batch=True)
+
+        cmd.destination = self.subject
+        cmd.add_headers(self.headers, override=False)
+        cmd.reply_to = cmd.reply_to or self.reply_to
+
+        if self.stream:
+            cmd.stream = self.stream.name
+            cmd.timeout = self.timeout
+
+        if cmd.stream:
+            producer: ProducerProto[Any] = self._outer_config.js_producer
+        else:
+            producer = self._outer_config.producer
+
+        await self._basic_publish_batch(
+            cmd,
+            producer=producer,
+            _extra_middlewares=_extra_middlewares,
+        )
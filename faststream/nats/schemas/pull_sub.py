@@ -9,11 +9,14 @@ class PullSub:
         timeout (:obj:`float`, optional): Wait this time for required batch size will be accumulated in stream
             in seconds (default is `5.0`).
         batch (bool): Whether to propagate consuming batch as iterable object to your handler (default is `False`).
+        prefetch (bool): Whether to request the next batch while the current one is processing. Keeps up to
+            `2 * batch_size` messages in flight to overlap fetching with processing (default is `False`).
     """
 
     __slots__ = (
         "batch",
         "batch_size",
+        "prefetch",
         "timeout",
     )
 
@@ -22,10 +25,12 @@ class PullSub:
         batch_size: int = 1,
         timeout: float | None = 5.0,
         batch: bool = False,
+        prefetch: bool = False,
     ) -> None:
         self.batch_size = batch_size
         self.batch = batch
         self.timeout = timeout
+        self.prefetch = prefetch
 
     @overload
     @classmethod
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
@@ -74,18 +75,12 @@ class PullStreamSubscriber(
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription
 
-        while self.running:  # pragma: no branch
-            messages = []
-            with suppress(TimeoutError, ConnectionClosedError):
-                messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
-                    timeout=self.pull_sub.timeout,
-                )
+        async def process(messages: list["Msg"]) -> None:
+            async with anyio.create_task_group() as tg:
+                for msg in messages:
+                    tg.start_soon(cb, msg)
 
-            if messages:
-                async with anyio.create_task_group() as tg:
-                    for msg in messages:
-                        tg.start_soon(cb, msg)
+        await _pull_loop(self, process)
 
 
 class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscriber):
@@ -223,12 +218,45 @@ class BatchPullStreamSubscriber(
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription, "You should call `create_subscription` at first."
 
-        while self.running:  # pragma: no branch
-            with suppress(TimeoutError, ConnectionClosedError):
-                messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
-                    timeout=self.pull_sub.timeout,
-                )
+        await _pull_loop(self, self.consume)
+
+
+async def _pull_loop(
+    subscriber: PullStreamSubscriber | BatchPullStreamSubscriber,
+    process: Callable[[list["Msg"]], Awaitable[Any]],
+) -> None:
+    """Fetch messages batches and process them while subscriber is running.
+
+    With `PullSub(prefetch=True)` the next batch fetch is sent before the current
+    batch processing, so the server delivers messages while they are processed.
+    """
+    subscription = subscriber.subscription
+    assert subscription
+
+    pull_sub = subscriber.pull_sub
+
+    async def fetch() -> list["Msg"]:
+        with suppress(TimeoutError, ConnectionClosedError):
+            return await subscription.fetch(
+                batch=pull_sub.batch_size,
+                timeout=pull_sub.timeout,
+            )
+        return []
+
+    if not pull_sub.prefetch:
+        while subscriber.running:  # pragma: no branch
+            if messages := await fetch():
+                await process(messages)
+        return
+
+    next_batch = asyncio.create_task(fetch())
+    try:
+        while subscriber.running:  # pragma: no branch
+            messages = await next_batch
+            next_batch = asyncio.create_task(fetch())
+
+            if messages:
+                await process(messages)
 
-                if messages:
-                    await self.consume(messages)
+    finally:
+        next_batch.cancel()
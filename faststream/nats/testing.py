@@ -128,6 +128,32 @@ class FakeProducer(NatsFastProducer):
 
             await self._execute_handler(msg, cmd.destination, handler)
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        for handler in _find_handler(
+            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            cmd.destination,
+            cmd.stream,
+        ):
+            messages = (
+                build_message(
+                    message=message,
+                    subject=cmd.destination,
+                    headers=cmd.headers,
+                    correlation_id=cmd.correlation_id,
+                    reply_to=cmd.reply_to,
+                    serializer=self.broker.config.fd_config._serializer,
+                )
+                for message in cmd.batch_bodies
+            )
+
+            if (pull := getattr(handler, "pull_sub", None)) and pull.batch:
+                await self._execute_handler(list(messages), cmd.destination, handler)
+
+            else:
+                for m in messages:
+                    await self._execute_handler(m, cmd.destination, handler)
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "PatchedMessage":
         incoming = build_message(
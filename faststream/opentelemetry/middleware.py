@@ -1,7 +1,6 @@
 import time
 from collections import defaultdict
 from collections.abc import Callable
-from copy import copy
 from typing import TYPE_CHECKING, Any, Generic, Optional, cast
 
 from opentelemetry import baggage, context, metrics, trace
@@ -44,6 +43,7 @@ _TRACE_PROPAGATOR = TraceContextTextMapPropagator()
 
 class TelemetryMiddleware(Generic[PublishCommandType]):
     __slots__ = (
+        "_include_traces",
         "_meter",
         "_metrics",
         "_settings_provider_factory",
@@ -61,11 +61,13 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
         meter_provider: Optional["MeterProvider"] = None,
         meter: Optional["Meter"] = None,
         include_messages_counters: bool = False,
+        include_traces: bool = True,
     ) -> None:
         self._tracer = _get_tracer(tracer_provider)
         self._meter = _get_meter(meter_provider, meter)
         self._metrics = _MetricsContainer(self._meter, include_messages_counters)
         self._settings_provider_factory = settings_provider_factory
+        self._include_traces = include_traces
 
     def __call__(
         self,
@@ -79,12 +81,14 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
             tracer=self._tracer,
             metrics_container=self._metrics,
             settings_provider_factory=self._settings_provider_factory,
+            include_traces=self._include_traces,
             context=context,
         )
 
 
 class _MetricsContainer:
     __slots__ = (
+        "_attributes",
         "include_messages_counters",
         "process_counter",
         "process_duration",
@@ -92,8 +96,11 @@ class _MetricsContainer:
         "publish_duration",
     )
 
+    max_cached_attributes = 1024
+
     def __init__(self, meter: "Meter", include_messages_counters: bool) -> None:
         self.include_messages_counters = include_messages_counters
+        self._attributes: dict[tuple[str, ...], dict[str, Any]] = {}
 
         self.publish_duration = meter.create_histogram(
             name="messaging.publish.duration",
@@ -118,22 +125,72 @@ class _MetricsContainer:
                 description="Measures the number of published messages.",
             )
 
+    def get_attributes(
+        self,
+        messaging_system: str,
+        destination_key: str,
+        destination_name: str,
+    ) -> dict[str, Any]:
+        """Return shared metrics attributes for the destination.
+
+        The returned dict is cached and must not be modified.
+        """
+        key = (messaging_system, destination_key, destination_name)
+
+        if (attrs := self._attributes.get(key)) is None:
+            if len(self._attributes) >= self.max_cached_attributes:
+                self._attributes.clear()
+
+            attrs = self._attributes[key] = {
+                SpanAttributes.MESSAGING_SYSTEM: messaging_system,
+                destination_key: destination_name,
+            }
+
+        return attrs
+
+    def get_span_attributes(
+        self,
+        messaging_system: str,
+        destination_key: str,
+        destination_name: str,
+        operation: str,
+    ) -> dict[str, Any]:
+        """Return shared span start attributes for the destination and operation.
+
+        Spans get them at start to make them visible to samplers.
+        The returned dict is cached and must not be modified.
+        """
+        key = (messaging_system, destination_key, destination_name, operation)
+
+        if (attrs := self._attributes.get(key)) is None:
+            attrs = {
+                **self.get_attributes(
+                    messaging_system, destination_key, destination_name
+                ),
+                SpanAttributes.MESSAGING_OPERATION: operation,
+            }
+
+            if len(self._attributes) >= self.max_cached_attributes:
+                self._attributes.clear()
+            self._attributes[key] = attrs
+
+        return attrs
+
     def observe_publish(
         self,
         attrs: dict[str, Any],
         duration: float,
         msg_count: int,
+        error_type: str | None = None,
     ) -> None:
         self.publish_duration.record(
             amount=duration,
-            attributes=attrs,
+            attributes=_with_error(attrs, error_type),
         )
         if self.include_messages_counters:
-            counter_attrs = copy(attrs)
-            counter_attrs.pop(ERROR_TYPE, None)
             self.publish_counter.add(
                 amount=msg_count,
-                attributes=counter_attrs,
+                attributes=attrs,
             )
 
     def observe_consume(
@@ -141,17 +198,16 @@ class _MetricsContainer:
         attrs: dict[str, Any],
         duration: float,
         msg_count: int,
+        error_type: str | None = None,
     ) -> None:
         self.process_duration.record(
             amount=duration,
-            attributes=attrs,
+            attributes=_with_error(attrs, error_type),
         )
         if self.include_messages_counters:
-            counter_attrs = copy(attrs)
-            counter_attrs.pop(ERROR_TYPE, None)
             self.process_counter.add(
                 amount=msg_count,
-                attributes=counter_attrs,
+                attributes=attrs,
             )
 
 
@@ -168,11 +224,13 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         ],
         metrics_container: _MetricsContainer,
         context: "ContextRepo",
+        include_traces: bool = True,
     ) -> None:
         super().__init__(msg, context=context)
 
         self._tracer = tracer
         self._metrics = metrics_container
+        self._include_traces = include_traces
         self._current_span: Span | None = None
         self._origin_context: Context | None = None
         self._scope_tokens: list[tuple[str, Token[Any]]] = []
@@ -187,22 +245,34 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
             return await call_next(msg)
 
         headers = msg.headers
-        current_context = context.get_current()
         destination_name = provider.get_publish_destination_name(msg)
 
         current_baggage: Baggage | None = self.context.get_local("baggage")
         if current_baggage:
             headers.update(current_baggage.to_headers())
 
-        trace_attributes = provider.get_publish_attrs_from_cmd(msg)
-        metrics_attributes = {
-            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
-            SpanAttributes.MESSAGING_DESTINATION_NAME: destination_name,
-        }
+        metrics_attributes = self._metrics.get_attributes(
+            provider.messaging_system,
+            SpanAttributes.MESSAGING_DESTINATION_NAME,
+            destination_name,
+        )
+
+        msg_count = len(msg.batch_bodies)
+
+        if not self._include_traces:
+            return await _call_observed(
+                call_next,
+                msg,
+                self._metrics.observe_publish,
+                metrics_attributes,
+                msg_count,
+            )
+
+        current_context = context.get_current()
+        trace_attributes: dict[str, Any] | None = None
 
         # NOTE: if batch with single message?
-        if (msg_count := len(msg.batch_bodies)) > 1:
-            trace_attributes[SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT] = msg_count
+        if msg_count > 1:
             current_context = _BAGGAGE_PROPAGATOR.extract(headers, current_context)
             _BAGGAGE_PROPAGATOR.inject(
                 headers,
@@ -216,39 +286,55 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
             )
             _TRACE_PROPAGATOR.inject(headers, context=self._origin_context)
 
+        elif trace.get_current_span(current_context).get_span_context().is_valid:
+            # the caller span is the message creation context already
+            _TRACE_PROPAGATOR.inject(headers, context=current_context)
+
         else:
             create_span = self._tracer.start_span(
                 name=_create_span_name(destination_name, MessageAction.CREATE),
                 kind=trace.SpanKind.PRODUCER,
-                attributes=trace_attributes,
+                attributes=metrics_attributes,
             )
+            if create_span.is_recording():
+                trace_attributes = _get_publish_attrs(provider, msg)
+                create_span.set_attributes(trace_attributes)
             current_context = trace.set_span_in_context(create_span)
             _TRACE_PROPAGATOR.inject(headers, context=current_context)
             create_span.end()
 
         start_time = time.perf_counter()
+        error_type = None
 
         try:
             with self._tracer.start_as_current_span(
                 name=_create_span_name(destination_name, MessageAction.PUBLISH),
                 kind=trace.SpanKind.PRODUCER,
-                attributes=trace_attributes,
                 context=current_context,
-            ) as span:
-                span.set_attribute(
-                    SpanAttributes.MESSAGING_OPERATION,
+                attributes=self._metrics.get_span_attributes(
+                    provider.messaging_system,
+                    SpanAttributes.MESSAGING_DESTINATION_NAME,
+                    destination_name,
                     MessageAction.PUBLISH,
-                )
+                ),
+            ) as span:
+                if span.is_recording():
+                    # per-message attributes are built for sampled spans only
+                    span.set_attributes(
+                        trace_attributes or _get_publish_attrs(provider, msg),
+                    )
                 msg.headers = headers
                 result = await call_next(msg)
 
         except Exception as e:
-            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            error_type = type(e).__name__
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-            self._metrics.observe_publish(metrics_attributes, duration, msg_count)
+            self._metrics.observe_publish(
+                metrics_attributes, duration, msg_count, error_type
+            )
 
         for key, token in self._scope_tokens:
             self.context.reset_local(key, token)
@@ -263,6 +349,31 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         if (provider := self.__settings_provider) is None:
             return await call_next(msg)
 
+        destination_name = provider.get_consume_destination_name(msg)
+        metrics_attributes = self._metrics.get_attributes(
+            provider.messaging_system,
+            MESSAGING_DESTINATION_PUBLISH_NAME,
+            destination_name,
+        )
+        msg_count = len(msg.batch_headers) or 1
+
+        if not self._include_traces:
+            self._scope_tokens.append((
+                "span",
+                self.context.set_local("span", trace.INVALID_SPAN),
+            ))
+            self._scope_tokens.append((
+                "baggage",
+                self.context.set_local("baggage", Baggage.from_msg(msg)),
+            ))
+            return await _call_observed(
+                call_next,
+                msg,
+                self._metrics.observe_consume,
+                metrics_attributes,
+                msg_count,
+            )
+
         if _is_batch_message(msg):
             links = _get_msg_links(msg)
             current_context = Context()
@@ -270,38 +381,43 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
             links = None
             current_context = _TRACE_PROPAGATOR.extract(msg.headers)
 
-        destination_name = provider.get_consume_destination_name(msg)
-        trace_attributes = provider.get_consume_attrs_from_message(msg)
-        metrics_attributes = {
-            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
-            MESSAGING_DESTINATION_PUBLISH_NAME: destination_name,
-        }
+        trace_attributes: dict[str, Any] | None = None
 
         if not len(current_context):
             create_span = self._tracer.start_span(
                 name=_create_span_name(destination_name, MessageAction.CREATE),
                 kind=trace.SpanKind.CONSUMER,
-                attributes=trace_attributes,
                 links=links,
+                attributes=metrics_attributes,
             )
+            if create_span.is_recording():
+                trace_attributes = provider.get_consume_attrs_from_message(msg)
+                create_span.set_attributes(trace_attributes)
             current_context = trace.set_span_in_context(create_span)
             create_span.end()
 
         self._origin_context = current_context
         start_time = time.perf_counter()
+        error_type = None
 
         try:
             with self._tracer.start_as_current_span(
                 name=_create_span_name(destination_name, MessageAction.PROCESS),
                 kind=trace.SpanKind.CONSUMER,
                 context=current_context,
-                attributes=trace_attributes,
                 end_on_exit=False,
-            ) as span:
-                span.set_attribute(
-                    SpanAttributes.MESSAGING_OPERATION,
+                attributes=self._metrics.get_span_attributes(
+                    provider.messaging_system,
+                    MESSAGING_DESTINATION_PUBLISH_NAME,
+                    destination_name,
                     MessageAction.PROCESS,
-                )
+                ),
+            ) as span:
+                if span.is_recording():
+                    # per-message attributes are built for sampled spans only
+                    span.set_attributes(
+                        trace_attributes or provider.get_consume_attrs_from_message(msg),
+                    )
                 self._current_span = span
 
                 self._scope_tokens.append((
@@ -321,16 +437,14 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
                 context.detach(token)
 
         except Exception as e:
-            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            error_type = type(e).__name__
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-            msg_count = trace_attributes.get(
-                SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT,
-                1,
+            self._metrics.observe_consume(
+                metrics_attributes, duration, msg_count, error_type
             )
-            self._metrics.observe_consume(metrics_attributes, duration, msg_count)
 
         return result
 
@@ -367,6 +481,40 @@ def _get_tracer(tracer_provider: Optional["TracerProvider"] = None) -> "Tracer":
     )
 
 
+def _with_error(attrs: dict[str, Any], error_type: str | None) -> dict[str, Any]:
+    if error_type is None:
+        return attrs
+    return {**attrs, ERROR_TYPE: error_type}
+
+
+async def _call_observed(
+    call_next: "AsyncFunc",
+    msg: Any,
+    observe: Callable[[dict[str, Any], float, int, str | None], None],
+    attrs: dict[str, Any],
+    msg_count: int,
+) -> Any:
+    start_time = time.perf_counter()
+    error_type = None
+    try:
+        return await call_next(msg)
+    except Exception as e:
+        error_type = type(e).__name__
+        raise
+    finally:
+        observe(attrs, time.perf_counter() - start_time, msg_count, error_type)
+
+
+def _get_publish_attrs(
+    provider: "TelemetrySettingsProvider[Any, Any]",
+    msg: Any,
+) -> dict[str, Any]:
+    attrs = provider.get_publish_attrs_from_cmd(msg)
+    if (msg_count := len(msg.batch_bodies)) > 1:
+        attrs[SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT] = msg_count
+    return attrs
+
+
 def _create_span_name(destination: str, action: str) -> str:
     return f"{destination} {action}"
 
@@ -1,16 +1,50 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
 from .container import MetricsContainer
 from .types import ProcessingStatus, PublishingStatus
 
+if TYPE_CHECKING:
+    from prometheus_client.metrics import MetricWrapperBase
+
 
 class MetricsManager:
-    __slots__ = ("_app_name", "_container")
+    """Updates FastStream metrics.
+
+    Bound label children are cached, so regular messages don't pay for
+    `metric.labels(...)` lookup. The cache is bounded by `cache_size` to
+    not grow forever with dynamic custom labels.
+    """
+
+    __slots__ = ("_app_name", "_cache_size", "_children", "_container")
 
     def __init__(
-        self, container: MetricsContainer, *, app_name: str = "faststream"
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str = "faststream",
+        cache_size: int = 1024,
     ) -> None:
         self._container = container
         self._app_name = app_name
 
+        self._cache_size = cache_size
+        self._children: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+
+    def _labels(self, metric: "MetricWrapperBase", **labels: str) -> Any:
+        # labels are always passed in the same order for the same metric
+        key = (metric, *labels.values())
+
+        children = self._children
+        if (child := children.get(key)) is None:
+            child = children[key] = metric.labels(app_name=self._app_name, **labels)
+            if len(children) > self._cache_size:
+                children.popitem(last=False)
+        else:
+            children.move_to_end(key)
+
+        return child
+
     def add_received_message(
         self,
         broker: str,
@@ -18,8 +52,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_total.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_messages_total,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -32,8 +66,8 @@ class MetricsManager:
         size: int,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_size_bytes.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_messages_size_bytes,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -46,8 +80,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_messages_in_process,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -60,8 +94,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_messages_in_process,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -75,8 +109,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_total.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_processed_messages_total,
             broker=broker,
             handler=handler,
             status=status.value,
@@ -90,8 +124,8 @@ class MetricsManager:
         handler: str,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_duration_seconds.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_processed_messages_duration_seconds,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -104,8 +138,8 @@ class MetricsManager:
         exception_type: str,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_exceptions_total.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.received_processed_messages_exceptions_total,
             broker=broker,
             handler=handler,
             exception_type=exception_type,
@@ -120,8 +154,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_total.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.published_messages_total,
             broker=broker,
             destination=destination,
             status=status.value,
@@ -135,8 +169,8 @@ class MetricsManager:
         destination: str,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_duration_seconds.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.published_messages_duration_seconds,
             broker=broker,
             destination=destination,
             **custom_labels,
@@ -149,8 +183,8 @@ class MetricsManager:
         exception_type: str,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_exceptions_total.labels(
-            app_name=self._app_name,
+        self._labels(
+            self._container.published_messages_exceptions_total,
             broker=broker,
             destination=destination,
             exception_type=exception_type,
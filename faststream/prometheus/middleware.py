@@ -77,13 +77,20 @@ class PrometheusMiddleware(Generic[PublishCommandType, AnyMsg]):
         *,
         context: "ContextRepo",
     ) -> "BasePrometheusMiddleware[PublishCommandType]":
+        custom_labels = self._static_labels
+        if self._dynamic_labels:
+            # new dict, static labels are shared between all messages
+            custom_labels = {
+                **custom_labels,
+                **{k: v(msg) for k, v in self._dynamic_labels.items()},
+            }
+
         return BasePrometheusMiddleware[PublishCommandType](
             msg,
             metrics_manager=self._metrics_manager,
             settings_provider_factory=self._settings_provider_factory,
             context=context,
-            custom_labels=self._static_labels
-            | {k: v(msg) for k, v in self._dynamic_labels.items()},
+            custom_labels=custom_labels,
         )
 
 
@@ -1,4 +1,4 @@
-from faststream._internal.testing.app import TestApp
+from typing import TYPE_CHECKING, Any
 
 try:
     from .annotations import RabbitMessage
@@ -11,7 +11,6 @@ try:
         RabbitExchange,
         RabbitQueue,
     )
-    from .testing import TestRabbitBroker
 
 except ImportError as e:
     if "'aio_pika'" not in e.msg:
@@ -21,6 +20,11 @@ except ImportError as e:
 
     raise ImportError(INSTALL_FASTSTREAM_RABBIT) from e
 
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
+
+    from .testing import TestRabbitBroker
+
 __all__ = (
     "Channel",
     "ExchangeType",
@@ -37,3 +41,19 @@ __all__ = (
     "TestApp",
     "TestRabbitBroker",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # test clients are not required to run the application
+    if name == "TestRabbitBroker":
+        from .testing import TestRabbitBroker
+
+        return TestRabbitBroker
+
+    if name == "TestApp":
+        from faststream._internal.testing.app import TestApp
+
+        return TestApp
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -62,6 +62,7 @@ if TYPE_CHECKING:
     )
     from faststream.rabbit.helpers import RabbitDeclarer
     from faststream.rabbit.message import RabbitMessage
+    from faststream.rabbit.subscriber import RabbitSubscriber
     from faststream.rabbit.types import AioPikaSendableMessage
     from faststream.rabbit.utils import RabbitClientProperties
     from faststream.security import BaseSecurity
@@ -87,9 +88,11 @@ class RabbitBroker(
         fail_fast: bool = True,
         reconnect_interval: "TimeoutType" = 5.0,
         default_channel: Optional["Channel"] = None,
+        publisher_channels: int = 1,
         app_id: str | None = SERVICE_NAME,
         # broker base args
         graceful_timeout: float | None = None,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -124,8 +127,12 @@ class RabbitBroker(
             fail_fast: Broker startup raises `AMQPConnectionError` if RabbitMQ is unreachable.
             reconnect_interval: Time to sleep between reconnection attempts.
             default_channel: Default channel settings to use.
+            publisher_channels: Number of channels to publish messages through in round-robin.
+                Publisher confirms of different channels are awaited concurrently.
             app_id: Application name to mark outgoing messages by.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency: Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder: Custom decoder object.
             parser: Custom parser object.
             dependencies: Dependencies to apply to all broker subscribers.
@@ -166,6 +173,7 @@ class RabbitBroker(
         if protocol is None:
             protocol = built_asyncapi_url.scheme
 
+        default_channel = default_channel or Channel()
         cm = ChannelManagerImpl(default_channel)
         declarer = RabbitDeclarerImpl(cm)
 
@@ -173,6 +181,14 @@ class RabbitBroker(
             declarer=declarer,
             decoder=decoder,
             parser=parser,
+            channel_manager=cm,
+            channels=[
+                Channel(
+                    publisher_confirms=default_channel.publisher_confirms,
+                    on_return_raises=default_channel.on_return_raises,
+                )
+                for _ in range(publisher_channels - 1)
+            ],
         )
 
         super().__init__(
@@ -207,6 +223,7 @@ class RabbitBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                startup_concurrency=startup_concurrency,
                 extra_context={
                     "broker": self,
                 },
@@ -244,6 +261,9 @@ class RabbitBroker(
     ) -> None:
         await super().stop(exc_type, exc_val, exc_tb)
 
+        # cancel RPC consumer while the channel is still open
+        await self.config.disconnect()
+
         if self._channel is not None:
             if not self._channel.is_closed:
                 await self._channel.close()
@@ -254,8 +274,6 @@ class RabbitBroker(
             await self._connection.close()
             self._connection = None
 
-        self.config.disconnect()
-
     @deprecated(
         "Deprecated in **FastStream 0.5.44**. "
         "Please, use `stop` method instead. "
@@ -275,6 +293,14 @@ class RabbitBroker(
         """Connect broker to RabbitMQ and startup all subscribers."""
         await self.connect()
         await self.declare_queue(RABBIT_REPLY)
+
+        # subscribers are started concurrently, so declare their exchanges
+        # at first to bind queues without racing declarations
+        declarer = self.config.declarer
+        for sub in cast("list[RabbitSubscriber]", self.subscribers):
+            if sub.exchange is not None and sub.exchange.name and sub.queue.declare:
+                await declarer.declare_exchange(sub.exchange, channel=sub.channel)
+
         await super().start()
 
     @override
@@ -382,6 +408,99 @@ class RabbitBroker(
         )
         return result
 
+    async def publish_batch(  # type: ignore[override]
+        self,
+        *messages: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        """Publish multiple messages at once.
+
+        All messages are sent through a single channel before waiting for any
+        publisher confirm, so the whole batch costs about one confirm round-trip
+        and keeps the messages order.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            queue:
+                Message routing key to publish with.
+            exchange:
+                Target exchange to publish messages to.
+            routing_key:
+                Message routing key to publish with. Overrides `queue` option if presented.
+            mandatory:
+                Client waits for confirmation that the message is placed to some queue. RabbitMQ returns message to client if there is no suitable queue.
+            immediate:
+                Client expects that there is consumer ready to take the message to work. RabbitMQ returns message to client if there is no suitable consumer.
+            timeout:
+                Send confirmation time from RabbitMQ.
+            persist:
+                Restore the message on RabbitMQ reboot.
+            reply_to:
+                Reply message routing key to send with (always sending to default exchange).
+            correlation_id:
+                Manual message **correlation_id** setter. **correlation_id** is a useful option to trace messages.
+            headers:
+                Message headers to store metainformation.
+            content_type:
+                Message **content-type** header. Used by application, not core RabbitMQ. Will be set automatically if not specified.
+            content_encoding:
+                Message body content encoding, e.g. **gzip**.
+            expiration:
+                Message expiration (lifetime) in seconds (or datetime or timedelta).
+            message_type:
+                Application-specific message type, e.g. **orders.created**.
+            user_id:
+                Publisher connection User ID, validated if set.
+            priority:
+                The message priority (0 by default).
+
+        Returns:
+            A list of confirmation frames in the order of the sent messages.
+        """
+        cmd = RabbitPublishCommand(
+            *messages,
+            routing_key=routing_key or RabbitQueue.validate(queue).routing(),
+            exchange=RabbitExchange.validate(exchange),
+            correlation_id=correlation_id or gen_cor_id(),
+            app_id=self.config.app_id,
+            mandatory=mandatory,
+            immediate=immediate,
+            persist=persist,
+            reply_to=reply_to,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            expiration=expiration,
+            message_type=message_type,
+            user_id=user_id,
+            timeout=timeout,
+            priority=priority,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[
+            aiormq.abc.ConfirmationFrameType | None
+        ] = await self._basic_publish_batch(cmd, producer=self._producer)
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
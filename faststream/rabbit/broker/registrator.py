@@ -43,6 +43,9 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
         *,
         channel: Optional["Channel"] = None,
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout_ms: int = 200,
         no_ack: Annotated[
             bool,
             deprecated(
@@ -76,6 +79,9 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             exchange (Union[str, RabbitExchange, None], optional): RabbitMQ exchange to bind queue to. Uses default exchange if not presented. **FastStream** declares exchange object automatically by default.
             channel (Optional[Channel], optional): Channel to use for consuming messages.
             consume_args (dict[str, Any] | None, optional): Extra consumer arguments to use in `queue.consume(...)` method.
+            batch (bool, optional): Whether to consume messages in batches or not. Batch subscriber always gets its own channel.
+            max_records (int, optional): Number of messages to consume as one batch.
+            batch_timeout_ms (int, optional): Milliseconds to wait for `max_records` messages before processing a smaller batch.
             no_ack (bool, optional): Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy (AckPolicy, optional): Acknowledgement policy for message processing.
             dependencies (Iterable[Dependant], optional): Dependencies list (`[Dependant(),]`) to apply to the subscriber.
@@ -97,6 +103,9 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             consume_args=consume_args,
             channel=channel,
             # subscriber args
+            batch=batch,
+            max_records=max_records,
+            batch_timeout_ms=batch_timeout_ms,
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
@@ -162,6 +162,9 @@ class RabbitRoute(SubscriberRoute):
         *,
         publishers: Iterable[RabbitPublisher] = (),
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout_ms: int = 200,
         # broker arguments
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -204,6 +207,12 @@ class RabbitRoute(SubscriberRoute):
                 RabbitMQ publishers to broadcast the handler result.
             consume_args:
                 Extra consumer arguments to use in `queue.consume(...)` method.
+            batch:
+                Whether to consume messages in batches or not.
+            max_records:
+                Number of messages to consume as one batch.
+            batch_timeout_ms:
+                Milliseconds to wait for `max_records` messages before processing a smaller batch.
             dependencies:
                 Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser:
@@ -233,6 +242,9 @@ class RabbitRoute(SubscriberRoute):
             queue=queue,
             exchange=exchange,
             consume_args=consume_args,
+            batch=batch,
+            max_records=max_records,
+            batch_timeout_ms=batch_timeout_ms,
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
@@ -29,7 +29,7 @@ class RabbitBrokerConfig(BrokerConfig):
         self.channel_manager.connect(connection)
         self.producer.connect(serializer=self.fd_config._serializer)
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
+        await self.producer.disconnect()
         self.channel_manager.disconnect()
         self.declarer.disconnect()
-        self.producer.disconnect()
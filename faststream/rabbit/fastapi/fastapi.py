@@ -70,8 +70,10 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
         fail_fast: bool = True,
         reconnect_interval: "TimeoutType" = 5.0,
         default_channel: Optional["Channel"] = None,
+        publisher_channels: int = 1,
         app_id: str | None = SERVICE_NAME,
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
@@ -141,10 +143,15 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 Time to sleep between reconnection attempts.
             default_channel:
                 The default channel for the broker.
+            publisher_channels:
+                Number of channels to publish messages through in round-robin.
             app_id:
                 Application name to mark outgoing messages by.
             graceful_timeout:
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency:
+                Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
             decoder:
                 Custom decoder object.
             parser:
@@ -294,9 +301,11 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             reconnect_interval=reconnect_interval,
             app_id=app_id,
             graceful_timeout=graceful_timeout,
+            startup_concurrency=startup_concurrency,
             decoder=decoder,
             parser=parser,
             default_channel=default_channel,
+            publisher_channels=publisher_channels,
             middlewares=middlewares,
             security=security,
             specification_url=specification_url,
@@ -338,6 +347,9 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
         *,
         channel: Optional["Channel"] = None,
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout_ms: int = 200,
         # broker arguments
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -378,6 +390,9 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 exchange=exchange,
                 consume_args=consume_args,
                 channel=channel,
+                batch=batch,
+                max_records=max_records,
+                batch_timeout_ms=batch_timeout_ms,
                 dependencies=dependencies,
                 parser=parser,
                 decoder=decoder,
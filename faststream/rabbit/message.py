@@ -10,6 +10,8 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
     or nack-ing RabbitMQ messages.
     """
 
+    __slots__ = ()
+
     async def ack(
         self,
         multiple: bool = False,
@@ -43,3 +45,44 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
         if pika_message.locked:
             return
         await pika_message.reject(requeue=requeue)
+
+
+class RabbitBatchMessage(StreamMessage[tuple[IncomingMessage, ...]]):
+    """A message class for working with batches of RabbitMQ messages.
+
+    The whole batch is settled by a single frame with the `multiple` flag,
+    so all batch messages should be consumed from the same channel.
+    """
+
+    __slots__ = ()
+
+    async def ack(self) -> None:
+        """Acknowledge all batch messages."""
+        pika_message = self.raw_message[-1]
+        await super().ack()
+        if pika_message.locked:
+            return
+        await pika_message.ack(multiple=True)
+
+    async def nack(
+        self,
+        requeue: bool = True,
+    ) -> None:
+        """Negative Acknowledgment of all batch messages."""
+        pika_message = self.raw_message[-1]
+        await super().nack()
+        if pika_message.locked:
+            return
+        await pika_message.nack(multiple=True, requeue=requeue)
+
+    async def reject(
+        self,
+        requeue: bool = False,
+    ) -> None:
+        """Reject all batch messages."""
+        pika_message = self.raw_message[-1]
+        await super().reject()
+        if pika_message.locked:
+            return
+        # basic.reject has no `multiple` flag
+        await pika_message.nack(multiple=True, requeue=requeue)
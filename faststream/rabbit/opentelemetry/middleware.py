@@ -2,7 +2,9 @@ from opentelemetry.metrics import Meter, MeterProvider
 from opentelemetry.trace import TracerProvider
 
 from faststream.opentelemetry.middleware import TelemetryMiddleware
-from faststream.rabbit.opentelemetry.provider import RabbitTelemetrySettingsProvider
+from faststream.rabbit.opentelemetry.provider import (
+    telemetry_attributes_provider_factory,
+)
 from faststream.rabbit.response import RabbitPublishCommand
 
 
@@ -14,11 +16,13 @@ class RabbitTelemetryMiddleware(TelemetryMiddleware[RabbitPublishCommand]):
         meter_provider: MeterProvider | None = None,
         meter: Meter | None = None,
         include_messages_counters: bool = False,
+        include_traces: bool = True,
     ) -> None:
         super().__init__(
-            settings_provider_factory=lambda _: RabbitTelemetrySettingsProvider(),
+            settings_provider_factory=telemetry_attributes_provider_factory,
             tracer_provider=tracer_provider,
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=include_messages_counters,
+            include_traces=include_traces,
         )
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Union
 
 from opentelemetry.semconv.trace import SpanAttributes
 
@@ -58,3 +59,39 @@ class RabbitTelemetrySettingsProvider(
         cmd: "RabbitPublishCommand",
     ) -> str:
         return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+
+
+class BatchRabbitTelemetrySettingsProvider(RabbitTelemetrySettingsProvider):
+    def get_consume_attrs_from_message(  # type: ignore[override]
+        self,
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
+    ) -> dict[str, Any]:
+        raw_message = msg.raw_message[0]
+
+        return {
+            SpanAttributes.MESSAGING_SYSTEM: self.messaging_system,
+            SpanAttributes.MESSAGING_MESSAGE_ID: msg.message_id,
+            SpanAttributes.MESSAGING_MESSAGE_CONVERSATION_ID: msg.correlation_id,
+            SpanAttributes.MESSAGING_MESSAGE_PAYLOAD_SIZE_BYTES: sum(
+                len(m.body) for m in msg.raw_message
+            ),
+            SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT: len(msg.raw_message),
+            SpanAttributes.MESSAGING_RABBITMQ_DESTINATION_ROUTING_KEY: raw_message.routing_key,
+            MESSAGING_DESTINATION_PUBLISH_NAME: raw_message.exchange,
+        }
+
+    def get_consume_destination_name(  # type: ignore[override]
+        self,
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
+    ) -> str:
+        raw_message = msg.raw_message[0]
+        exchange = raw_message.exchange or "default"
+        return f"{exchange}.{raw_message.routing_key}"
+
+
+def telemetry_attributes_provider_factory(
+    msg: Union["IncomingMessage", Sequence["IncomingMessage"], None],
+) -> RabbitTelemetrySettingsProvider:
+    if isinstance(msg, Sequence):
+        return BatchRabbitTelemetrySettingsProvider()
+    return RabbitTelemetrySettingsProvider()
@@ -1,16 +1,17 @@
 import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from aio_pika import Message
 from aio_pika.abc import DeliveryMode
 
 from faststream.message import (
     StreamMessage,
+    decode_batch_message,
     decode_message,
     encode_message,
     gen_cor_id,
 )
-from faststream.rabbit.message import RabbitMessage
+from faststream.rabbit.message import RabbitBatchMessage, RabbitMessage
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -34,24 +35,22 @@ class AioPikaParser:
         message: "IncomingMessage",
     ) -> StreamMessage["IncomingMessage"]:
         """Parses an incoming message and returns a RabbitMessage object."""
-        if (path_re := self.pattern) and (
-            match := path_re.match(message.routing_key or "")
-        ):
-            path = match.groupdict()
-        else:
-            path = {}
-
         return RabbitMessage(
             body=message.body,
             headers=message.headers,
             reply_to=message.reply_to or "",
             content_type=message.content_type,
-            message_id=message.message_id or gen_cor_id(),
-            correlation_id=message.correlation_id or gen_cor_id(),
-            path=path,
+            message_id=message.message_id,
+            correlation_id=message.correlation_id,
+            path=self.get_path(message.routing_key),
             raw_message=message,
         )
 
+    def get_path(self, routing_key: str | None) -> dict[str, str]:
+        if (path_re := self.pattern) and (match := path_re.match(routing_key or "")):
+            return match.groupdict()
+        return {}
+
     async def decode_message(
         self,
         msg: StreamMessage["IncomingMessage"],
@@ -103,3 +102,39 @@ class AioPikaParser:
             user_id=user_id,
             app_id=app_id,
         )
+
+
+class AioPikaBatchParser(AioPikaParser):
+    """A class for parsing and decoding batches of aio-pika messages."""
+
+    async def parse_message(  # type: ignore[override]
+        self,
+        message: tuple["IncomingMessage", ...],
+    ) -> StreamMessage[tuple["IncomingMessage", ...]]:
+        """Parses a batch of messages and returns a RabbitBatchMessage object."""
+        first = message[0]
+
+        body: list[Any] = []
+        batch_headers: list[dict[str, Any]] = []
+        for m in message:
+            body.append(m.body)
+            batch_headers.append({**m.headers, "content-type": m.content_type})
+
+        return RabbitBatchMessage(
+            body=body,
+            headers=first.headers,
+            batch_headers=batch_headers,
+            reply_to=first.reply_to or "",
+            content_type=first.content_type,
+            message_id=first.message_id,
+            correlation_id=first.correlation_id,
+            path=self.get_path(first.routing_key),
+            raw_message=message,
+        )
+
+    async def decode_message(  # type: ignore[override]
+        self,
+        msg: StreamMessage[tuple["IncomingMessage", ...]],
+    ) -> "DecodedMessage":
+        """Decode a batch of messages."""
+        return decode_batch_message(msg)
@@ -5,7 +5,7 @@ from aio_pika import IncomingMessage
 
 from faststream._internal.constants import EMPTY
 from faststream.prometheus.middleware import PrometheusMiddleware
-from faststream.rabbit.prometheus.provider import RabbitMetricsSettingsProvider
+from faststream.rabbit.prometheus.provider import settings_provider_factory
 from faststream.rabbit.response import RabbitPublishCommand
 
 if TYPE_CHECKING:
@@ -25,7 +25,7 @@ class RabbitPrometheusMiddleware(
         custom_labels: dict[str, str | Callable[[Any], str]] | None = None,
     ) -> None:
         super().__init__(
-            settings_provider_factory=lambda _: RabbitMetricsSettingsProvider(),
+            settings_provider_factory=settings_provider_factory,  # type: ignore[arg-type]
             registry=registry,
             app_name=app_name,
             metrics_prefix=metrics_prefix,
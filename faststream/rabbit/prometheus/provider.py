@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Union
 
 from faststream.prometheus import (
     ConsumeAttrs,
@@ -38,3 +39,27 @@ class RabbitMetricsSettingsProvider(
         cmd: RabbitPublishCommand,
     ) -> str:
         return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+
+
+class BatchRabbitMetricsSettingsProvider(RabbitMetricsSettingsProvider):
+    def get_consume_attrs_from_message(  # type: ignore[override]
+        self,
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
+    ) -> ConsumeAttrs:
+        raw_message = msg.raw_message[0]
+        exchange = raw_message.exchange or "default"
+        routing_key = raw_message.routing_key
+
+        return {
+            "destination_name": f"{exchange}.{routing_key}",
+            "message_size": sum(len(m.body) for m in msg.raw_message),
+            "messages_count": len(msg.raw_message),
+        }
+
+
+def settings_provider_factory(
+    msg: Union["IncomingMessage", Sequence["IncomingMessage"], None],
+) -> RabbitMetricsSettingsProvider:
+    if isinstance(msg, Sequence):
+        return BatchRabbitMetricsSettingsProvider()
+    return RabbitMetricsSettingsProvider()
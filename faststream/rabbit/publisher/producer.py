@@ -1,4 +1,7 @@
+import asyncio
 from abc import abstractmethod
+from contextlib import contextmanager
+from itertools import cycle
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -11,18 +14,19 @@ from typing_extensions import Unpack, override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException, IncorrectState
+from faststream.exceptions import IncorrectState
+from faststream.message import gen_cor_id
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RABBIT_REPLY, RabbitExchange
 
 if TYPE_CHECKING:
-    from types import TracebackType
+    from collections.abc import Iterator, Sequence
+    from contextlib import AbstractContextManager
 
     import aiormq
-    from aio_pika import IncomingMessage, RobustQueue
+    from aio_pika import IncomingMessage, RobustExchange, RobustQueue
     from aio_pika.abc import AbstractIncomingMessage, TimeoutType
-    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.types import (
@@ -30,36 +34,116 @@ if TYPE_CHECKING:
         CustomCallable,
     )
     from faststream.rabbit.helpers import RabbitDeclarer
+    from faststream.rabbit.helpers.channel_manager import ChannelManager
+    from faststream.rabbit.schemas import Channel
     from faststream.rabbit.types import AioPikaSendableMessage
 
     from .options import MessageOptions
 
 
-class LockState(Protocol):
-    @property
-    def lock(self) -> "anyio.Lock": ...
+class RPCState(Protocol):
+    async def start(self, queue: "RobustQueue") -> None: ...
 
+    def register(
+        self,
+        correlation_id: str,
+    ) -> "AbstractContextManager[asyncio.Future[IncomingMessage]]": ...
+
+    async def close(self) -> None: ...
 
-class LockUnset:
+
+class RPCUnset(RPCState):
     __slots__ = ()
 
-    @property
-    def lock(self) -> "anyio.Lock":
+    async def start(self, queue: "RobustQueue") -> None:
+        msg = "You should call `producer.connect()` method at first."
+        raise IncorrectState(msg)
+
+    def register(
+        self,
+        correlation_id: str,
+    ) -> "AbstractContextManager[asyncio.Future[IncomingMessage]]":
         msg = "You should call `producer.connect()` method at first."
         raise IncorrectState(msg)
 
+    async def close(self) -> None:
+        pass
+
 
-class RealLock:
-    __slots__ = ("lock",)
+class RPCResponsesRouter(RPCState):
+    """Routes Direct Reply-to responses to awaiting requests by correlation id.
+
+    Uses the only one persistent `amq.rabbitmq.reply-to` consumer per producer,
+    so any number of requests can be in flight at the same time.
+    Responses with unknown correlation id are dropped.
+    """
+
+    __slots__ = ("__futures", "__lock", "__queue", "consumer_tag")
 
     def __init__(self) -> None:
-        self.lock = anyio.Lock()
+        self.__lock = anyio.Lock()
+        self.__futures: dict[str, asyncio.Future[IncomingMessage]] = {}
+        self.__queue: RobustQueue | None = None
+        self.consumer_tag: str | None = None
+
+    async def start(self, queue: "RobustQueue") -> None:
+        if self.consumer_tag is not None:
+            return
+
+        async with self.__lock:
+            if self.consumer_tag is None:
+                self.consumer_tag = await queue.consume(
+                    callback=self.__on_response,
+                    no_ack=True,
+                )
+                self.__queue = queue
+
+    @contextmanager
+    def register(
+        self,
+        correlation_id: str,
+    ) -> "Iterator[asyncio.Future[IncomingMessage]]":
+        if correlation_id in self.__futures:
+            msg = f"Request with `correlation_id={correlation_id}` is already in flight."
+            raise IncorrectState(msg)
+
+        future: asyncio.Future[IncomingMessage] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.__futures[correlation_id] = future
+
+        try:
+            yield future
+        finally:
+            # remove the entry for timed out or cancelled requests as well
+            self.__futures.pop(correlation_id, None)
+
+    async def __on_response(self, message: "AbstractIncomingMessage") -> None:
+        future = self.__futures.get(message.correlation_id or "")
+
+        if future is not None and not future.done():
+            future.set_result(cast("IncomingMessage", message))
+
+    async def close(self) -> None:
+        for future in self.__futures.values():
+            if not future.done():
+                future.set_exception(IncorrectState("Producer was disconnected."))
+
+        self.__futures.clear()
+
+        if self.__queue is not None:
+            if self.consumer_tag is not None:  # pragma: no branch
+                if not self.__queue.channel.is_closed:
+                    await self.__queue.cancel(self.consumer_tag)
+                self.consumer_tag = None
+
+            self.__queue = None
 
 
 class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None: ...
 
-    def disconnect(self) -> None: ...
+    async def disconnect(self) -> None: ...
 
     @abstractmethod
     async def publish(
@@ -70,10 +154,11 @@ class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
     @abstractmethod
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage": ...
 
-    @override
-    async def publish_batch(self, cmd: "RabbitPublishCommand") -> None:
-        msg = "RabbitMQ doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]: ...
 
 
 class FakeAioPikaFastProducer(AioPikaFastProducer):
@@ -83,7 +168,7 @@ class FakeAioPikaFastProducer(AioPikaFastProducer):
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         raise NotImplementedError
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         raise NotImplementedError
 
     @override
@@ -97,9 +182,21 @@ class FakeAioPikaFastProducer(AioPikaFastProducer):
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
         raise NotImplementedError
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        raise NotImplementedError
+
 
 class AioPikaFastProducerImpl(AioPikaFastProducer):
-    """A class for fast producing messages using aio-pika."""
+    """A class for fast producing messages using aio-pika.
+
+    Messages are published in round-robin over the default channel and extra
+    `channels`, so publisher confirms of different channels do not queue up.
+    Requests always use the default channel, which owns the reply-to consumer.
+    """
 
     _decoder: "AsyncCallable"
     _parser: "AsyncCallable"
@@ -110,10 +207,20 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         declarer: "RabbitDeclarer",
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        channel_manager: Optional["ChannelManager"] = None,
+        channels: "Sequence[Channel]" = (),
     ) -> None:
         self.declarer = declarer
+        self.channel_manager = channel_manager
 
-        self.__lock: LockState = LockUnset()
+        # `None` stands for the broker default channel
+        self._channels = cycle((None, *channels))
+        self._exchanges: dict[
+            tuple[Channel | None, RabbitExchange],
+            RobustExchange,
+        ] = {}
+
+        self.__rpc: RPCState = RPCUnset()
         self.serializer: SerializerProto | None = None
 
         default_parser = AioPikaParser()
@@ -121,15 +228,17 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         self._decoder = ParserComposition(decoder, default_parser.decode_message)
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
-        """Lock initialization.
+        """RPC state initialization.
 
         Should be called in async context due `anyio.Lock` object can't be created outside event loop.
         """
         self.serializer = serializer
-        self.__lock = RealLock()
+        self.__rpc = RPCResponsesRouter()
 
-    def disconnect(self) -> None:
-        self.__lock = LockUnset()
+    async def disconnect(self) -> None:
+        rpc, self.__rpc = self.__rpc, RPCUnset()
+        await rpc.close()
+        self._exchanges.clear()
 
     @override
     async def publish(
@@ -138,6 +247,7 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
     ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
         return await self._publish(
             message=cmd.body,
+            channel=next(self._channels),
             exchange=cmd.exchange,
             routing_key=cmd.destination,
             reply_to=cmd.reply_to,
@@ -147,29 +257,60 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             **cmd.message_options,
         )
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        """Send all messages at first and await their confirms together.
+
+        The whole batch is published through a single channel to keep
+        messages order.
+        """
+        channel = next(self._channels)
+
+        publishes = (
+            self._publish(
+                message=body,
+                channel=channel,
+                exchange=cmd.exchange,
+                routing_key=cmd.destination,
+                reply_to=cmd.reply_to,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                **cmd.publish_options,
+                **cmd.message_options,
+            )
+            for body in cmd.batch_bodies
+        )
+        return await asyncio.gather(*publishes)
+
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
-        async with _RPCCallback(
-            self.__lock.lock,
-            await self.declarer.declare_queue(RABBIT_REPLY),
-        ) as response_queue:
-            with anyio.fail_after(cmd.timeout):
-                await self._publish(
-                    message=cmd.body,
-                    exchange=cmd.exchange,
-                    routing_key=cmd.destination,
-                    reply_to=RABBIT_REPLY.name,
-                    headers=cmd.headers,
-                    correlation_id=cmd.correlation_id,
-                    **cmd.publish_options,
-                    **cmd.message_options,
-                )
-                return await response_queue.receive()
+        rpc = self.__rpc
+        await rpc.start(await self.declarer.declare_queue(RABBIT_REPLY))
+
+        correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with rpc.register(correlation_id) as response, anyio.fail_after(cmd.timeout):
+            await self._publish(
+                message=cmd.body,
+                channel=None,  # owns the direct reply-to consumer
+                exchange=cmd.exchange,
+                routing_key=cmd.destination,
+                reply_to=RABBIT_REPLY.name,
+                headers=cmd.headers,
+                correlation_id=correlation_id,
+                **cmd.publish_options,
+                **cmd.message_options,
+            )
+            return await response
 
     async def _publish(
         self,
         message: "AioPikaSendableMessage",
         *,
+        channel: Optional["Channel"],
         exchange: "RabbitExchange",
         routing_key: str,
         mandatory: bool = True,
@@ -181,10 +322,8 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             message=message, serializer=self.serializer, **message_options
         )
 
-        exchange_obj = await self.declarer.declare_exchange(
-            exchange=exchange,
-            declare=False,
-        )
+        if (exchange_obj := self._exchanges.get((channel, exchange))) is None:
+            exchange_obj = await self._get_exchange(exchange, channel)
 
         return await exchange_obj.publish(
             message=message,
@@ -194,39 +333,28 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             timeout=timeout,
         )
 
-
-class _RPCCallback:
-    """A class provides an RPC lock."""
-
-    def __init__(self, lock: "anyio.Lock", callback_queue: "RobustQueue") -> None:
-        self.lock = lock
-        self.queue = callback_queue
-
-    async def __aenter__(self) -> "MemoryObjectReceiveStream[IncomingMessage]":
-        send_response_stream: MemoryObjectSendStream[AbstractIncomingMessage]
-        receive_response_stream: MemoryObjectReceiveStream[AbstractIncomingMessage]
-
-        (
-            send_response_stream,
-            receive_response_stream,
-        ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
-
-        self.consumer_tag = await self.queue.consume(
-            callback=send_response_stream.send,
-            no_ack=True,
+    async def _get_exchange(
+        self,
+        exchange: "RabbitExchange",
+        channel: Optional["Channel"],
+    ) -> "RobustExchange":
+        exchange_obj = await self.declarer.declare_exchange(
+            exchange=exchange,
+            declare=False,
         )
 
-        return cast(
-            "MemoryObjectReceiveStream[IncomingMessage]",
-            receive_response_stream,
-        )
+        if channel is not None:
+            assert self.channel_manager
+            channel_obj = await self.channel_manager.get_channel(channel)
+
+            if not exchange.name:
+                exchange_obj = channel_obj.default_exchange
+            else:
+                # exchange is already checked by the declarer
+                exchange_obj = cast(
+                    "RobustExchange",
+                    await channel_obj.get_exchange(exchange.name, ensure=False),
+                )
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None = None,
-        exc_val: BaseException | None = None,
-        exc_tb: Optional["TracebackType"] = None,
-    ) -> None:
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
+        self._exchanges[channel, exchange] = exchange_obj
+        return exchange_obj
@@ -1,21 +1,23 @@
 import warnings
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
 from faststream.exceptions import SetupError
+from faststream.rabbit.schemas import Channel
 
 from .config import (
     RabbitSubscriberConfig,
     RabbitSubscriberSpecificationConfig,
 )
 from .specification import RabbitSubscriberSpecification
-from .usecase import RabbitSubscriber
+from .usecase import RabbitBatchSubscriber, RabbitSubscriber
 
 if TYPE_CHECKING:
     from faststream.middlewares import AckPolicy
     from faststream.rabbit.configs import RabbitBrokerConfig
-    from faststream.rabbit.schemas import Channel, RabbitExchange, RabbitQueue
+    from faststream.rabbit.schemas import RabbitExchange, RabbitQueue
 
 
 def create_subscriber(
@@ -25,6 +27,9 @@ def create_subscriber(
     consume_args: dict[str, Any] | None,
     channel: Optional["Channel"],
     # Subscriber args
+    batch: bool,
+    max_records: int,
+    batch_timeout_ms: int,
     no_reply: bool,
     ack_policy: "AckPolicy",
     no_ack: bool,
@@ -35,7 +40,21 @@ def create_subscriber(
     description_: str | None,
     include_in_schema: bool,
 ) -> RabbitSubscriber:
-    _validate_input_for_misconfigure(ack_policy=ack_policy, no_ack=no_ack)
+    _validate_input_for_misconfigure(
+        ack_policy=ack_policy,
+        no_ack=no_ack,
+        max_records=max_records,
+    )
+
+    if batch:
+        # batch is acknowledged with `multiple` flag,
+        # so it can't share the channel with other subscribers
+        channel = (
+            Channel(prefetch_count=max_records * 2)
+            if channel is None
+            # channels are cached by identity, so the copy gets a private one
+            else replace(channel)
+        )
 
     subscriber_config = RabbitSubscriberConfig(
         no_reply=no_reply,
@@ -63,6 +82,15 @@ def create_subscriber(
         calls=calls,
     )
 
+    if batch:
+        return RabbitBatchSubscriber(
+            config=subscriber_config,
+            specification=specification,
+            calls=calls,
+            max_records=max_records,
+            batch_timeout_ms=batch_timeout_ms,
+        )
+
     return RabbitSubscriber(
         config=subscriber_config,
         specification=specification,
@@ -74,7 +102,12 @@ def _validate_input_for_misconfigure(
     *,
     ack_policy: "AckPolicy",
     no_ack: bool,
+    max_records: int,
 ) -> None:
+    if max_records < 1:
+        msg = "`max_records` should be a positive number."
+        raise SetupError(msg)
+
     if no_ack is not EMPTY:
         warnings.warn(
             "`no_ack` option was deprecated in prior to `ack_policy=AckPolicy.ACK_FIRST`. Scheduled to remove in 0.7.0",
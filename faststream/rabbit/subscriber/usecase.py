@@ -1,14 +1,15 @@
 import asyncio
 import contextlib
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber import SubscriberUsecase
+from faststream._internal.endpoint.subscriber.mixins import TasksMixin
 from faststream._internal.endpoint.utils import process_msg
-from faststream.rabbit.parser import AioPikaParser
+from faststream.rabbit.parser import AioPikaBatchParser, AioPikaParser
 from faststream.rabbit.publisher.fake import RabbitFakePublisher
 from faststream.rabbit.schemas import RabbitExchange
 from faststream.rabbit.schemas.constants import REPLY_TO_QUEUE_EXCHANGE_DELIMITER
@@ -23,7 +24,7 @@ if TYPE_CHECKING:
     )
     from faststream.message import StreamMessage
     from faststream.rabbit.configs import RabbitBrokerConfig
-    from faststream.rabbit.message import RabbitMessage
+    from faststream.rabbit.message import RabbitBatchMessage, RabbitMessage
     from faststream.rabbit.schemas import RabbitQueue
 
     from .config import RabbitSubscriberConfig
@@ -33,6 +34,7 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
     """A class to handle logic for RabbitMQ message consumption."""
 
     _outer_config: "RabbitBrokerConfig"
+    _parser_class: type[AioPikaParser] = AioPikaParser
 
     def __init__(
         self,
@@ -40,7 +42,7 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
         specification: "SubscriberSpecification[Any, Any]",
         calls: "CallsCollection[IncomingMessage]",
     ) -> None:
-        parser = AioPikaParser(pattern=config.queue.path_regex)
+        parser = self._parser_class(pattern=config.queue.path_regex)
         config.decoder = parser.decode_message
         config.parser = parser.parse_message
         super().__init__(
@@ -102,13 +104,18 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
         if self.calls:
             self._consumer_tag = await self._queue_obj.consume(
                 # NOTE: aio-pika expects AbstractIncomingMessage, not IncomingMessage
-                self.consume,  # type: ignore[arg-type]
+                self._get_consumer_callback(),  # type: ignore[arg-type]
                 no_ack=self.__no_ack,
                 arguments=self.consume_args,
             )
 
         self._post_start()
 
+    def _get_consumer_callback(
+        self,
+    ) -> Callable[["IncomingMessage"], Awaitable[Any]]:
+        return self.consume
+
     async def stop(self) -> None:
         await super().stop()
 
@@ -230,3 +237,113 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
             queue=self.queue,
             exchange=self.exchange,
         )
+
+
+class RabbitBatchSubscriber(TasksMixin, RabbitSubscriber):
+    """Consumes messages in batches up to `max_records` or `batch_timeout_ms`.
+
+    The batch is acknowledged by a single `basic.ack` with `multiple` flag,
+    so the subscriber should own its channel.
+    """
+
+    _parser_class = AioPikaBatchParser
+
+    def __init__(
+        self,
+        config: "RabbitSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[Any]",
+        *,
+        max_records: int,
+        batch_timeout_ms: int,
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_records = max_records
+        self.batch_timeout_ms = batch_timeout_ms
+
+        self._buffer: asyncio.Queue[IncomingMessage] = asyncio.Queue()
+
+    @override
+    async def start(self) -> None:
+        self._buffer = asyncio.Queue()
+        await super().start()
+
+        if self.calls:
+            self.add_task(self._consume_batches)
+
+    @override
+    def _get_consumer_callback(
+        self,
+    ) -> Callable[["IncomingMessage"], Awaitable[Any]]:
+        return self._put_msg
+
+    async def _put_msg(self, msg: "IncomingMessage") -> None:
+        self._buffer.put_nowait(msg)
+
+    async def _consume_batches(self) -> None:
+        timeout = self.batch_timeout_ms / 1000
+
+        while self.running:
+            batch = [await self._buffer.get()]
+
+            with anyio.move_on_after(timeout):
+                while len(batch) < self.max_records:
+                    batch.append(await self._buffer.get())
+
+            await self.consume(tuple(batch))  # type: ignore[arg-type]
+
+    @override
+    async def get_one(  # type: ignore[override]
+        self,
+        *,
+        timeout: float = 5.0,
+        no_ack: bool = True,
+    ) -> "RabbitBatchMessage | None":
+        assert self._queue_obj, "You should start subscriber at first."
+        assert not self.calls, (
+            "You can't use `get_one` method if subscriber has registered handlers."
+        )
+
+        sleep_interval = timeout / 10
+
+        raw_messages: list[IncomingMessage] = []
+        with (
+            contextlib.suppress(asyncio.exceptions.CancelledError),
+            anyio.move_on_after(timeout),
+        ):
+            while len(raw_messages) < self.max_records:
+                raw_message = await self._queue_obj.get(
+                    fail=False,
+                    no_ack=no_ack,
+                    timeout=timeout,
+                )
+
+                if raw_message is not None:
+                    raw_messages.append(raw_message)
+                elif raw_messages:
+                    break
+                else:
+                    await anyio.sleep(sleep_interval)
+
+        if not raw_messages:
+            return None
+
+        raw_batch = tuple(raw_messages)
+
+        context = self._outer_config.fd_config.context
+        async_parser, async_decoder = self._get_parser_and_decoder()
+
+        msg: RabbitBatchMessage = await process_msg(  # type: ignore[assignment]
+            msg=raw_batch,
+            middlewares=(m(raw_batch, context=context) for m in self._broker_middlewares),
+            parser=async_parser,
+            decoder=async_decoder,
+        )
+        return msg
+
+    @override
+    async def __aiter__(self) -> AsyncIterator["RabbitBatchMessage"]:  # type: ignore[override]
+        while True:
+            if (msg := await self.get_one(no_ack=False)) is not None:
+                yield msg
@@ -23,8 +23,11 @@ from faststream.rabbit.schemas import (
     RabbitExchange,
     RabbitQueue,
 )
+from faststream.rabbit.subscriber.usecase import RabbitBatchSubscriber
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from aio_pika.abc import DateType, HeadersType
     from fast_depends.library.serializer import SerializerProto
 
@@ -213,28 +216,54 @@ class FakeProducer(AioPikaFastProducer):
         cmd: "RabbitPublishCommand",
     ) -> None:
         """Publish a message to a RabbitMQ queue or exchange."""
-        incoming = build_message(
-            message=cmd.body,
-            exchange=cmd.exchange,
-            routing_key=cmd.destination,
-            correlation_id=cmd.correlation_id,
-            headers=cmd.headers,
-            reply_to=cmd.reply_to,
-            serializer=self.broker.config.fd_config._serializer,
-            **cmd.message_options,
-        )
+        await self._publish((cmd.body,), cmd)
+
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[None]:
+        """Publish messages to a RabbitMQ queue or exchange."""
+        await self._publish(cmd.batch_bodies, cmd)
+        return [None] * len(cmd.batch_bodies)
+
+    async def _publish(
+        self,
+        messages: "Sequence[AioPikaSendableMessage]",
+        cmd: "RabbitPublishCommand",
+    ) -> None:
+        incoming = [
+            build_message(
+                message=message,
+                exchange=cmd.exchange,
+                routing_key=cmd.destination,
+                correlation_id=cmd.correlation_id,
+                headers=cmd.headers,
+                reply_to=cmd.reply_to,
+                serializer=self.broker.config.fd_config._serializer,
+                **cmd.message_options,
+            )
+            for message in messages
+        ]
+        first = incoming[0]
 
         called = False
         for handler in self.broker.subscribers:  # pragma: no branch
             handler = cast("RabbitSubscriber", handler)
             if _is_handler_matches(
                 handler,
-                incoming.routing_key,
-                incoming.headers,
+                first.routing_key,
+                first.headers,
                 cmd.exchange,
             ):
                 called = True
-                await self._execute_handler(incoming, handler)
+
+                if isinstance(handler, RabbitBatchSubscriber):
+                    await handler.process_message(tuple(incoming))  # type: ignore[arg-type]
+
+                else:
+                    for m in incoming:
+                        await self._execute_handler(m, handler)
 
         if not called:
             raise SubscriberNotFound
@@ -1,4 +1,4 @@
-from faststream._internal.testing.app import TestApp
+from typing import TYPE_CHECKING, Any
 
 try:
     from .annotations import (
@@ -13,7 +13,6 @@ try:
     from .parser import BinaryMessageFormatV1, JSONMessageFormat
     from .response import RedisPublishCommand, RedisResponse
     from .schemas import ListSub, PubSub, StreamSub
-    from .testing import TestRedisBroker
 
 except ImportError as e:
     if "'redis'" not in e.msg:
@@ -23,6 +22,11 @@ except ImportError as e:
 
     raise ImportError(INSTALL_FASTSTREAM_REDIS) from e
 
+if TYPE_CHECKING:
+    from faststream._internal.testing.app import TestApp
+
+    from .testing import TestRedisBroker
+
 __all__ = (
     "BinaryMessageFormatV1",
     "JSONMessageFormat",
@@ -45,3 +49,19 @@ __all__ = (
     "TestApp",
     "TestRedisBroker",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # test clients are not required to run the application
+    if name == "TestRedisBroker":
+        from .testing import TestRedisBroker
+
+        return TestRedisBroker
+
+    if name == "TestApp":
+        from faststream._internal.testing.app import TestApp
+
+        return TestApp
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -37,6 +37,7 @@ from faststream.redis.parser import (
 from faststream.redis.publisher.producer import RedisFastProducer
 from faststream.redis.response import RedisPublishCommand
 from faststream.redis.security import parse_security
+from faststream.redis.subscriber.multiplexer import ReadMultiplexer
 from faststream.response.publish_type import PublishType
 from faststream.specification.schema import BrokerSpec
 
@@ -111,12 +112,15 @@ class RedisBroker(
         parser_class: type["BaseParser"] = DefaultParser,
         encoder_class: type["Encoder"] = Encoder,
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
+        multiplex_reads: bool = False,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
         routers: Iterable[RedisRegistrator] = (),
         message_format: type["MessageFormat"] = BinaryMessageFormatV1,
+        max_requests_in_flight: int | None = None,
         security: Optional["BaseSecurity"] = None,
         specification_url: str | None = None,
         protocol: str | None = None,
@@ -173,6 +177,12 @@ class RedisBroker(
                 The class to use for encoding messages. Defaults to Encoder.
             graceful_timeout:
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down. Defaults to 15.0.
+            startup_concurrency:
+                Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
+            multiplex_reads:
+                Whether to read all streams without a consumer group and all lists by shared
+                blocking `XREAD` and `BLPOP` calls instead of a connection per subscriber. Defaults to False.
             decoder:
                 Custom decoder object. Defaults to None.
             parser:
@@ -185,6 +195,8 @@ class RedisBroker(
                 Routers to apply to broker. Defaults to ().
             message_format:
                 What format to use when parsing messages. Defaults to BinaryMessageFormatV1.
+            max_requests_in_flight:
+                Maximum number of concurrent `request` calls waiting for responses. Unlimited by default.
             security:
                 Security options to connect broker and generate AsyncAPI server security information. Defaults to None.
             specification_url:
@@ -263,8 +275,10 @@ class RedisBroker(
                     decoder=decoder,
                     message_format=self.message_format,
                     serializer=serializer,
+                    max_requests_in_flight=max_requests_in_flight,
                 ),
                 message_format=self.message_format,
+                multiplexer=ReadMultiplexer() if multiplex_reads else None,
                 # both args
                 broker_middlewares=middlewares,
                 broker_parser=parser,
@@ -282,6 +296,7 @@ class RedisBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                startup_concurrency=startup_concurrency,
                 extra_context={
                     "broker": self,
                 },
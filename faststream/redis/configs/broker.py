@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from faststream._internal.configs import BrokerConfig
 from faststream.exceptions import IncorrectState
@@ -7,6 +7,7 @@ from faststream.exceptions import IncorrectState
 if TYPE_CHECKING:
     from faststream.redis.parser import MessageFormat
     from faststream.redis.publisher.producer import RedisFastProducer
+    from faststream.redis.subscriber.multiplexer import ReadMultiplexer
 
     from .state import ConnectionState
 
@@ -18,11 +19,17 @@ class RedisBrokerConfig(BrokerConfig):
 
     message_format: type["MessageFormat"]
 
+    multiplexer: Optional["ReadMultiplexer"] = None
+
     async def connect(self) -> None:
         self.producer.connect(self.fd_config._serializer)
         await self.connection.connect()
 
     async def disconnect(self) -> None:
+        if self.multiplexer is not None:
+            await self.multiplexer.close()
+
+        await self.producer.disconnect()
         await self.connection.disconnect()
 
 
@@ -99,6 +99,8 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         encoder_class: type["Encoder"] = Encoder,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        startup_concurrency: int = 1,
+        multiplex_reads: bool = False,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
@@ -192,6 +194,12 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 _ ...
             graceful_timeout:
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            startup_concurrency:
+                Maximum number of subscribers to start or stop at the same time.
+                Subscribers are started one by one by default.
+            multiplex_reads:
+                Whether to read all streams without a consumer group and all lists by shared
+                blocking `XREAD` and `BLPOP` calls instead of a connection per subscriber.
             decoder:
                 Custom decoder object.
             parser:
@@ -349,6 +357,8 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             connection_class=connection_class,
             encoder_class=encoder_class,
             graceful_timeout=graceful_timeout,
+            startup_concurrency=startup_concurrency,
+            multiplex_reads=multiplex_reads,
             decoder=decoder,
             parser=parser,
             middlewares=middlewares,
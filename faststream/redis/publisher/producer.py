@@ -1,4 +1,6 @@
-from contextlib import suppress
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
@@ -13,6 +15,7 @@ from faststream.redis.response import DestinationType, RedisPublishCommand
 
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
+    from redis.asyncio.client import PubSub, Redis
 
     from faststream._internal.types import CustomCallable
     from faststream.redis.configs import ConnectionState
@@ -32,9 +35,13 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         decoder: Optional["CustomCallable"],
         message_format: type["MessageFormat"],
         serializer: Optional["SerializerProto"],
+        max_requests_in_flight: int | None = None,
     ) -> None:
         self._connection = connection
 
+        self._max_requests_in_flight = max_requests_in_flight
+        self._inbox: RepliesInbox | None = None
+
         default = RedisPubSubParser(SimpleParserConfig(message_format))
         self._parser = ParserComposition(
             parser,
@@ -60,45 +67,25 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.client.pubsub()
-
-        try:
-            await psub.subscribe(reply_to)
-
-            msg = cmd.message_format.encode(
-                message=cmd.body,
-                reply_to=reply_to,
-                headers=cmd.headers,
-                correlation_id=cmd.correlation_id or "",
-                serializer=self.serializer,
+        if self._inbox is None:
+            self._inbox = RepliesInbox(
+                self._connection.client,
+                max_in_flight=self._max_requests_in_flight,
             )
 
-            await self.__publish(msg, cmd)
-
-            with anyio.fail_after(cmd.timeout) as scope:
-                # skip subscribe message
-                await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-                # get real response
-                response_msg = await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
+        with anyio.fail_after(cmd.timeout):
+            async with self._inbox.register() as (reply_to, response):
+                msg = cmd.message_format.encode(
+                    message=cmd.body,
+                    reply_to=reply_to,
+                    headers=cmd.headers,
+                    correlation_id=cmd.correlation_id or "",
+                    serializer=self.serializer,
                 )
 
-            if scope.cancel_called:
-                raise TimeoutError
+                await self.__publish(msg, cmd)
 
-            return response_msg
-
-        finally:
-            with suppress(Exception):
-                await psub.unsubscribe()
-                await psub.aclose()  # type: ignore[attr-defined]
+                return await response
 
     @override
     async def publish_batch(self, cmd: "RedisPublishCommand") -> int:
@@ -144,3 +131,121 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         self.serializer = serializer
+
+    async def disconnect(self) -> None:
+        if self._inbox is not None:
+            await self._inbox.close()
+            self._inbox = None
+
+
+class RepliesInbox:
+    """Long-lived reply channel shared by all producer requests.
+
+    Uses one pubsub connection with a single pattern subscription to
+    `<inbox prefix>.*` and routes each response to the awaiting request
+    by its unique reply channel.
+    """
+
+    def __init__(
+        self,
+        client: "Redis[bytes]",
+        *,
+        max_in_flight: int | None = None,
+    ) -> None:
+        self._client = client
+
+        self._nuid = NUID()
+        self.prefix = f"faststream.inbox.{str(self._nuid.next(), 'utf-8')}"
+
+        self._futures: dict[bytes, asyncio.Future[Any]] = {}
+
+        self._lock = anyio.Lock()
+        self._limiter = anyio.Semaphore(max_in_flight) if max_in_flight else None
+
+        self._subscription: PubSub | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def register(self) -> AsyncIterator[tuple[str, "asyncio.Future[Any]"]]:
+        """Reserve a reply channel and a future to wait for the response at."""
+        if self._limiter is None:
+            async with self.__register() as reply:
+                yield reply
+
+        else:
+            async with self._limiter, self.__register() as reply:
+                yield reply
+
+    @asynccontextmanager
+    async def __register(self) -> AsyncIterator[tuple[str, "asyncio.Future[Any]"]]:
+        await self.start()
+
+        reply_to = f"{self.prefix}.{str(self._nuid.next(), 'utf-8')}"
+        key = reply_to.encode()
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+
+        try:
+            yield reply_to, future
+        finally:
+            # remove the entry for timed out or cancelled requests as well
+            self._futures.pop(key, None)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        async with self._lock:
+            if self._task is not None:
+                return
+
+            self._subscription = psub = self._client.pubsub()
+            await psub.psubscribe(f"{self.prefix}.*")
+
+            # wait for subscription confirmation to not miss responses
+            while (
+                confirmation := await psub.get_message(timeout=None)
+            ) is None or confirmation["type"] != "psubscribe":
+                pass
+
+            self._task = asyncio.create_task(self._read_responses(psub))
+
+    async def _read_responses(self, psub: "PubSub") -> None:
+        while True:
+            try:
+                msg = await psub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=None,
+                )
+
+            except Exception:
+                # PubSub reconnects and resubscribes at the next call
+                await anyio.sleep(1.0)
+                continue
+
+            if (
+                msg is not None
+                and (future := self._futures.get(msg["channel"])) is not None
+                and not future.done()
+            ):
+                future.set_result(msg)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._subscription is not None:
+            with suppress(Exception):
+                await self._subscription.punsubscribe()
+                await self._subscription.aclose()  # type: ignore[attr-defined]
+            self._subscription = None
+
+        for future in self._futures.values():
+            if not future.done():
+                future.cancel()
+
+        self._futures.clear()
@@ -37,11 +37,21 @@ class StreamSub(NameRequired):
             Minimum idle time in milliseconds for a message to be eligible for claiming via XAUTOCLAIM.
             Messages that have been pending (unacknowledged) for at least this duration can be
             reclaimed by this consumer. Only applicable when using consumer groups.
+            Subscriber claims up to `max_records` messages at a time and reads new messages
+            when there is nothing to claim.
 
             https://redis.io/docs/latest/commands/xautoclaim/
+        ack_flush_interval:
+            Interval in milliseconds to accumulate acknowledged message ids and send them
+            with a single pipelined XACK per stream. Acknowledge each message immediately if `None`.
+            Only applicable when using consumer groups.
+        ack_batch_size:
+            Number of accumulated acknowledged message ids to send them before `ack_flush_interval` is passed.
     """
 
     __slots__ = (
+        "ack_batch_size",
+        "ack_flush_interval",
         "batch",
         "consumer",
         "group",
@@ -66,6 +76,8 @@ class StreamSub(NameRequired):
         maxlen: int | None = None,
         max_records: int | None = None,
         min_idle_time: int | None = None,
+        ack_flush_interval: int | None = None,
+        ack_batch_size: int = 100,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             msg = "You should specify `group` and `consumer` both"
@@ -108,6 +120,8 @@ class StreamSub(NameRequired):
         self.maxlen = maxlen
         self.max_records = max_records
         self.min_idle_time = min_idle_time
+        self.ack_flush_interval = ack_flush_interval
+        self.ack_batch_size = ack_batch_size
 
     def add_prefix(self, prefix: str) -> "StreamSub":
         new_stream = deepcopy(self)
@@ -0,0 +1,315 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from redis.asyncio.client import Redis
+
+
+class Inbox:
+    """Subscriber side of a multiplexed reader.
+
+    Holds at most one read result, so the reader doesn't fetch data for the
+    subscriber until it processes the previous one.
+    """
+
+    def __init__(self, key: str, *, max_records: int | None = None) -> None:
+        self.key = key
+        self.max_records = max_records
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+        self.reader: _Reader | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._queue.empty()
+
+    def put(self, data: Any) -> None:
+        self._queue.put_nowait(data)
+
+    def drain(self) -> Any | None:
+        if self._queue.empty():
+            return None
+        return self._queue.get_nowait()
+
+    async def get(self, timeout: float) -> Any | None:
+        """Wait for the next read result or return `None` after timeout."""
+        try:
+            data = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        if self.reader is not None:
+            self.reader.wakeup()
+
+        if isinstance(data, Exception):
+            raise data
+
+        return data
+
+
+class _Reader(ABC):
+    """Reads all registered keys by a single blocking command."""
+
+    def __init__(self, client: "Redis[bytes]") -> None:
+        self.client = client
+        self._inboxes: dict[str, list[Inbox]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    def add(self, inbox: Inbox) -> None:
+        inbox.reader = self
+        self._inboxes.setdefault(inbox.key, []).append(inbox)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def discard(self, inbox: Inbox) -> None:
+        if (inboxes := self._inboxes.get(inbox.key)) and inbox in inboxes:
+            inboxes.remove(inbox)
+
+            if not inboxes:
+                del self._inboxes[inbox.key]
+
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        self._wakeup.set()
+
+    async def close(self) -> None:
+        """Cancel the reading task and wait for it to finish."""
+        if (task := self._task) is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            self._task = None
+
+    def __bool__(self) -> bool:
+        return bool(self._inboxes)
+
+    async def _run(self) -> None:
+        while self._inboxes:
+            if not (keys := self._ready_keys()):
+                # wait for any subscriber to take its data
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            try:
+                await self._read(keys)
+
+            except Exception as e:
+                # subscribers log the error and retry later
+                for inboxes in tuple(self._inboxes.values()):
+                    for inbox in inboxes:
+                        if inbox.ready:
+                            inbox.put(e)
+
+    @abstractmethod
+    def _ready_keys(self) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _read(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+
+class _StreamsReader(_Reader):
+    """Reads streams by one `XREAD` call and delivers data to all their subscribers."""
+
+    def __init__(
+        self,
+        client: "Redis[bytes]",
+        *,
+        max_records: int | None,
+        polling_interval: int,
+    ) -> None:
+        super().__init__(client)
+        self.max_records = max_records
+        self.polling_interval = polling_interval
+        self._cursors: dict[str, str | bytes] = {}
+
+    def add_stream(self, inbox: Inbox, last_id: str) -> None:
+        self._cursors.setdefault(inbox.key, last_id)
+        self.add(inbox)
+
+    def discard(self, inbox: Inbox) -> None:
+        super().discard(inbox)
+        if inbox.key not in self._inboxes:
+            self._cursors.pop(inbox.key, None)
+
+    def _ready_keys(self) -> list[str]:
+        return [
+            key
+            for key, inboxes in self._inboxes.items()
+            if all(inbox.ready for inbox in inboxes)
+        ]
+
+    async def _read(self, keys: list[str]) -> None:
+        result = await self.client.xread(
+            {key: self._cursors[key] for key in keys},
+            block=self.polling_interval,
+            count=self.max_records,
+        )
+
+        for stream_name, msgs in result or ():
+            if not msgs:
+                continue
+
+            key = stream_name.decode()
+            if key not in self._inboxes:
+                continue
+
+            self._cursors[key] = msgs[-1][0]
+            for inbox in self._inboxes[key]:
+                inbox.put(((stream_name, msgs),))
+
+
+class _ListsReader(_Reader):
+    """Pops lists by one `BLPOP` call and delivers data to one of their subscribers."""
+
+    def __init__(self, client: "Redis[bytes]", *, polling_interval: float) -> None:
+        super().__init__(client)
+        self.polling_interval = polling_interval
+        self._delivery: asyncio.Task[None] | None = None
+
+    def _ready_keys(self) -> list[str]:
+        return [
+            key
+            for key, inboxes in self._inboxes.items()
+            if any(inbox.ready for inbox in inboxes)
+        ]
+
+    async def _read(self, keys: list[str]) -> None:
+        result = await self.client.blpop(keys, timeout=self.polling_interval)
+        if not result:
+            return
+
+        # popped message is delivered even if the reader is cancelled meanwhile
+        self._delivery = asyncio.create_task(self._deliver(*result))
+        await asyncio.shield(self._delivery)
+
+    async def close(self) -> None:
+        await super().close()
+
+        if (delivery := self._delivery) is not None:
+            with suppress(Exception):
+                await delivery
+            self._delivery = None
+
+    async def _deliver(self, list_name: bytes, value: bytes) -> None:
+        key = list_name.decode()
+
+        inbox = next(
+            (i for i in self._inboxes.get(key, ()) if i.ready),
+            None,
+        )
+
+        if inbox is None:
+            # subscriber was stopped while waiting for data
+            await self.client.lpush(key, value)
+            return
+
+        if inbox.max_records is None:
+            inbox.put(value)
+
+        else:
+            values = [value]
+            if inbox.max_records > 1 and (
+                rest := await self.client.lpop(key, count=inbox.max_records - 1)
+            ):
+                values.extend(rest)
+            inbox.put(values)
+
+
+class ReadMultiplexer:
+    """Shares blocking read connections between Redis subscribers.
+
+    Streams without a consumer group are read by a single `XREAD` call and
+    lists are popped by a single multi-key `BLPOP` call per unique polling
+    options, instead of holding a pool connection per subscriber.
+    """
+
+    def __init__(self) -> None:
+        self._readers: dict[Hashable, _Reader] = {}
+
+    def read_stream(
+        self,
+        client: "Redis[bytes]",
+        name: str,
+        *,
+        last_id: str,
+        max_records: int | None,
+        polling_interval: int,
+    ) -> Inbox:
+        key = ("stream", client, max_records, polling_interval)
+        if (reader := self._readers.get(key)) is None:
+            reader = self._readers[key] = _StreamsReader(
+                client,
+                max_records=max_records,
+                polling_interval=polling_interval,
+            )
+
+        assert isinstance(reader, _StreamsReader)
+
+        inbox = Inbox(name)
+        reader.add_stream(inbox, last_id)
+        return inbox
+
+    def read_list(
+        self,
+        client: "Redis[bytes]",
+        name: str,
+        *,
+        max_records: int | None,
+        polling_interval: float,
+    ) -> Inbox:
+        key = ("list", client, polling_interval)
+        if (reader := self._readers.get(key)) is None:
+            reader = self._readers[key] = _ListsReader(
+                client,
+                polling_interval=polling_interval,
+            )
+
+        inbox = Inbox(name, max_records=max_records)
+        reader.add(inbox)
+        return inbox
+
+    async def remove(self, inbox: Inbox) -> None:
+        if (reader := inbox.reader) is None:
+            return
+
+        reader.discard(inbox)
+        inbox.reader = None
+
+        await self._push_back(reader, inbox)
+
+        if not reader:
+            self._readers = {k: r for k, r in self._readers.items() if r is not reader}
+            await reader.close()
+
+    async def close(self) -> None:
+        """Stop all readers and return not processed list messages back.
+
+        Should be called before the connection is closed.
+        """
+        readers, self._readers = tuple(self._readers.values()), {}
+
+        for reader in readers:
+            await reader.close()
+
+            for inboxes in tuple(reader._inboxes.values()):
+                for inbox in inboxes:
+                    reader.discard(inbox)
+                    inbox.reader = None
+                    await self._push_back(reader, inbox)
+
+    @staticmethod
+    async def _push_back(reader: _Reader, inbox: Inbox) -> None:
+        data = inbox.drain()
+        if isinstance(reader, _ListsReader) and data and not isinstance(data, Exception):
+            # return not processed messages back to the list
+            values = data if isinstance(data, list) else [data]
+            await reader.client.lpush(inbox.key, *reversed(values))
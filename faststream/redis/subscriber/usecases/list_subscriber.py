@@ -2,6 +2,7 @@ from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
 import anyio
+from redis.exceptions import ResponseError
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
     from faststream.message import StreamMessage as BrokerStreamMessage
     from faststream.redis.schemas import ListSub
     from faststream.redis.subscriber.config import RedisSubscriberConfig
+    from faststream.redis.subscriber.multiplexer import Inbox
     from faststream.redis.subscriber.specification import RedisSubscriberSpecification
 
 TopicName: TypeAlias = bytes
@@ -45,6 +47,7 @@ class _ListHandlerMixin(LogicSubscriber):
         self._read_lock = anyio.Lock()
         assert config.list_sub
         self._list_sub = config.list_sub
+        self._inbox: Inbox | None = None
 
     @property
     def list_sub(self) -> "ListSub":
@@ -72,6 +75,15 @@ class _ListHandlerMixin(LogicSubscriber):
 
     @override
     async def start(self) -> None:
+        if self.calls and (multiplexer := self._outer_config.multiplexer):
+            list_sub = self.list_sub
+            self._inbox = multiplexer.read_list(
+                self._client,
+                list_sub.name,
+                max_records=list_sub.records,
+                polling_interval=list_sub.polling_interval,
+            )
+
         await super().start(self._client)
 
     @override
@@ -80,6 +92,10 @@ class _ListHandlerMixin(LogicSubscriber):
             async with self._read_lock:
                 await super().stop()
 
+        if self._inbox is not None:
+            await self._outer_config.multiplexer.remove(self._inbox)
+            self._inbox = None
+
     @override
     async def get_one(
         self,
@@ -176,14 +192,19 @@ class ListSubscriber(_ListHandlerMixin):
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
         async with self._read_lock:
-            raw_msg = await client.blpop(
+            if self._inbox is not None:
+                msg_data = await self._inbox.get(self.list_sub.polling_interval)
+
+            elif raw_msg := await client.blpop(
                 self.list_sub.name,
                 timeout=self.list_sub.polling_interval,
-            )
-
-            if raw_msg:
+            ):
                 _, msg_data = raw_msg
 
+            else:
+                msg_data = None
+
+            if msg_data is not None:
                 msg = DefaultListMessage(
                     type="list",
                     data=msg_data,
@@ -205,12 +226,15 @@ class ListBatchSubscriber(_ListHandlerMixin):
         config.decoder = parser.decode_message
         super().__init__(config, specification, calls)
 
+        self._blmpop_supported = True
+
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
         async with self._read_lock:
-            raw_msgs = await client.lpop(
-                name=self.list_sub.name,
-                count=self.list_sub.max_records,
-            )
+            if self._inbox is not None:
+                raw_msgs = await self._inbox.get(self.list_sub.polling_interval)
+
+            else:
+                raw_msgs = await self._pop_batch(client)
 
             if raw_msgs:
                 msg = BatchListMessage(
@@ -221,8 +245,48 @@ class ListBatchSubscriber(_ListHandlerMixin):
 
                 await self.consume_one(msg)
 
-        if not raw_msgs:
-            await anyio.sleep(self.list_sub.polling_interval)
+    async def _pop_batch(self, client: "Redis[bytes]") -> list[bytes] | None:
+        """Block server-side until the list has data and pop up to `max_records` of it."""
+        list_sub = self.list_sub
+
+        if list_sub.polling_interval <= 0:
+            # zero timeout blocks forever, so the list is polled without blocking
+            msgs = await client.lpop(list_sub.name, count=list_sub.max_records)
+            if not msgs:
+                await anyio.lowlevel.checkpoint()
+            return msgs
+
+        if self._blmpop_supported:
+            try:
+                result = await client.blmpop(
+                    list_sub.polling_interval,
+                    1,
+                    list_sub.name,
+                    direction="LEFT",
+                    count=list_sub.max_records,
+                )
+
+            except ResponseError as e:
+                # BLMPOP is available since Redis 7.0
+                if "unknown command" not in str(e).lower():
+                    raise
+
+                self._blmpop_supported = False
+
+            else:
+                return result[1] if result else None
+
+        # BLPOP waits for the first message and LPOP takes the rest in the same round-trip
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.blpop(list_sub.name, timeout=list_sub.polling_interval)
+            if list_sub.max_records > 1:
+                pipe.lpop(list_sub.name, count=list_sub.max_records - 1)
+            first, *rest = await pipe.execute()
+
+        msgs = [first[1]] if first else []
+        if rest and rest[0]:
+            msgs.extend(rest[0])
+        return msgs
 
 
 class ListConcurrentSubscriber(
@@ -1,7 +1,10 @@
+import asyncio
+import logging
 import math
-from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
+import anyio
 from redis.exceptions import ResponseError
 from typing_extensions import override
 
@@ -21,6 +24,7 @@ from .basic import LogicSubscriber
 
 if TYPE_CHECKING:
     from anyio import Event
+    from redis.asyncio.client import Redis
 
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
     from faststream._internal.endpoint.subscriber.call_item import (
@@ -29,6 +33,7 @@ if TYPE_CHECKING:
     from faststream.message import StreamMessage as BrokerStreamMessage
     from faststream.redis.schemas import StreamSub
     from faststream.redis.subscriber.config import RedisSubscriberConfig
+    from faststream.redis.subscriber.multiplexer import Inbox
 
 
 TopicName: TypeAlias = bytes
@@ -50,6 +55,10 @@ class _StreamHandlerMixin(LogicSubscriber):
         self.min_idle_time = config.stream_sub.min_idle_time
         self.autoclaim_start_id = b"0-0"
 
+        self.acks_buffer: StreamAcksBuffer | None = None
+        self._acks_task: asyncio.Task[None] | None = None
+        self._inbox: Inbox | None = None
+
     @property
     def stream_sub(self) -> "StreamSub":
         return self._stream_sub.add_prefix(self._outer_config.prefix)
@@ -73,12 +82,21 @@ class _StreamHandlerMixin(LogicSubscriber):
     async def start(self) -> None:
         client = self._client
 
+        stream = self.stream_sub
+
         self.extra_watcher_options.update(
             redis=client,
-            group=self.stream_sub.group,
+            group=stream.group,
         )
 
-        stream = self.stream_sub
+        if stream.group and stream.ack_flush_interval is not None:
+            self.acks_buffer = StreamAcksBuffer(
+                client,
+                interval=stream.ack_flush_interval / 1000,
+                max_size=stream.ack_batch_size,
+            )
+            self.extra_watcher_options["acks_buffer"] = self.acks_buffer
+            self._acks_task = self.add_task(self.acks_buffer.run)
 
         read: Callable[
             [str],
@@ -112,38 +130,39 @@ class _StreamHandlerMixin(LogicSubscriber):
                 if "already exists" not in str(e):
                     raise
 
-            def read(
-                _: str,
-            ) -> Awaitable[
-                tuple[
+            if stream.min_idle_time is None:
+
+                def read(
+                    _: str,
+                ) -> Awaitable[
                     tuple[
-                        TopicName,
                         tuple[
+                            TopicName,
                             tuple[
-                                Offset,
-                                dict[bytes, bytes],
+                                tuple[
+                                    Offset,
+                                    dict[bytes, bytes],
+                                ],
+                                ...,
                             ],
-                            ...,
                         ],
+                        ...,
                     ],
-                    ...,
-                ],
-            ]:
-                return client.xreadgroup(
-                    groupname=stream.group,
-                    consumername=stream.consumer,
-                    streams={stream.name: stream.last_id},
-                    count=stream.max_records,
-                    block=stream.polling_interval,
-                    noack=stream.no_ack,
-                )
+                ]:
+                    return client.xreadgroup(
+                        groupname=stream.group,
+                        consumername=stream.consumer,
+                        streams={stream.name: stream.last_id},
+                        count=stream.max_records,
+                        block=stream.polling_interval,
+                        noack=stream.no_ack,
+                    )
 
-        elif self.stream_sub.min_idle_time is None:
+            else:
 
-            def read(
-                last_id: str,
-            ) -> Awaitable[
-                tuple[
+                async def read(
+                    _: str,
+                ) -> tuple[
                     tuple[
                         TopicName,
                         tuple[
@@ -155,21 +174,63 @@ class _StreamHandlerMixin(LogicSubscriber):
                         ],
                     ],
                     ...,
+                ]:
+                    # claim idle pending messages of the group at first
+                    next_id, messages, _ = await client.xautoclaim(
+                        name=stream.name,
+                        groupname=stream.group,
+                        consumername=stream.consumer,
+                        min_idle_time=stream.min_idle_time,
+                        start_id=self.autoclaim_start_id,
+                        count=stream.max_records,
+                    )
+                    # Update start_id for next call
+                    self.autoclaim_start_id = next_id
+
+                    if messages:
+                        return ((stream.name.encode(), messages),)
+
+                    # nothing to claim, so wait for new messages
+                    return await client.xreadgroup(
+                        groupname=stream.group,
+                        consumername=stream.consumer,
+                        streams={stream.name: stream.last_id},
+                        count=stream.max_records,
+                        block=stream.polling_interval,
+                        noack=stream.no_ack,
+                    )
+
+        elif self.calls and (multiplexer := self._outer_config.multiplexer):
+            inbox = self._inbox = multiplexer.read_stream(
+                client,
+                stream.name,
+                last_id=self.last_id,
+                max_records=stream.max_records,
+                polling_interval=stream.polling_interval,
+            )
+
+            async def read(
+                _: str,
+            ) -> tuple[
+                tuple[
+                    TopicName,
+                    tuple[
+                        tuple[
+                            Offset,
+                            dict[bytes, bytes],
+                        ],
+                        ...,
+                    ],
                 ],
+                ...,
             ]:
-                return client.xread(
-                    {stream.name: last_id},
-                    block=stream.polling_interval,
-                    count=stream.max_records,
-                )
+                return await inbox.get(stream.polling_interval / 1000) or ()
 
         else:
 
             def read(
-                _: str,
-            ) -> Coroutine[
-                Any,
-                Any,
+                last_id: str,
+            ) -> Awaitable[
                 tuple[
                     tuple[
                         TopicName,
@@ -184,29 +245,39 @@ class _StreamHandlerMixin(LogicSubscriber):
                     ...,
                 ],
             ]:
-                async def xautoclaim() -> tuple[
-                    tuple[TopicName, tuple[tuple[Offset, dict[bytes, bytes]], ...]], ...
-                ]:
-                    stream_message = await client.xautoclaim(
-                        name=self.stream_sub.name,
-                        groupname=self.stream_sub.group,
-                        consumername=self.stream_sub.consumer,
-                        min_idle_time=self.min_idle_time,
-                        start_id=self.autoclaim_start_id,
-                        count=1,
-                    )
-                    stream_name = self.stream_sub.name.encode()
-                    (next_id, messages, _) = stream_message
-                    # Update start_id for next call
-                    self.autoclaim_start_id = next_id
-                    if not messages:
-                        return ()
-                    return ((stream_name, messages),)
-
-                return xautoclaim()
+                return client.xread(
+                    {stream.name: last_id},
+                    block=stream.polling_interval,
+                    count=stream.max_records,
+                )
 
         await super().start(read)
 
+    async def stop(self) -> None:
+        await super().stop()
+
+        if self._inbox is not None:
+            await self._outer_config.multiplexer.remove(self._inbox)
+            self._inbox = None
+
+        if self._acks_task is not None:
+            # stop background flushing before the final flush
+            await asyncio.wait((self._acks_task,))
+            self._acks_task = None
+
+        if self.acks_buffer is not None:
+            try:
+                await self.acks_buffer.flush()
+            except Exception as e:
+                self._log(
+                    log_level=logging.ERROR,
+                    message="Messages acknowledgement error",
+                    exc_info=e,
+                )
+
+            self.acks_buffer = None
+            self.extra_watcher_options.pop("acks_buffer", None)
+
     @override
     async def get_one(
         self,
@@ -442,3 +513,70 @@ class StreamConcurrentSubscriber(
 
     async def consume_one(self, msg: "BrokerStreamMessage[Any]") -> None:
         await self._put_msg(msg)
+
+
+class StreamAcksBuffer:
+    """Accumulates acknowledged stream messages to send them in the background.
+
+    All ids of a stream are sent with a single XACK command and commands for
+    different streams are pipelined, so many messages are acknowledged per
+    round-trip.
+    """
+
+    def __init__(
+        self,
+        client: "Redis[bytes]",
+        *,
+        interval: float,
+        max_size: int,
+    ) -> None:
+        self._client = client
+        self.interval = interval
+        self.max_size = max_size
+
+        self._pending: dict[tuple[str, str], list[bytes]] = {}
+        self._size = 0
+
+        self._lock = anyio.Lock()
+        self._wakeup = anyio.Event()
+
+    def add(self, stream: str, group: str, ids: Sequence[bytes]) -> None:
+        if (pending := self._pending.get((stream, group))) is None:
+            pending = self._pending[stream, group] = []
+
+        pending.extend(ids)
+        self._size += len(ids)
+
+        if self._size >= self.max_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+
+            pending, self._pending, self._size = self._pending, {}, 0
+
+            sent = False
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for (stream, group), ids in pending.items():
+                        pipe.xack(stream, group, *ids)  # type: ignore[no-untyped-call]
+                    await pipe.execute()
+                sent = True
+
+            finally:
+                if not sent:
+                    # return ids back to send them with the next flush,
+                    # flush could be cancelled as well
+                    for (stream, group), ids in pending.items():
+                        self.add(stream, group, ids)
+
+    async def run(self) -> None:
+        """Send acknowledgements each `interval` seconds or `max_size` messages."""
+        while True:
+            with anyio.move_on_after(self.interval):
+                await self._wakeup.wait()
+
+            self._wakeup = anyio.Event()
+            await self.flush()
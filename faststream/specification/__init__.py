@@ -1,6 +1,9 @@
-from .asyncapi import AsyncAPI, get_asyncapi_html
-from .base.specification import Specification
-from .schema.extra import Contact, ExternalDocs, License, Tag
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .asyncapi import AsyncAPI, get_asyncapi_html
+    from .base.specification import Specification
+    from .schema.extra import Contact, ExternalDocs, License, Tag
 
 __all__ = (
     "AsyncAPI",
@@ -11,3 +14,24 @@ __all__ = (
     "Tag",
     "get_asyncapi_html",
 )
+
+# specification is required to generate docs only, so import it on first access
+_LAZY_IMPORTS = {
+    "AsyncAPI": ".asyncapi",
+    "Contact": ".schema.extra",
+    "ExternalDocs": ".schema.extra",
+    "License": ".schema.extra",
+    "Specification": ".base.specification",
+    "Tag": ".schema.extra",
+    "get_asyncapi_html": ".asyncapi",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    from importlib import import_module
+
+    return getattr(import_module(module, __name__), name)
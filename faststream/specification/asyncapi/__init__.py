@@ -1,9 +1,27 @@
 """AsyncAPI related functions."""
 
-from .factory import AsyncAPI
-from .site import get_asyncapi_html
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .factory import AsyncAPI
+    from .site import get_asyncapi_html
 
 __all__ = (
     "AsyncAPI",
     "get_asyncapi_html",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AsyncAPI":
+        from .factory import AsyncAPI
+
+        return AsyncAPI
+
+    if name == "get_asyncapi_html":
+        from .site import get_asyncapi_html
+
+        return get_asyncapi_html
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,19 +1,22 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pydantic import AnyHttpUrl
 from typing_extensions import Required, TypedDict
 
-from faststream._internal._compat import EmailStr
+if TYPE_CHECKING:
+    # email-validator is heavy, so it is imported by AsyncAPI schema generation only
+    from faststream._internal._compat import EmailStr
 
 
 class ContactDict(TypedDict, total=False):
     name: Required[str]
     url: AnyHttpUrl
-    email: EmailStr
+    email: "EmailStr"
 
 
 @dataclass
 class Contact:
     name: str
     url: AnyHttpUrl | None = None
-    email: EmailStr | None = None
+    email: "EmailStr | None" = None
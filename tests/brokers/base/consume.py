@@ -5,7 +5,7 @@ import anyio
 import pytest
 from pydantic import BaseModel
 
-from faststream import Context, Depends
+from faststream import Context, Depends, HeaderEquals
 from faststream.exceptions import StopConsume
 
 from .basic import BaseTestcaseConfig
@@ -197,6 +197,53 @@ class BrokerConsumeTestcase(BaseTestcaseConfig):
         mock.handler.assert_called_once_with({"msg": "hello"})
         mock.handler2.assert_called_once_with("hello")
 
+    async def test_consume_with_header_filter(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        consumed = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub(filter=HeaderEquals("type", "a"))
+        async def handler_a(m) -> None:
+            mock.a(m)
+
+        @sub(filter=HeaderEquals("type", "b"))
+        async def handler_b(m) -> None:
+            mock.b(m)
+
+        @sub(filter=HeaderEquals("type", "a"))
+        async def handler_shadowed(m) -> None:
+            mock.shadowed(m)
+
+        @sub
+        async def default(m) -> None:
+            mock.default(m)
+            consumed.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish("a", queue, headers={"type": "a"})
+            await br.publish("b", queue, headers={"type": "b"})
+            await br.publish("c", queue, headers={"type": "c"})
+
+            await asyncio.wait(
+                (asyncio.create_task(consumed.wait()),),
+                timeout=self.timeout,
+            )
+
+        mock.a.assert_called_once_with("a")
+        mock.b.assert_called_once_with("b")
+        mock.default.assert_called_once_with("c")
+        assert not mock.shadowed.called
+
     async def test_consume_validate_false(
         self,
         queue: str,
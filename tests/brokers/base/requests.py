@@ -174,3 +174,22 @@ class RequestsTestcase(BaseTestcaseConfig):
             )
 
         assert await response.decode() == "x" * 2 * 2 * 2 * 2
+
+    async def test_concurrent_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg: int) -> int:
+            await anyio.sleep(0.01)
+            return msg * 2
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(broker.request(i, queue, timeout=self.timeout) for i in range(10))
+            )
+
+        assert [await r.decode() for r in responses] == [i * 2 for i in range(10)]
@@ -2,11 +2,16 @@ import asyncio
 import gc
 import json
 from abc import abstractmethod
-from unittest.mock import Mock
+from contextlib import AbstractContextManager
+from functools import partial
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import anyio
 import pytest
 
+from faststream import BaseMiddleware
+
 from .consume import BrokerConsumeTestcase
 from .publish import BrokerPublishTestcase
 
@@ -51,6 +56,96 @@ class BrokerTestclientTestcase(BrokerPublishTestcase, BrokerConsumeTestcase):
             await br.publish("hello", queue)
             m.mock.assert_called_once_with("hello")
 
+    @pytest.mark.asyncio()
+    async def test_middleware_added_after_start(self, queue: str) -> None:
+        mock = Mock()
+
+        class Middleware(BaseMiddleware):
+            async def on_receive(self) -> None:
+                mock(self.msg)
+                return await super().on_receive()
+
+        test_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @test_broker.subscriber(*args, **kwargs)
+        async def m(msg) -> None:
+            pass
+
+        async with self.patch_broker(test_broker) as br:
+            await br.start()
+
+            await br.publish("hello", queue)
+            assert not mock.called
+
+            br.add_middleware(Middleware)
+            await br.publish("hello", queue)
+            mock.assert_called_once()
+
+    def patch_broker_connect(self, broker: Any) -> AbstractContextManager[Any]:
+        """Patch the broker to start without a real connection."""
+        return patch.object(broker, "_connect", AsyncMock())
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("concurrency", "expected"),
+        (
+            pytest.param({}, 1, id="sequential by default"),
+            pytest.param({"startup_concurrency": 2}, 2, id="concurrent"),
+        ),
+    )
+    async def test_subscribers_start_concurrency(
+        self,
+        queue: str,
+        concurrency: dict[str, int],
+        expected: int,
+    ) -> None:
+        broker = self.get_broker(**concurrency)
+
+        running: set[object] = set()
+        max_running = 0
+
+        for i in range(5):
+            args, kwargs = self.get_subscriber_params(f"{queue}{i}")
+            sub = broker.subscriber(*args, **kwargs)
+
+            async def start(sub: object = sub) -> None:
+                nonlocal max_running
+                running.add(sub)
+                max_running = max(max_running, len(running))
+                await asyncio.sleep(0.01)
+                running.discard(sub)
+
+            sub.start = AsyncMock(side_effect=start)
+
+        with self.patch_broker_connect(broker):
+            await broker.start()
+
+        assert max_running == expected
+
+    @pytest.mark.asyncio()
+    async def test_subscribers_start_error(self, queue: str) -> None:
+        broker = self.get_broker(startup_concurrency=3)
+
+        for i in range(3):
+            args, kwargs = self.get_subscriber_params(f"{queue}{i}")
+            sub = broker.subscriber(*args, **kwargs)
+            sub.start = AsyncMock(side_effect=partial(asyncio.sleep, 0.01))
+            sub.stop = AsyncMock()
+
+        failed, *started = broker.subscribers
+        failed.start.side_effect = ValueError
+
+        with self.patch_broker_connect(broker), pytest.raises(ValueError):  # noqa: PT011
+            await broker.start()
+
+        # already started subscribers are stopped
+        for sub in started:
+            sub.start.assert_awaited_once()
+            sub.stop.assert_awaited_once()
+        assert not failed.stop.called
+
     @pytest.mark.asyncio()
     async def test_publisher_mock(self, queue: str) -> None:
         test_broker = self.get_broker()
@@ -0,0 +1,122 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from confluent_kafka import KafkaException
+
+from faststream.confluent.helpers import AsyncConfluentConsumer, ConfluentFastConfig
+
+
+def make_message(offset: int, partition: int = 0) -> MagicMock:
+    msg = MagicMock()
+    msg.error.return_value = None
+    msg.topic.return_value = "topic"
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    return msg
+
+
+def make_consumer(prefetch: int | None) -> AsyncConfluentConsumer:
+    consumer = AsyncConfluentConsumer(
+        "topic",
+        config=ConfluentFastConfig(),
+        logger=MagicMock(),
+        admin_service=MagicMock(),
+        partitions=(),
+        prefetch=prefetch,
+    )
+    consumer.consumer = MagicMock()
+    return consumer
+
+
+@pytest.mark.confluent()
+def test_prefetch_disables_auto_offset_store() -> None:
+    assert "enable.auto.offset.store" not in make_consumer(None).config
+    assert make_consumer(10).config["enable.auto.offset.store"] is False
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_getone_polls_without_prefetch() -> None:
+    consumer = make_consumer(None)
+    msg = make_message(0)
+    consumer.consumer.poll.return_value = msg
+
+    assert await consumer.getone(timeout=1.0) is msg
+
+    consumer.consumer.poll.assert_called_once_with(1.0)
+    assert not consumer.consumer.consume.called
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_getone_drains_buffer() -> None:
+    consumer = make_consumer(3)
+    messages = [make_message(i) for i in range(3)]
+    consumer.consumer.consume.return_value = messages
+
+    assert [await consumer.getone(timeout=1.0) for _ in range(3)] == messages
+
+    consumer.consumer.consume.assert_called_once_with(num_messages=3, timeout=1.0)
+    assert not consumer.consumer.poll.called
+    assert [c.kwargs for c in consumer.consumer.store_offsets.call_args_list] == [
+        {"message": m} for m in messages
+    ]
+
+    consumer.consumer.consume.return_value = []
+    assert await consumer.getone(timeout=1.0) is None
+    assert consumer.consumer.consume.call_count == 2
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_offsets_stored_without_thread_hop() -> None:
+    consumer = make_consumer(3)
+    consumer.consumer.consume.return_value = [make_message(i) for i in range(3)]
+
+    threads: list[threading.Thread] = []
+    consumer.consumer.store_offsets.side_effect = lambda **_: threads.append(
+        threading.current_thread(),
+    )
+
+    for _ in range(3):
+        await consumer.getone()
+
+    assert threads == [threading.current_thread()] * 3
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_getone_skips_revoked_messages() -> None:
+    consumer = make_consumer(3)
+    revoked, msg, next_msg = messages = [make_message(i) for i in range(3)]
+    consumer.consumer.consume.return_value = messages
+
+    def store_offsets(message: MagicMock) -> None:
+        if message is revoked:
+            raise KafkaException
+
+    consumer.consumer.store_offsets.side_effect = store_offsets
+
+    assert await consumer.getone() is msg
+    assert await consumer.getone() is next_msg
+    consumer.consumer.consume.assert_called_once()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_seek_drops_buffered_partition() -> None:
+    consumer = make_consumer(4)
+    first, other, *rest = messages = [
+        make_message(0, partition=0),
+        make_message(0, partition=1),
+        make_message(1, partition=0),
+        make_message(1, partition=1),
+    ]
+    consumer.consumer.consume.return_value = messages
+
+    assert await consumer.getone() is first
+
+    await consumer.seek("topic", 0, 0)
+
+    assert list(consumer._buffer) == [other, rest[1]]
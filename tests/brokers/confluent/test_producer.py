@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.confluent.helpers import AsyncConfluentProducer, ConfluentFastConfig
+
+
+class FakeProducer:
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        self.callbacks: list[Any] = []
+        self.produced: list[Any] = []
+
+    def produce(self, topic: str, **kwargs: Any) -> None:
+        if len(self.callbacks) >= self.queue_size:
+            raise BufferError
+
+        self.produced.append(kwargs["value"])
+        self.callbacks.append(kwargs["on_delivery"])
+
+    def poll(self, timeout: float) -> int:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            msg = MagicMock()
+            msg.error.return_value = None
+            callback(None, msg)
+        return len(callbacks)
+
+    def flush(self) -> None:
+        self.poll(0)
+
+
+def make_producer() -> AsyncConfluentProducer:
+    producer = AsyncConfluentProducer(
+        logger=MagicMock(),
+        config=ConfluentFastConfig(),
+    )
+    producer.producer = FakeProducer(queue_size=2)
+    return producer
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_waits_for_queue_drain() -> None:
+    producer = make_producer()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(producer.send("topic", value=str(i)) for i in range(5))),
+        timeout=3,
+    )
+
+    assert len(results) == 5
+    assert sorted(producer.producer.produced) == [str(i) for i in range(5)]
+
+    await producer.stop()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_send_batch_waits_for_queue_drain() -> None:
+    producer = make_producer()
+
+    batch = producer.create_batch()
+    for i in range(5):
+        batch.append(value=str(i))
+
+    await asyncio.wait_for(
+        producer.send_batch(batch, "topic", partition=None),
+        timeout=3,
+    )
+
+    assert producer.producer.produced == [str(i) for i in range(5)]
+
+    await producer.stop()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_delivery_error() -> None:
+    producer = make_producer()
+
+    future = await producer.send("topic", value=b"", no_confirm=True)
+
+    callback = producer.producer.callbacks.pop()
+    callback("error", None)
+
+    with pytest.raises(Exception, match="error"):
+        await asyncio.wait_for(future, timeout=3)
+
+    await producer.stop()
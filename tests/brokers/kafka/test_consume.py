@@ -140,6 +140,46 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
                 )
                 m.mock.assert_called_once()
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_consume_tracked_offsets_commit(self, queue: str) -> None:
+        consume_broker = self.get_broker(apply_types=True)
+
+        consumed = 0
+        event = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue,
+            group_id="test",
+            max_workers=3,
+            ack_policy=AckPolicy.REJECT_ON_ERROR,
+            commit_interval_ms=60 * 1000,
+            commit_batch_size=5,
+        )
+        async def handler(msg: int) -> None:
+            nonlocal consumed
+            await asyncio.sleep(0.1 * (msg % 2))
+            consumed += 1
+            if consumed == 5:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AIOKafkaConsumer,
+                "commit",
+                spy_decorator(AIOKafkaConsumer.commit),
+            ) as m:
+                await br.publish_batch(*range(5), topic=queue)
+                await asyncio.wait_for(event.wait(), timeout=10)
+                await asyncio.sleep(0.1)
+
+                m.mock.assert_called_once()
+                ((_, offsets), _) = m.mock.call_args
+                assert offsets == {TopicPartition(queue, 0): 5}
+
     @pytest.mark.asyncio()
     async def test_manual_partition_consume(
         self,
@@ -8,6 +8,7 @@ from faststream.kafka import KafkaBroker, KafkaRouter, TopicPartition
 from faststream.kafka.subscriber.usecase import (
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentOrderedSubscriber,
 )
 from faststream.nats import NatsRouter
 from faststream.rabbit import RabbitRouter
@@ -63,6 +64,25 @@ from faststream.rabbit import RabbitRouter
             },
             id="partitions with manual commit",
         ),
+        pytest.param(
+            ("topic",),
+            {"commit_interval_ms": 100},
+            id="commit interval with ack first",
+        ),
+        pytest.param(
+            ("topic",),
+            {"batch": True, "ordered_by": "partition"},
+            id="ordered batch",
+        ),
+        pytest.param(
+            ("topic",),
+            {
+                "max_workers": 3,
+                "ordered_by": "key",
+                "ack_policy": AckPolicy.ACK,
+            },
+            id="ordered manual commit without commit interval",
+        ),
     ),
 )
 def test_wrong_destination(args: list[str], kwargs: dict[str, Any]) -> None:
@@ -108,6 +128,27 @@ def test_max_workers_configuration(queue: str) -> None:
     sub = broker.subscriber(queue, max_workers=3, ack_policy=AckPolicy.REJECT_ON_ERROR)
     assert isinstance(sub, ConcurrentBetweenPartitionsSubscriber)
 
+    sub = broker.subscriber(
+        queue,
+        "another",
+        max_workers=3,
+        ack_policy=AckPolicy.REJECT_ON_ERROR,
+        commit_interval_ms=100,
+    )
+    assert isinstance(sub, ConcurrentDefaultSubscriber)
+
+    sub = broker.subscriber(queue, max_workers=3, ordered_by="partition")
+    assert isinstance(sub, ConcurrentOrderedSubscriber)
+
+    sub = broker.subscriber(
+        queue,
+        max_workers=3,
+        ordered_by="key",
+        ack_policy=AckPolicy.ACK,
+        commit_interval_ms=100,
+    )
+    assert isinstance(sub, ConcurrentOrderedSubscriber)
+
     with pytest.raises(SetupError), pytest.warns(DeprecationWarning):
         broker.subscriber(
             partitions=[TopicPartition(topic="topic", partition=1)],
@@ -0,0 +1,186 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiokafka import ConsumerRecord
+
+from faststream.kafka import TopicPartition
+from faststream.kafka.helpers import OffsetsCommitListener, OffsetsTracker
+from faststream.kafka.message import KafkaAckableMessage
+
+TOPIC = "topic"
+
+
+def make_record(offset: int, partition: int = 0) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic=TOPIC,
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+def make_tracker(max_pending: int = 100) -> OffsetsTracker:
+    consumer = MagicMock()
+    consumer.commit = AsyncMock()
+    return OffsetsTracker(consumer, interval=60, max_pending=max_pending)
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_contiguous_processed_offsets() -> None:
+    tracker = make_tracker()
+    records = [make_record(i) for i in range(5)]
+    tracker.add(*records)
+
+    # out-of-order completion
+    tracker.done(records[1], records[2], records[4])
+    await tracker.flush()
+    tracker.consumer.commit.assert_not_called()
+
+    tracker.done(records[0])
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once_with({TopicPartition(TOPIC, 0): 3})
+
+    tracker.done(records[3])
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_with({TopicPartition(TOPIC, 0): 5})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_partitions_independently() -> None:
+    tracker = make_tracker()
+    first, second = make_record(10, partition=0), make_record(20, partition=1)
+    tracker.add(first, second)
+
+    tracker.done(second)
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once_with({TopicPartition(TOPIC, 1): 21})
+
+    # nothing new to commit
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_failure_retries_offsets() -> None:
+    tracker = make_tracker()
+    record = make_record(0)
+    tracker.add(record)
+    tracker.done(record)
+
+    tracker.consumer.commit.side_effect = ValueError
+    with pytest.raises(ValueError):  # noqa: PT011
+        await tracker.flush()
+
+    tracker.consumer.commit.side_effect = None
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_with({TopicPartition(TOPIC, 0): 1})
+
+
+@pytest.mark.kafka()
+def test_max_pending_wakes_up_commit() -> None:
+    tracker = make_tracker(max_pending=2)
+    records = [make_record(i) for i in range(2)]
+    tracker.add(*records)
+
+    tracker.done(records[0])
+    assert not tracker._wakeup.is_set()
+
+    tracker.done(records[1])
+    assert tracker._wakeup.is_set()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_reset_forgets_replayed_offsets() -> None:
+    tracker = make_tracker()
+    records = [make_record(i) for i in range(3)]
+    tracker.add(*records)
+
+    tracker.reset(TopicPartition(TOPIC, 0), 1)
+    # in-flight processing of a replayed record doesn't move the position
+    tracker.done(records[2])
+    tracker.done(records[0])
+
+    replayed = [make_record(1), make_record(2)]
+    tracker.add(*replayed)
+    tracker.done(*replayed)
+
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once_with({TopicPartition(TOPIC, 0): 3})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_revoked_partitions_committed_and_dropped() -> None:
+    tracker = make_tracker()
+    user_listener = MagicMock()
+    listener = OffsetsCommitListener(tracker=tracker, listener=user_listener)
+
+    record, late = make_record(0), make_record(1)
+    tracker.add(record, late)
+    tracker.done(record)
+
+    revoked = {TopicPartition(TOPIC, 0)}
+    await listener.on_partitions_revoked(revoked)
+
+    tracker.consumer.commit.assert_awaited_once_with({TopicPartition(TOPIC, 0): 1})
+    user_listener.on_partitions_revoked.assert_called_once_with(revoked)
+
+    # record of revoked partition is ignored
+    tracker.done(late)
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_message_ack_marks_tracked_records() -> None:
+    tracker = make_tracker()
+    consumer = MagicMock()
+    consumer.commit = AsyncMock()
+
+    batch = (make_record(0), make_record(1))
+    tracker.add(*batch)
+
+    msg = KafkaAckableMessage(
+        body=b"",
+        raw_message=batch,
+        consumer=consumer,
+        offsets_tracker=tracker,
+    )
+    await msg.ack()
+
+    consumer.commit.assert_not_called()
+    await tracker.flush()
+    tracker.consumer.commit.assert_awaited_once_with({TopicPartition(TOPIC, 0): 2})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_message_nack_seeks_each_partition() -> None:
+    tracker = make_tracker()
+    consumer = MagicMock()
+
+    batch = (make_record(5, partition=0), make_record(3, partition=1))
+    tracker.add(*batch)
+
+    msg = KafkaAckableMessage(
+        body=b"",
+        raw_message=batch,
+        consumer=consumer,
+        offsets_tracker=tracker,
+    )
+    await msg.nack()
+
+    consumer.seek.assert_any_call(partition=TopicPartition(TOPIC, 0), offset=5)
+    consumer.seek.assert_any_call(partition=TopicPartition(TOPIC, 1), offset=3)
@@ -0,0 +1,111 @@
+import asyncio
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiokafka import ConsumerRecord
+
+from faststream.kafka import KafkaBroker
+from faststream.kafka.subscriber.usecase import (
+    ConcurrentOrderedSubscriber,
+    DefaultSubscriber,
+)
+
+
+def make_record(offset: int, partition: int, key: bytes | None = None) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=key,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("ordered_by", "group"),
+    (
+        pytest.param("partition", lambda r: r.partition, id="partition"),
+        pytest.param("key", lambda r: r.key, id="key"),
+    ),
+)
+async def test_lanes_keep_order(ordered_by, group) -> None:
+    broker = KafkaBroker()
+    sub = broker.subscriber("topic", max_workers=4, ordered_by=ordered_by)
+    assert isinstance(sub, ConcurrentOrderedSubscriber)
+
+    processed: list[ConsumerRecord] = []
+    in_flight = max_in_flight = 0
+
+    async def consume(msg: ConsumerRecord) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(in_flight, max_in_flight)
+        await asyncio.sleep(random.random() / 100)
+        in_flight -= 1
+        processed.append(msg)
+
+    records = [
+        make_record(offset, partition=offset % 3, key=str(offset % 5).encode())
+        for offset in range(60)
+    ]
+
+    with (
+        patch.object(DefaultSubscriber, "start", AsyncMock()),
+        patch.object(sub, "consume", consume),
+    ):
+        await sub.start()
+
+        for r in records:
+            await sub.consume_one(r)
+
+        while len(processed) < len(records):  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+        await sub.stop()
+
+    assert max_in_flight > 1
+
+    for key in {group(r) for r in records}:
+        offsets = [r.offset for r in processed if group(r) == key]
+        assert offsets == sorted(offsets)
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_stop_drains_lanes() -> None:
+    broker = KafkaBroker(graceful_timeout=5)
+    sub = broker.subscriber("topic", max_workers=2, ordered_by="partition")
+    assert isinstance(sub, ConcurrentOrderedSubscriber)
+
+    processed: list[ConsumerRecord] = []
+
+    async def consume(msg: ConsumerRecord) -> None:
+        await asyncio.sleep(0.01)
+        processed.append(msg)
+
+    records = [make_record(offset, partition=offset % 2) for offset in range(4)]
+
+    with (
+        patch.object(DefaultSubscriber, "start", AsyncMock()),
+        patch.object(sub, "consume", consume),
+    ):
+        await sub.start()
+        reader = sub.add_task(asyncio.Event().wait)
+
+        for r in records:
+            await sub.consume_one(r)
+
+        await sub.stop()
+
+    # reader is stopped and already routed messages are processed
+    assert reader.cancelled()
+    assert sorted(r.offset for r in processed) == [0, 1, 2, 3]
@@ -1,5 +1,8 @@
 import pytest
 
+from faststream.kafka.message import KafkaMessage
+from faststream.kafka.parser import AioKafkaParser
+from faststream.kafka.testing import build_message
 from tests.brokers.base.parser import CustomParserTestcase
 
 from .basic import KafkaTestcaseConfig
@@ -9,3 +12,31 @@ from .basic import KafkaTestcaseConfig
 @pytest.mark.connected()
 class TestCustomParser(KafkaTestcaseConfig, CustomParserTestcase):
     pass
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_headers_decoded_lazily() -> None:
+    parser = AioKafkaParser(msg_class=KafkaMessage, regex=None)
+    record = build_message(
+        "hello",
+        topic="in",
+        headers={"custom": "1"},
+        correlation_id="1",
+        reply_to="response",
+        serializer=None,
+    )
+
+    msg = await parser.parse_message(record)
+
+    assert msg.correlation_id == "1"
+    assert msg.reply_to == "response"
+    assert msg.content_type == "text/plain"
+    assert msg._headers is None
+
+    assert msg.headers == {
+        "content-type": "text/plain",
+        "correlation_id": "1",
+        "reply_to": "response",
+        "custom": "1",
+    }
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -182,6 +183,38 @@ class TestTestclient(KafkaMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_decode_mixed_content_types(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, "hello", b"1", topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, "hello", 1])
+
+    async def test_batch_vectorized_decoder(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        async def decoder(msg, original_decoder) -> list[int]:
+            # decode all batch bodies with a single call
+            return json.loads(b"[" + b",".join(msg.body) + b"]")
+
+        @broker.subscriber(queue, batch=True, decoder=decoder)
+        async def m(msg: list[int]) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch(1, 2, 3, topic=queue)
+            m.mock.assert_called_once_with([1, 2, 3])
+
     async def test_batch_publisher_mock(
         self,
         queue: str,
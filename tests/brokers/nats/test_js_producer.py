@@ -0,0 +1,220 @@
+import asyncio
+import json
+from itertools import count
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from nats.aio.msg import Msg
+from nats.errors import ConnectionClosedError
+from nats.js.errors import APIError
+
+from faststream.nats.publisher.producer import NatsJSFastProducer
+from faststream.nats.response import NatsPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.subscriptions: dict[str, Any] = {}
+        self.published: list[dict[str, Any]] = []
+        self._nuid = MagicMock()
+        self._nuid.next.side_effect = (str(i).encode() for i in count())
+
+    def new_inbox(self) -> str:
+        return "_INBOX.test"
+
+    async def subscribe(self, subject: str, cb: Any) -> None:
+        self.subscriptions[subject] = cb
+
+    async def publish(self, **kwargs: Any) -> None:
+        self.published.append(kwargs)
+
+    async def reply(self, response: dict[str, Any]) -> None:
+        request = self.published.pop(0)
+        (cb,) = self.subscriptions.values()
+        await cb(
+            Msg(self, subject=request["reply"], data=json.dumps(response).encode()),
+        )
+
+
+def make_producer(max_pending: int = 10) -> tuple[NatsJSFastProducer, FakeClient]:
+    client = FakeClient()
+    producer = NatsJSFastProducer(parser=None, decoder=None, max_pending=max_pending)
+    producer.connect(MagicMock(_nc=client, _timeout=5), serializer=None)
+    return producer, client
+
+
+def make_cmd(body: Any) -> NatsPublishCommand:
+    return NatsPublishCommand(
+        body,
+        subject="test",
+        stream="stream",
+        no_confirm=True,
+        _publish_type=PublishType.PUBLISH,
+    )
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_async() -> None:
+    producer, client = make_producer()
+
+    futures = [await producer.publish(make_cmd(i)) for i in range(3)]
+
+    assert len(client.subscriptions) == 1
+    assert [m["payload"] for m in client.published] == [b"0", b"1", b"2"]
+    assert client.published[0]["headers"]["Nats-Expected-Stream"] == "stream"
+    assert not any(f.done() for f in futures)
+
+    for seq in range(3):
+        await client.reply({"stream": "stream", "seq": seq})
+
+    acks = await asyncio.gather(*futures)
+    assert [ack.seq for ack in acks] == [0, 1, 2]
+
+    await producer.flush()
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_async_window() -> None:
+    producer, client = make_producer(max_pending=1)
+
+    await producer.publish(make_cmd(1))
+
+    second = asyncio.create_task(producer.publish(make_cmd(2)))
+    await asyncio.sleep(0.01)
+    assert not second.done()
+
+    await client.reply({"stream": "stream", "seq": 1})
+    await asyncio.wait_for(second, timeout=3)
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_flush_raises_error() -> None:
+    producer, client = make_producer()
+
+    future = await producer.publish(make_cmd(1))
+    await client.reply({"error": {"code": 503, "description": "unavailable"}})
+
+    with pytest.raises(APIError):
+        await producer.flush()
+
+    with pytest.raises(APIError):
+        await future
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_async_timeout() -> None:
+    producer, _ = make_producer(max_pending=1)
+
+    cmd = make_cmd(1)
+    cmd.timeout = 0.01
+    future = await producer.publish(cmd)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(future, timeout=3)
+
+    # window slot is released
+    await asyncio.wait_for(producer.publish(make_cmd(2)), timeout=3)
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_async_default_timeout() -> None:
+    producer, client = make_producer(max_pending=1)
+    producer.connect(MagicMock(_nc=client, _timeout=0.01), serializer=None)
+
+    cmd = make_cmd(1)
+    cmd.timeout = None
+    future = await producer.publish(cmd)
+
+    # lost PubAck expires with JetStream context timeout
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(future, timeout=3)
+
+    await asyncio.wait_for(producer.publish(make_cmd(2)), timeout=3)
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_disconnect_releases_window() -> None:
+    producer, client = make_producer(max_pending=1)
+
+    future = await producer.publish(make_cmd(1))
+
+    producer.disconnect()
+
+    with pytest.raises(ConnectionClosedError):
+        await future
+
+    producer.connect(MagicMock(_nc=client, _timeout=5), serializer=None)
+    await asyncio.wait_for(producer.publish(make_cmd(2)), timeout=3)
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_batch_pipelined() -> None:
+    producer, client = make_producer()
+
+    cmd = NatsPublishCommand(
+        1,
+        2,
+        3,
+        subject="test",
+        stream="stream",
+        _publish_type=PublishType.PUBLISH,
+    )
+    task = asyncio.create_task(producer.publish_batch(cmd))
+    await asyncio.sleep(0.01)
+
+    # all messages are sent before the first PubAck
+    assert [m["payload"] for m in client.published] == [b"1", b"2", b"3"]
+    assert not task.done()
+
+    for seq in range(3):
+        await client.reply({"stream": "stream", "seq": seq})
+
+    acks = await asyncio.wait_for(task, timeout=3)
+    assert [ack.seq for ack in acks] == [0, 1, 2]
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_request_shares_reply_subscription() -> None:
+    client = FakeClient()
+    js = MagicMock(_nc=client, publish=AsyncMock())
+
+    producer = NatsJSFastProducer(parser=None, decoder=None)
+    producer.connect(js, serializer=None)
+
+    async def respond(
+        subject: str,
+        payload: bytes,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> None:
+        (cb,) = client.subscriptions.values()
+        asyncio.get_running_loop().call_soon(
+            asyncio.ensure_future,
+            cb(Msg(client, subject=headers["reply_to"], data=payload)),
+        )
+
+    js.publish.side_effect = respond
+
+    for body in (b"1", b"2"):
+        cmd = NatsPublishCommand(
+            body,
+            subject="test",
+            stream="stream",
+            timeout=3,
+            _publish_type=PublishType.REQUEST,
+        )
+        msg = await producer.request(cmd)
+        assert msg.data == body
+
+    assert list(client.subscriptions) == ["_INBOX.test.*"]
+    assert not producer._inbox._replies
@@ -0,0 +1,27 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.nats.publisher.producer import NatsFastProducerImpl
+from faststream.nats.response import NatsPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_batch_single_flush() -> None:
+    connection = MagicMock(publish=AsyncMock(), flush=AsyncMock())
+
+    producer = NatsFastProducerImpl(parser=None, decoder=None)
+    producer.connect(connection, serializer=None)
+
+    cmd = NatsPublishCommand(
+        b"1",
+        b"2",
+        subject="test",
+        _publish_type=PublishType.PUBLISH,
+    )
+    await producer.publish_batch(cmd)
+
+    assert [c[0] for c in connection.mock_calls] == ["publish", "publish", "flush"]
+    connection.flush.assert_awaited_once_with()
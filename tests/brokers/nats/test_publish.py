@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from faststream import Context
-from faststream.nats import NatsResponse
+from faststream.nats import JStream, NatsResponse
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 from .basic import NatsTestcaseConfig
@@ -75,3 +75,66 @@ class TestPublish(NatsTestcaseConfig, BrokerPublishTestcase):
             )
 
             assert await response.decode() == "Hi!", response
+
+    @pytest.mark.asyncio()
+    async def test_publish_no_confirm(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        @pub_broker.subscriber(queue, stream=stream)
+        async def handle(msg) -> None: ...
+
+        publisher = pub_broker.publisher(queue, stream=stream)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            futures = [await publisher.publish(i, no_confirm=True) for i in range(10)]
+            await asyncio.wait_for(publisher.flush(), timeout=3)
+
+            assert all(f.done() for f in futures)
+            assert [f.result().seq for f in futures] == list(range(1, 11))
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(self, queue: str) -> None:
+        pub_broker = self.get_broker()
+
+        @pub_broker.subscriber(queue)
+        async def handle(msg) -> None: ...
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, "hi", subject=queue)
+
+            await asyncio.wait_for(handle.wait_call(3), timeout=3)
+            await asyncio.sleep(0.1)
+
+        assert sorted(map(str, (c.args[0] for c in handle.mock.call_args_list))) == [
+            "1",
+            "hi",
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch_stream(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        @pub_broker.subscriber(queue, stream=stream)
+        async def handle(msg) -> None: ...
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            acks = await asyncio.wait_for(
+                br.publish_batch(1, 2, 3, subject=queue, stream=stream.name),
+                timeout=3,
+            )
+
+        assert [ack.seq for ack in acks] == [1, 2, 3]
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from faststream.nats import NatsBroker, PullSub
+
+
+class FakePullSubscription:
+    def __init__(self, batches: int) -> None:
+        self.batches = batches
+        self.fetched = 0
+        self.fetching = False
+        self.fetched_while_processing = 0
+
+    async def fetch(self, batch: int, timeout: float | None) -> list[Any]:
+        self.fetched += 1
+        self.fetching = True
+        try:
+            if self.fetched > self.batches:
+                await asyncio.sleep(timeout or 0)
+                return []
+
+            # network round-trip
+            await asyncio.sleep(0.005)
+            return [object()] * batch
+
+        finally:
+            self.fetching = False
+
+
+async def consume(broker: NatsBroker, subscription: FakePullSubscription) -> None:
+    subscriber = broker.subscribers[0]
+    subscriber.subscription = subscription
+    subscriber.running = True
+
+    async def process(msg: Any) -> None:
+        await asyncio.sleep(0.001)
+
+        if subscription.fetching:
+            subscription.fetched_while_processing += 1
+
+        if subscription.fetched >= subscription.batches:
+            subscriber.running = False
+
+    if subscriber.pull_sub.batch:
+        subscriber.consume = process
+        await subscriber._consume_pull()
+    else:
+        await subscriber._consume_pull(cb=process)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+@pytest.mark.parametrize("batch", (True, False))
+@pytest.mark.parametrize(
+    ("prefetch", "overlapped"),
+    (
+        pytest.param(True, True, id="prefetch"),
+        pytest.param(False, False, id="stop-and-wait"),
+    ),
+)
+async def test_pull_prefetch(batch: bool, prefetch: bool, overlapped: bool) -> None:
+    broker = NatsBroker()
+    broker.subscriber(
+        "test",
+        stream="test",
+        pull_sub=PullSub(2, timeout=0.01, batch=batch, prefetch=prefetch),
+    )
+
+    subscription = FakePullSubscription(batches=3)
+    await asyncio.wait_for(consume(broker, subscription), timeout=3.0)
+
+    assert bool(subscription.fetched_while_processing) is overlapped
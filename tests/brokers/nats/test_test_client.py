@@ -1,4 +1,7 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -6,6 +9,7 @@ from faststream import BaseMiddleware
 from faststream.nats import (
     ConsumerConfig,
     JStream,
+    NatsBroker,
     PullSub,
 )
 from faststream.nats.testing import FakeProducer
@@ -17,6 +21,14 @@ from .basic import NatsMemoryTestcaseConfig
 @pytest.mark.nats()
 @pytest.mark.asyncio()
 class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
+    @contextmanager
+    def patch_broker_connect(self, broker: NatsBroker) -> Iterator[None]:
+        with (
+            super().patch_broker_connect(broker),
+            patch.object(broker.config, "connection_state", MagicMock()),
+        ):
+            yield
+
     @pytest.mark.asyncio()
     async def test_stream_publish(
         self,
@@ -223,6 +235,65 @@ class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish("hello", queue)
             subscriber.mock.assert_called_once_with(["hello"])
 
+    async def test_publish_batch(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", 1, subject=queue)
+            assert [c.args for c in subscriber.mock.call_args_list] == [
+                ("hello",),
+                (1,),
+            ]
+
+    async def test_publish_batch_to_batch_subscriber(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(10, batch=True),
+        )
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", 1, subject=queue, stream=stream.name)
+            subscriber.mock.assert_called_once_with(["hello", 1])
+
+    async def test_batch_publisher(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        broker = self.get_broker()
+
+        publisher = broker.publisher(queue + "resp", batch=True)
+
+        @broker.subscriber(
+            queue + "resp",
+            stream=stream,
+            pull_sub=PullSub(10, batch=True),
+        )
+        def subscriber(m) -> None: ...
+
+        @publisher
+        @broker.subscriber(queue)
+        async def m(msg) -> tuple[int, ...]:
+            return 1, 2, 3
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hello", queue)
+            subscriber.mock.assert_called_once_with([1, 2, 3])
+
+            await publisher.publish(4, 5)
+            subscriber.mock.assert_called_with([4, 5])
+
     async def test_consume_with_subject_filter(self, queue: str) -> None:
         broker = self.get_broker()
 
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.rabbit.publisher.producer import RPCResponsesRouter, RPCUnset
+
+
+def make_response(correlation_id: str) -> MagicMock:
+    message = MagicMock()
+    message.correlation_id = correlation_id
+    return message
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_router_consumes_once() -> None:
+    router = RPCResponsesRouter()
+    queue = AsyncMock()
+    queue.consume.return_value = "tag"
+
+    await asyncio.gather(router.start(queue), router.start(queue))
+
+    queue.consume.assert_awaited_once()
+    assert router.consumer_tag == "tag"
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_router_routes_by_correlation_id() -> None:
+    router = RPCResponsesRouter()
+    queue = AsyncMock()
+    await router.start(queue)
+    callback = queue.consume.call_args.kwargs["callback"]
+
+    with router.register("1") as first, router.register("2") as second:
+        await callback(make_response("2"))
+        await callback(make_response("1"))
+
+        assert (await first).correlation_id == "1"
+        assert (await second).correlation_id == "2"
+
+    with router.register("3") as single:
+        # unknown response is dropped even if the only one request is in flight
+        await callback(make_response("custom"))
+
+        assert not single.done()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_router_duplicate_correlation_id() -> None:
+    router = RPCResponsesRouter()
+
+    with router.register("1") as future:
+        with pytest.raises(IncorrectState), router.register("1"):
+            pass
+
+        # the first request is still awaiting
+        assert not future.done()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_router_cleanup() -> None:
+    router = RPCResponsesRouter()
+    queue = AsyncMock()
+    await router.start(queue)
+    callback = queue.consume.call_args.kwargs["callback"]
+
+    with router.register("1"):
+        pass
+
+    # timed out request response doesn't break anything
+    await callback(make_response("1"))
+
+    with router.register("2") as future:
+        await router.close()
+
+        with pytest.raises(IncorrectState):
+            await future
+
+    assert router.consumer_tag is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_router_close_cancels_consumer() -> None:
+    router = RPCResponsesRouter()
+    queue = AsyncMock()
+    queue.channel = MagicMock(is_closed=False)
+    queue.consume.return_value = "tag"
+    await router.start(queue)
+
+    await router.close()
+
+    queue.cancel.assert_awaited_once_with("tag")
+    assert router.consumer_tag is None
+
+    # consumer is started again after reconnect
+    await router.start(queue)
+    assert queue.consume.await_count == 2
+
+
+@pytest.mark.asyncio()
+@pytest.mark.rabbit()
+async def test_rpc_unset() -> None:
+    with pytest.raises(IncorrectState):
+        await RPCUnset().start(AsyncMock())
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.rabbit import Channel, RabbitBroker
+from faststream.rabbit.message import RabbitBatchMessage
+from faststream.rabbit.subscriber.usecase import RabbitBatchSubscriber
+
+
+def make_raw_message(body: bytes) -> MagicMock:
+    msg = MagicMock(body=body, locked=False)
+    msg.ack = AsyncMock()
+    msg.nack = AsyncMock()
+    return msg
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("method", "frame"),
+    (
+        pytest.param("ack", {"multiple": True}, id="ack"),
+        pytest.param("nack", {"multiple": True, "requeue": True}, id="nack"),
+        pytest.param("reject", {"multiple": True, "requeue": False}, id="reject"),
+    ),
+)
+async def test_batch_settled_by_last_message(method: str, frame: dict) -> None:
+    raw_messages = tuple(make_raw_message(b"") for _ in range(3))
+    msg = RabbitBatchMessage(raw_message=raw_messages, body=[b"", b"", b""])
+
+    await getattr(msg, method)()
+
+    *others, last = raw_messages
+    settle = last.nack if method == "reject" else getattr(last, method)
+    settle.assert_awaited_once_with(**frame)
+    assert not any(m.ack.called or m.nack.called for m in others)
+
+
+@pytest.mark.rabbit()
+def test_batch_subscriber_own_channel() -> None:
+    broker = RabbitBroker()
+
+    sub = broker.subscriber("test", batch=True, max_records=5)
+    another_sub = broker.subscriber("test2", batch=True)
+
+    assert isinstance(sub, RabbitBatchSubscriber)
+    assert sub.channel is not None
+    assert sub.channel.prefetch_count == 10
+    assert sub.channel is not another_sub.channel
+
+
+@pytest.mark.rabbit()
+def test_batch_subscriber_custom_channel_is_private() -> None:
+    broker = RabbitBroker()
+    channel = Channel(prefetch_count=3)
+
+    sub = broker.subscriber("test", batch=True, channel=channel)
+    broker.subscriber("test2", channel=channel)
+
+    assert sub.channel == channel
+    assert sub.channel is not channel
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_consume_batches() -> None:
+    broker = RabbitBroker()
+    sub = broker.subscriber("test", batch=True, max_records=2, batch_timeout_ms=10)
+
+    batches: list[tuple[MagicMock, ...]] = []
+    sub.consume = AsyncMock(side_effect=batches.append)  # type: ignore[method-assign]
+    sub.running = True
+
+    raw_messages = [make_raw_message(str(i).encode()) for i in range(3)]
+    for m in raw_messages:
+        await sub._put_msg(m)
+
+    task = asyncio.create_task(sub._consume_batches())
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    assert batches == [tuple(raw_messages[:2]), (raw_messages[2],)]
@@ -44,6 +44,55 @@ class TestConsume(RabbitTestcaseConfig, BrokerRealConsumeTestcase):
 
         assert event.is_set()
 
+    @pytest.mark.asyncio()
+    async def test_consume_batch(self, queue: str) -> None:
+        consume_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=1)
+
+        @consume_broker.subscriber(queue, batch=True, max_records=2)
+        async def handler(msg: list) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, "hi", queue=queue)
+
+            result = await asyncio.wait_for(msgs_queue.get(), timeout=3)
+
+        assert result == [1, "hi"]
+
+    @pytest.mark.asyncio()
+    async def test_consume_batch_ack(self, queue: str) -> None:
+        consume_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue,
+            batch=True,
+            max_records=3,
+            batch_timeout_ms=100,
+        )
+        async def handler(msg: list) -> None:
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                IncomingMessage,
+                "ack",
+                spy_decorator(IncomingMessage.ack),
+            ) as m:
+                await br.publish_batch(1, 2, queue=queue)
+                await asyncio.wait_for(event.wait(), timeout=3)
+                await asyncio.sleep(0.1)
+
+                m.mock.assert_called_once()
+                assert m.mock.call_args.kwargs == {"multiple": True}
+
     @pytest.mark.asyncio()
     async def test_consume_with_get_old(
         self,
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.rabbit import Channel, RabbitExchange
+from faststream.rabbit.publisher.producer import AioPikaFastProducerImpl
+from faststream.rabbit.response import RabbitPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+def make_exchange(name: str) -> MagicMock:
+    exchange = MagicMock(name=name)
+    exchange.publish = AsyncMock(return_value=name)
+    return exchange
+
+
+def make_producer(
+    channels: int = 1,
+) -> tuple[AioPikaFastProducerImpl, MagicMock, MagicMock]:
+    declarer = MagicMock()
+    declarer.declare_exchange = AsyncMock(return_value=make_exchange("default"))
+
+    channel_obj = MagicMock()
+    channel_obj.default_exchange = make_exchange("pool-default")
+    channel_obj.get_exchange = AsyncMock(return_value=make_exchange("pool"))
+
+    channel_manager = MagicMock()
+    channel_manager.get_channel = AsyncMock(return_value=channel_obj)
+
+    producer = AioPikaFastProducerImpl(
+        declarer=declarer,
+        parser=None,
+        decoder=None,
+        channel_manager=channel_manager,
+        channels=[Channel() for _ in range(channels - 1)],
+    )
+    producer.connect()
+    return producer, declarer, channel_manager
+
+
+def make_cmd(*bodies: Any, exchange: str = "") -> RabbitPublishCommand:
+    return RabbitPublishCommand(
+        *bodies,
+        routing_key="test",
+        exchange=RabbitExchange.validate(exchange),
+        _publish_type=PublishType.PUBLISH,
+    )
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_exchange_is_cached() -> None:
+    producer, declarer, _ = make_producer()
+
+    for _ in range(3):
+        assert await producer.publish(make_cmd(b"", exchange="logs")) == "default"
+
+    declarer.declare_exchange.assert_awaited_once()
+
+    await producer.disconnect()
+    producer.connect()
+    await producer.publish(make_cmd(b"", exchange="logs"))
+
+    assert declarer.declare_exchange.await_count == 2
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_publish_round_robin() -> None:
+    producer, _, channel_manager = make_producer(channels=2)
+
+    results = [await producer.publish(make_cmd(b"", exchange="logs")) for _ in range(4)]
+
+    assert results == ["default", "pool", "default", "pool"]
+    channel_manager.get_channel.assert_awaited_once()
+    channel_obj = channel_manager.get_channel.return_value
+    channel_obj.get_exchange.assert_awaited_once_with("logs", ensure=False)
+
+    results = [await producer.publish(make_cmd(b"")) for _ in range(2)]
+    assert results == ["default", "pool-default"]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_publish_batch_awaits_confirms_together() -> None:
+    producer, declarer, _ = make_producer()
+
+    confirm: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    exchange = declarer.declare_exchange.return_value
+
+    async def publish(**kwargs: Any) -> str:
+        return await confirm
+
+    exchange.publish.side_effect = publish
+
+    task = asyncio.create_task(producer.publish_batch(make_cmd(1, 2, 3)))
+    await asyncio.sleep(0.01)
+
+    # all messages are sent before the first confirm
+    assert [c.kwargs["message"].body for c in exchange.publish.call_args_list] == [
+        b"1",
+        b"2",
+        b"3",
+    ]
+    assert not task.done()
+
+    confirm.set_result("ok")
+    assert await asyncio.wait_for(task, timeout=3) == ["ok", "ok", "ok"]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_publish_batch_single_channel() -> None:
+    producer, _, _ = make_producer(channels=2)
+
+    # the whole batch is published through the same channel
+    assert await producer.publish_batch(make_cmd(1, 2, 3, exchange="logs")) == [
+        "default",
+        "default",
+        "default",
+    ]
+    assert await producer.publish_batch(make_cmd(1, 2, exchange="logs")) == [
+        "pool",
+        "pool",
+    ]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_request_uses_reply_consumer_channel() -> None:
+    producer, declarer, channel_manager = make_producer(channels=2)
+
+    queue = MagicMock()
+    queue.consume = AsyncMock(return_value="tag")
+    declarer.declare_queue = AsyncMock(return_value=queue)
+
+    exchange = declarer.declare_exchange.return_value
+
+    async def publish(message: Any, **kwargs: Any) -> None:
+        # reply is delivered to the direct reply-to consumer
+        callback = queue.consume.call_args.kwargs["callback"]
+        await callback(MagicMock(correlation_id=message.correlation_id))
+
+    exchange.publish.side_effect = publish
+
+    for i in range(3):
+        cmd = make_cmd(b"", exchange="logs")
+        cmd.correlation_id = str(i)
+        response = await producer.request(cmd)
+        assert response.correlation_id == str(i)
+
+    # all requests are sent through the default channel owning the reply consumer
+    assert exchange.publish.await_count == 3
+    channel_manager.get_channel.assert_not_awaited()
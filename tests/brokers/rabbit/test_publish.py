@@ -198,3 +198,33 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
         assert event.is_set()
         mock.assert_called_with("Hello!")
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        pub_broker = self.get_broker(publisher_channels=2)
+
+        event = asyncio.Event()
+
+        @pub_broker.subscriber(queue)
+        async def handler(m) -> None:
+            mock(m)
+            if mock.call_count == 3:
+                event.set()
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            confirms = await br.publish_batch(1, "hi", 3, queue=queue)
+            assert len(confirms) == 3
+
+            await asyncio.wait_for(event.wait(), timeout=self.timeout)
+
+        assert sorted(map(str, (c.args[0] for c in mock.call_args_list))) == [
+            "1",
+            "3",
+            "hi",
+        ]
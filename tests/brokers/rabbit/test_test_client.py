@@ -1,5 +1,8 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -21,6 +24,14 @@ from .basic import RabbitMemoryTestcaseConfig
 @pytest.mark.rabbit()
 @pytest.mark.asyncio()
 class TestTestclient(RabbitMemoryTestcaseConfig, BrokerTestclientTestcase):
+    @contextmanager
+    def patch_broker_connect(self, broker: RabbitBroker) -> Iterator[None]:
+        with (
+            super().patch_broker_connect(broker),
+            patch.object(broker, "declare_queue", AsyncMock()),
+        ):
+            yield
+
     @pytest.mark.connected()
     async def test_with_real_testclient(
         self,
@@ -55,6 +66,32 @@ class TestTestclient(RabbitMemoryTestcaseConfig, BrokerTestclientTestcase):
             with pytest.raises(SubscriberNotFound):
                 await br.request("", "")
 
+    async def test_publish_batch(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", 1, queue=queue)
+            assert [c.args for c in subscriber.mock.call_args_list] == [
+                ("hello",),
+                (1,),
+            ]
+
+    async def test_publish_batch_to_batch_subscriber(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", 1, queue=queue)
+            subscriber.mock.assert_called_once_with(["hello", 1])
+
+            await br.publish("hello", queue)
+            subscriber.mock.assert_called_with(["hello"])
+
     @pytest.mark.xfail(reason="https://github.com/ag2ai/faststream/issues/2513")
     async def test_publisher_without_destination(self) -> None:
         """Fixes https://github.com/ag2ai/faststream/issues/2513."""
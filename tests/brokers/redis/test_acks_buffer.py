@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.redis.subscriber.usecases.stream_subscriber import StreamAcksBuffer
+
+
+def make_client() -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_flush_single_xack_per_stream() -> None:
+    client, pipe = make_client()
+    buffer = StreamAcksBuffer(client, interval=60, max_size=100)
+
+    buffer.add("stream1", "group", [b"1-0"])
+    buffer.add("stream1", "group", [b"2-0", b"3-0"])
+    buffer.add("stream2", "group", [b"1-0"])
+
+    await buffer.flush()
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.xack.call_args_list] == [
+        ("stream1", "group", b"1-0", b"2-0", b"3-0"),
+        ("stream2", "group", b"1-0"),
+    ]
+    pipe.execute.assert_awaited_once()
+
+    # nothing left to send
+    await buffer.flush()
+    client.pipeline.assert_called_once()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_flush_failure_keeps_ids() -> None:
+    client, pipe = make_client()
+    buffer = StreamAcksBuffer(client, interval=60, max_size=100)
+
+    buffer.add("stream", "group", [b"1-0"])
+
+    pipe.execute.side_effect = ConnectionError
+    with pytest.raises(ConnectionError):
+        await buffer.flush()
+
+    buffer.add("stream", "group", [b"2-0"])
+
+    pipe.execute.side_effect = None
+    pipe.xack.reset_mock()
+    await buffer.flush()
+
+    pipe.xack.assert_called_once_with("stream", "group", b"1-0", b"2-0")
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_cancelled_flush_keeps_ids() -> None:
+    client, pipe = make_client()
+    buffer = StreamAcksBuffer(client, interval=60, max_size=100)
+
+    buffer.add("stream", "group", [b"1-0"])
+
+    executing = asyncio.Event()
+
+    async def hang() -> None:
+        executing.set()
+        await asyncio.Event().wait()
+
+    pipe.execute.side_effect = hang
+    task = asyncio.create_task(buffer.flush())
+    await executing.wait()
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    pipe.execute.side_effect = None
+    pipe.xack.reset_mock()
+    await buffer.flush()
+
+    pipe.xack.assert_called_once_with("stream", "group", b"1-0")
+
+
+@pytest.mark.redis()
+def test_max_size_wakes_up_flush() -> None:
+    client, _ = make_client()
+    buffer = StreamAcksBuffer(client, interval=60, max_size=3)
+
+    buffer.add("stream", "group", [b"1-0", b"2-0"])
+    assert not buffer._wakeup.is_set()
+
+    buffer.add("stream", "group", [b"3-0"])
+    assert buffer._wakeup.is_set()
@@ -359,3 +359,55 @@ class TestAutoClaim(RedisTestcaseConfig, BrokerRealConsumeTestcase):
             # Verify messages were claimed in both passes
             mock.assert_any_call("first_pass_msg0")
             mock.assert_any_call("second_pass_msg0")
+
+    @pytest.mark.slow()
+    async def test_pending_claimed_by_batches(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        """Test pending messages are claimed `max_records` at a time."""
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="claim_group",
+                consumer="claim_consumer",
+                batch=True,
+                max_records=2,
+                min_idle_time=1,
+            ),
+        )
+        async def handler(msg: list) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br._connection.xgroup_create(
+                queue, "claim_group", id="0", mkstream=True
+            )
+            for i in range(5):
+                await br.publish(i, stream=queue)
+
+            # Read but don't ack to leave the messages pending
+            await br._connection.xreadgroup(
+                groupname="claim_group",
+                consumername="temp",
+                streams={queue: ">"},
+                count=10,
+            )
+            await asyncio.sleep(0.1)
+
+            await br.start()
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=3,
+            )
+
+            assert event.is_set()
+            assert [c.args[0] for c in mock.call_args_list] == [[0, 1], [2, 3], [4]]
@@ -776,6 +776,46 @@ class TestConsumeStream(RedisTestcaseConfig):
 
         assert event.is_set()
 
+    async def test_consume_buffered_ack(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = self.get_broker(apply_types=True)
+
+        consumed = 0
+        event = asyncio.Event()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer=queue,
+                ack_flush_interval=60 * 1000,
+                ack_batch_size=3,
+            ),
+        )
+        async def handler(msg: RedisMessage) -> None:
+            nonlocal consumed
+            consumed += 1
+            if consumed == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
+                for i in range(3):
+                    await br.publish(i, stream=queue)
+
+                await asyncio.wait_for(event.wait(), timeout=3)
+                await asyncio.sleep(0.1)
+
+                # all message ids are acknowledged by a single command
+                m.mock.assert_called_once()
+
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     async def test_consume_and_delete_acked(
         self,
@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ResponseError
+
+from faststream.redis import ListSub, RedisBroker
+from faststream.redis.subscriber.usecases.list_subscriber import ListBatchSubscriber
+
+
+def make_subscriber(max_records: int = 3) -> ListBatchSubscriber:
+    broker = RedisBroker()
+    subscriber = broker.subscriber(
+        list=ListSub("list", batch=True, max_records=max_records, polling_interval=1),
+    )
+    assert isinstance(subscriber, ListBatchSubscriber)
+    return subscriber
+
+
+def make_client(*pipe_results: object) -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=list(pipe_results))
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_blmpop() -> None:
+    subscriber = make_subscriber()
+    client, _ = make_client()
+    client.blmpop = AsyncMock(return_value=[b"list", [b"1", b"2"]])
+
+    assert await subscriber._pop_batch(client) == [b"1", b"2"]
+    client.blmpop.assert_awaited_once_with(1, 1, "list", direction="LEFT", count=3)
+
+    client.blmpop.return_value = None
+    assert await subscriber._pop_batch(client) is None
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_blpop_fallback() -> None:
+    subscriber = make_subscriber()
+    client, pipe = make_client([b"list", b"1"], [b"2", b"3"])
+    client.blmpop = AsyncMock(side_effect=ResponseError("unknown command 'BLMPOP'"))
+
+    assert await subscriber._pop_batch(client) == [b"1", b"2", b"3"]
+    pipe.blpop.assert_called_once_with("list", timeout=1)
+    pipe.lpop.assert_called_once_with("list", count=2)
+
+    pipe.execute.return_value = [None, None]
+    assert await subscriber._pop_batch(client) == []
+
+    # unsupported command is not called again
+    client.blmpop.assert_awaited_once()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_blmpop_error_raised() -> None:
+    subscriber = make_subscriber()
+    client, _ = make_client()
+    client.blmpop = AsyncMock(side_effect=ResponseError("WRONGTYPE"))
+
+    with pytest.raises(ResponseError):
+        await subscriber._pop_batch(client)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_zero_polling_interval_does_not_block() -> None:
+    broker = RedisBroker()
+    subscriber = broker.subscriber(
+        list=ListSub("list", batch=True, max_records=3, polling_interval=0),
+    )
+    assert isinstance(subscriber, ListBatchSubscriber)
+
+    client, pipe = make_client()
+    client.blmpop = AsyncMock()
+    client.lpop = AsyncMock(return_value=[b"1", b"2"])
+
+    assert await subscriber._pop_batch(client) == [b"1", b"2"]
+    client.lpop.assert_awaited_once_with("list", count=3)
+
+    client.lpop.return_value = None
+    assert await subscriber._pop_batch(client) is None
+
+    client.blmpop.assert_not_awaited()
+    pipe.blpop.assert_not_called()
@@ -0,0 +1,201 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.redis import RedisBroker
+from faststream.redis.subscriber.multiplexer import ReadMultiplexer
+
+
+def make_client(*results: Any) -> MagicMock:
+    responses = list(results)
+
+    async def read(*args: Any, **kwargs: Any) -> Any:
+        if responses:
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        await asyncio.sleep(0.01)
+        return None
+
+    client = MagicMock()
+    client.xread = AsyncMock(side_effect=read)
+    client.blpop = AsyncMock(side_effect=read)
+    client.lpop = AsyncMock(return_value=[b"2", b"3"])
+    client.lpush = AsyncMock()
+    return client
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_streams_fan_out() -> None:
+    msgs = [(b"1-0", {b"data": b"1"})]
+    client = make_client([(b"stream1", msgs)])
+    multiplexer = ReadMultiplexer()
+
+    first = multiplexer.read_stream(
+        client, "stream1", last_id="$", max_records=None, polling_interval=100
+    )
+    second = multiplexer.read_stream(
+        client, "stream1", last_id="$", max_records=None, polling_interval=100
+    )
+    other = multiplexer.read_stream(
+        client, "stream2", last_id="$", max_records=None, polling_interval=100
+    )
+
+    assert await first.get(1) == ((b"stream1", msgs),)
+    assert await second.get(1) == ((b"stream1", msgs),)
+
+    # single connection reads all streams
+    client.xread.assert_any_await({"stream1": "$", "stream2": "$"}, block=100, count=None)
+
+    await first.get(0.05)
+    client.xread.assert_awaited_with(
+        {"stream1": b"1-0", "stream2": "$"}, block=100, count=None
+    )
+
+    for inbox in (first, second, other):
+        await multiplexer.remove(inbox)
+    assert not multiplexer._readers
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_list_delivered_once() -> None:
+    client = make_client((b"list", b"1"))
+    multiplexer = ReadMultiplexer()
+
+    first = multiplexer.read_list(client, "list", max_records=None, polling_interval=0.1)
+    second = multiplexer.read_list(client, "list", max_records=None, polling_interval=0.1)
+
+    results = await asyncio.gather(first.get(0.1), second.get(0.1))
+    assert sorted(results, key=bool) == [None, b"1"]
+
+    await multiplexer.remove(first)
+    await multiplexer.remove(second)
+    assert not multiplexer._readers
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_list_batch_filled_by_lpop() -> None:
+    client = make_client((b"list", b"1"))
+    multiplexer = ReadMultiplexer()
+
+    inbox = multiplexer.read_list(client, "list", max_records=3, polling_interval=0.1)
+
+    assert await inbox.get(1) == [b"1", b"2", b"3"]
+    client.lpop.assert_awaited_once_with("list", count=2)
+
+    await multiplexer.remove(inbox)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_list_remove_pushes_data_back() -> None:
+    client = make_client((b"list", b"1"))
+    multiplexer = ReadMultiplexer()
+
+    inbox = multiplexer.read_list(client, "list", max_records=3, polling_interval=0.1)
+    await asyncio.sleep(0.01)
+
+    await multiplexer.remove(inbox)
+
+    client.lpush.assert_awaited_once_with("list", b"3", b"2", b"1")
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_read_error_propagated() -> None:
+    client = make_client(ConnectionError("lost"), (b"list", b"1"))
+    multiplexer = ReadMultiplexer()
+
+    inbox = multiplexer.read_list(client, "list", max_records=None, polling_interval=0.1)
+
+    with pytest.raises(ConnectionError):
+        await inbox.get(1)
+
+    assert await inbox.get(1) == b"1"
+
+    await multiplexer.remove(inbox)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_remove_cancels_reader() -> None:
+    client = make_client()
+    multiplexer = ReadMultiplexer()
+
+    inbox = multiplexer.read_list(client, "list", max_records=None, polling_interval=0.1)
+    reader = inbox.reader
+    assert reader is not None
+    task = reader._task
+    assert task is not None
+
+    await multiplexer.remove(inbox)
+
+    assert task.done()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_close_pushes_data_back() -> None:
+    client = make_client((b"list", b"1"))
+    multiplexer = ReadMultiplexer()
+
+    inbox = multiplexer.read_list(client, "list", max_records=3, polling_interval=0.1)
+    task = inbox.reader._task
+    await asyncio.sleep(0.01)
+
+    await multiplexer.close()
+
+    assert task.done()
+    assert not multiplexer._readers
+    client.lpush.assert_awaited_once_with("list", b"3", b"2", b"1")
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_close_waits_popped_message_delivery() -> None:
+    pushed, popping = asyncio.Event(), asyncio.Event()
+
+    async def lpop(*args: Any, **kwargs: Any) -> list[bytes]:
+        popping.set()
+        await asyncio.sleep(0.01)
+        return [b"2"]
+
+    async def lpush(*args: Any) -> None:
+        pushed.set()
+
+    client = make_client((b"list", b"1"))
+    client.lpop = AsyncMock(side_effect=lpop)
+    client.lpush = AsyncMock(side_effect=lpush)
+    multiplexer = ReadMultiplexer()
+
+    multiplexer.read_list(client, "list", max_records=2, polling_interval=0.1)
+    await popping.wait()
+
+    # reader is cancelled while it completes the batch
+    await multiplexer.close()
+
+    assert pushed.is_set()
+    client.lpush.assert_awaited_once_with("list", b"2", b"1")
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_multiplexer_closed_before_disconnect() -> None:
+    broker = RedisBroker(multiplex_reads=True)
+    config = broker.config.broker_config
+
+    calls = MagicMock()
+    config.multiplexer.close = AsyncMock(side_effect=lambda: calls("close"))
+    config.connection.disconnect = AsyncMock(
+        side_effect=lambda: calls("disconnect"),
+    )
+
+    await config.disconnect()
+
+    assert [c.args[0] for c in calls.call_args_list] == ["close", "disconnect"]
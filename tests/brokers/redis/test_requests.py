@@ -1,3 +1,6 @@
+import asyncio
+
+import anyio
 import pytest
 
 from faststream import BaseMiddleware
@@ -32,7 +35,35 @@ class RedisRequestsTestcase(RequestsTestcase):
 @pytest.mark.connected()
 @pytest.mark.redis()
 class TestRealRequests(RedisTestcaseConfig, RedisRequestsTestcase):
-    pass
+    async def test_requests_in_flight_limit(self, queue: str) -> None:
+        broker = self.get_broker(max_requests_in_flight=2)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        @broker.subscriber(queue, max_workers=10)
+        async def handler(msg: int) -> int:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(in_flight, max_in_flight)
+            await anyio.sleep(0.05)
+            in_flight -= 1
+            return msg
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(broker.request(i, queue, timeout=self.timeout) for i in range(6))
+            )
+
+            # all requests share the only one inbox subscription
+            inbox = broker.config.producer._inbox
+            assert inbox is not None
+            assert not inbox._futures
+
+        assert [await r.decode() for r in responses] == list(range(6))
+        assert max_in_flight == 2
 
 
 @pytest.mark.redis()
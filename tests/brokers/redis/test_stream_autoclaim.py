@@ -0,0 +1,89 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from faststream.redis import RedisBroker, StreamSub
+from faststream.redis.subscriber.usecases.basic import LogicSubscriber
+from faststream.redis.subscriber.usecases.stream_subscriber import (
+    _StreamHandlerMixin,
+)
+
+PENDING = [(f"{i}-0".encode(), {b"data": str(i).encode()}) for i in range(5)]
+
+
+def make_client() -> MagicMock:
+    pending = list(PENDING)
+
+    async def xautoclaim(*, start_id: bytes, count: int, **kwargs: Any) -> Any:
+        claimed, pending[:count] = pending[:count], []
+        next_id = b"0-0" if not pending else pending[0][0]
+        return next_id, claimed, []
+
+    client = MagicMock()
+    client.xgroup_create = AsyncMock()
+    client.xautoclaim = AsyncMock(side_effect=xautoclaim)
+    client.xreadgroup = AsyncMock(return_value=())
+    return client
+
+
+async def start_reader(
+    subscriber: _StreamHandlerMixin,
+    client: MagicMock,
+) -> Any:
+    with (
+        patch.object(type(subscriber), "_client", client),
+        patch.object(LogicSubscriber, "start", AsyncMock()) as start,
+    ):
+        await subscriber.start()
+
+    subscriber.consume_one = AsyncMock()  # type: ignore[method-assign]
+    return start.call_args.args[0]
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("batch", (pytest.param(False), pytest.param(True)))
+async def test_pending_claimed_by_max_records(batch: bool) -> None:
+    broker = RedisBroker()
+    subscriber = broker.subscriber(
+        stream=StreamSub(
+            "stream",
+            group="group",
+            consumer="consumer",
+            min_idle_time=100,
+            max_records=2,
+            batch=batch,
+        ),
+    )
+    subscriber.calls = [MagicMock()]
+    client = make_client()
+
+    read = await start_reader(subscriber, client)
+
+    for _ in range(3):
+        await subscriber._get_msgs(read)
+
+    assert [c.kwargs["count"] for c in client.xautoclaim.call_args_list] == [2, 2, 2]
+    client.xreadgroup.assert_not_awaited()
+
+    msgs = [c.args[0] for c in subscriber.consume_one.call_args_list]
+    if batch:
+        assert [m["message_ids"] for m in msgs] == [
+            [b"0-0", b"1-0"],
+            [b"2-0", b"3-0"],
+            [b"4-0"],
+        ]
+    else:
+        assert [m["message_ids"] for m in msgs] == [[id_] for id_, _ in PENDING]
+
+    # nothing pending, so new messages are read
+    await subscriber._get_msgs(read)
+    client.xreadgroup.assert_awaited_once_with(
+        groupname="group",
+        consumername="consumer",
+        streams={"stream": ">"},
+        count=2,
+        block=100,
+        noack=False,
+    )
@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from faststream.message import StreamMessage
+
+
+def test_ids_generated_lazily() -> None:
+    msg = StreamMessage(None, b"")
+
+    assert msg._correlation_id is None
+    assert msg._message_id is None
+
+    assert msg.message_id == msg.message_id
+    assert msg.correlation_id == msg.correlation_id
+    assert msg.message_id != msg.correlation_id
+
+
+def test_explicit_ids() -> None:
+    msg = StreamMessage(None, b"", correlation_id="1", message_id="2")
+
+    assert msg.correlation_id == "1"
+    assert msg.message_id == "2"
+
+    msg.correlation_id = "3"
+    assert msg.correlation_id == "3"
+
+
+def test_default_containers() -> None:
+    msg = StreamMessage(None, b"")
+
+    assert msg.headers == {}
+    assert msg.batch_headers == []
+    assert msg.path == {}
+
+    msg.headers["key"] = "value"
+    assert msg.headers == {"key": "value"}
+
+    assert StreamMessage(None, b"").headers == {}
+
+
+def test_custom_attributes() -> None:
+    msg = StreamMessage(None, b"")
+    msg.custom = 1
+    assert msg.custom == 1
+
+
+@pytest.mark.asyncio()
+async def test_decode_cache() -> None:
+    decoder = AsyncMock(return_value={"key": "value"})
+
+    msg = StreamMessage(None, b"")
+    msg.set_decoder(decoder)
+
+    assert await msg.decode() == {"key": "value"}
+    assert await msg.decode() == {"key": "value"}
+    decoder.assert_awaited_once()
+
+    msg.clear_cache()
+    await msg.decode()
+    assert decoder.await_count == 2
@@ -13,6 +13,12 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import Span, TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    Sampler,
+    SamplingResult,
+)
 from opentelemetry.semconv.trace import SpanAttributes as SpanAttr
 from opentelemetry.trace import SpanKind, get_current_span
 
@@ -374,6 +380,194 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
         self.assert_metrics(metrics, error_type=expected_value_type)
         mock.assert_called_once_with(msg)
 
+    async def test_metrics_only(
+        self,
+        queue: str,
+        mock: MagicMock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+        event: asyncio.Event,
+    ) -> None:
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            include_traces=False,
+        )
+        broker = self.get_broker(middlewares=(mid,), apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m, span: CurrentSpan) -> None:
+            assert not span.is_recording()
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert not self.get_spans(trace_exporter)
+
+        metrics = self.get_metrics(metric_reader)
+        self.assert_metrics(metrics)
+        mock.assert_called_once_with(msg)
+
+    async def test_sampled_out_message(
+        self,
+        queue: str,
+        mock: MagicMock,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+        event: asyncio.Event,
+    ) -> None:
+        tracer_provider = TracerProvider(resource=self.resource, sampler=ALWAYS_OFF)
+        tracer_provider.add_span_processor(SimpleSpanProcessor(trace_exporter))
+
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+        )
+        broker = self.get_broker(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m) -> None:
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert not self.get_spans(trace_exporter)
+
+        metrics = self.get_metrics(metric_reader)
+        self.assert_metrics(metrics)
+        mock.assert_called_once_with(msg)
+
+    async def test_sampler_gets_span_attributes(
+        self,
+        queue: str,
+        mock: MagicMock,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        event: asyncio.Event,
+    ) -> None:
+        sampled: dict[str, dict[str, Any]] = {}
+
+        class RecordingSampler(Sampler):
+            def should_sample(
+                self,
+                parent_context: Any,
+                trace_id: int,
+                name: str,
+                kind: Any = None,
+                attributes: Any = None,
+                *args: Any,
+                **kwargs: Any,
+            ) -> SamplingResult:
+                sampled[name] = dict(attributes or {})
+                return SamplingResult(Decision.DROP)
+
+            def get_description(self) -> str:
+                return "RecordingSampler"
+
+        tracer_provider = TracerProvider(
+            resource=self.resource,
+            sampler=RecordingSampler(),
+        )
+        tracer_provider.add_span_processor(SimpleSpanProcessor(trace_exporter))
+
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+        )
+        broker = self.get_broker(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m) -> None:
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("start", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert not self.get_spans(trace_exporter)
+
+        destination = self.destination_name(queue)
+        for action in (Action.PUBLISH, Action.PROCESS):
+            attrs = sampled[f"{destination} {action}"]
+            assert attrs[SpanAttr.MESSAGING_SYSTEM] == self.messaging_system, attrs
+            assert attrs[SpanAttr.MESSAGING_OPERATION] == action, attrs
+
+        attrs = sampled[f"{destination} {Action.CREATE}"]
+        assert attrs[SpanAttr.MESSAGING_SYSTEM] == self.messaging_system, attrs
+
+    async def test_publish_in_span_context(
+        self,
+        queue: str,
+        mock: MagicMock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+        event: asyncio.Event,
+    ) -> None:
+        mid = self.telemetry_middleware_class(tracer_provider=tracer_provider)
+        broker = self.get_broker(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m) -> None:
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            with tracer_provider.get_tracer(__name__).start_as_current_span("parent"):
+                tasks = (
+                    asyncio.create_task(broker.publish(msg, queue)),
+                    asyncio.create_task(event.wait()),
+                )
+                await asyncio.wait(tasks, timeout=self.timeout)
+
+        parent, publish, process = self.get_spans(trace_exporter)
+        parent_span_id = parent.context.span_id
+
+        self.assert_span(publish, Action.PUBLISH, queue, msg, parent_span_id)
+        self.assert_span(process, Action.PROCESS, queue, msg, parent_span_id)
+        mock.assert_called_once_with(msg)
+
     async def test_span_in_context(
         self,
         queue: str,
@@ -454,3 +454,38 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+    def test_labels_children_cached(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+            custom_label_names=["foo"],
+        )
+        manager._cache_size = 2
+
+        metric = manager._container.received_messages_total
+        child = manager._labels(metric, broker=broker, handler=queue, foo="1")
+        assert manager._labels(metric, broker=broker, handler=queue, foo="1") is child
+
+        manager._labels(metric, broker=broker, handler=queue, foo="2")
+        # recently used child is kept
+        manager._labels(metric, broker=broker, handler=queue, foo="1")
+        manager._labels(metric, broker=broker, handler=queue, foo="3")
+
+        assert [key[-1] for key in manager._children] == ["1", "3"]
+
+        for _ in range(3):
+            manager.add_received_message(broker=broker, handler=queue, foo="1")
+
+        (metric_value,) = metric.collect()
+        assert {
+            s.labels["foo"]: s.value
+            for s in metric_value.samples
+            if s.name.endswith("_total")
+        } == {"1": 3.0, "2": 0.0, "3": 0.0}
@@ -1,8 +1,14 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fast_depends import ValidationError
 
-from faststream import Context, ContextRepo
+from faststream import Context, ContextRepo, Depends
+from faststream._internal.context import Context as ContextField
+from faststream._internal.di import FastDependsConfig
 from faststream._internal.utils import apply_types
+from faststream.exceptions import ContextError
 
 
 def test_context_getattr(context: ContextRepo) -> None:
@@ -160,6 +166,38 @@ def test_default(context: ContextRepo) -> None:
         use()
 
 
+def test_resolve_compiled(context: ContextRepo) -> None:
+    with pytest.raises(ContextError):
+        context.resolve("key.value")
+
+    # compiled resolver sees values set after its creation
+    with context.scope("key", {"value": 1}):
+        assert context.resolve("key.value") == 1
+
+    context.set_global("key", {"value": 2})
+    with context.scope("key", {"value": 1}):
+        assert context.resolve("key.value") == 2
+
+    context.clear()
+    with pytest.raises(ContextError):
+        context.resolve("key.value")
+
+    with context.scope("key", {"value": 3}):
+        assert context.resolve("key.value") == 3
+
+    assert "key" not in context.context
+
+
+def test_resolve_cache_bounded(context: ContextRepo) -> None:
+    for i in range(context.max_cached_resolvers + 10):
+        with pytest.raises(ContextError):
+            context.resolve(f"key{i}")
+
+    assert len(context._resolvers) <= context.max_cached_resolvers
+    # failed lookups don't create context variables
+    assert not context._scope_context
+
+
 def test_local_default(context: ContextRepo) -> None:
     key = "some-key"
 
@@ -218,3 +256,71 @@ async def test_context_with_custom_object_implementing_comparison(
         context.scope("user3", User(user_id=4)),
     ):
         assert await use()
+
+
+@pytest.mark.asyncio()
+async def test_handler_context_resolved_inline(context: ContextRepo) -> None:
+    config = FastDependsConfig(context=context)
+
+    async def handler(body: str, key: int = Context(), key2=Context("key3.value")):
+        return body, key, key2
+
+    built = config.build_call(handler)
+
+    # message schema excludes context fields
+    assert set(built.dependent.custom_fields) == {"key", "key2"}
+
+    message = MagicMock()
+    message.decode = AsyncMock(return_value="hi")
+
+    with (
+        patch("fast_depends.utils.run_in_threadpool") as threadpool,
+        context.scope("key", 1),
+        context.scope("key3", {"value": 2}),
+    ):
+        assert await built.wrapped_call(message) == ("hi", 1, 2)
+
+    threadpool.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_handler_context_not_passed_to_dependencies(
+    context: ContextRepo,
+) -> None:
+    config = FastDependsConfig(context=context)
+
+    def dep(key: int = 0) -> int:
+        return key
+
+    async def handler(body: str, key: int = Context(), d: int = Depends(dep)):
+        return key, d
+
+    built = config.build_call(handler)
+
+    message = MagicMock()
+    message.decode = AsyncMock(return_value={"body": "hi"})
+
+    with context.scope("key", 1):
+        assert await built.wrapped_call(message) == (1, 0)
+
+
+@pytest.mark.asyncio()
+async def test_handler_context_subclass_use_respected(context: ContextRepo) -> None:
+    config = FastDependsConfig(context=context)
+
+    class UpperContext(ContextField):
+        def use(self, /, **kwargs: Any) -> dict[str, Any]:
+            kwargs = super().use(**kwargs)
+            kwargs[self.param_name] = kwargs[self.param_name].upper()
+            return kwargs
+
+    async def handler(body: str, key: str = UpperContext(), key2=Context()):
+        return body, key, key2
+
+    built = config.build_call(handler)
+
+    message = MagicMock()
+    message.decode = AsyncMock(return_value="hi")
+
+    with context.scope("key", "value"), context.scope("key2", "value"):
+        assert await built.wrapped_call(message) == ("hi", "VALUE", "value")
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = (
+    "faststream._internal.testing.app",
+    "faststream.specification.asyncapi.factory",
+    "faststream.asgi",
+    "email_validator",
+    "uvicorn",
+)
+
+
+def imported_modules(module: str) -> set[str]:
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    ("module", "test_client"),
+    (
+        pytest.param("faststream", None, id="faststream"),
+        pytest.param(
+            "faststream.kafka",
+            "faststream.kafka.testing",
+            marks=pytest.mark.kafka(),
+            id="kafka",
+        ),
+        pytest.param(
+            "faststream.confluent",
+            "faststream.confluent.testing",
+            marks=pytest.mark.confluent(),
+            id="confluent",
+        ),
+        pytest.param(
+            "faststream.rabbit",
+            "faststream.rabbit.testing",
+            marks=pytest.mark.rabbit(),
+            id="rabbit",
+        ),
+        pytest.param(
+            "faststream.nats",
+            "faststream.nats.testing",
+            marks=pytest.mark.nats(),
+            id="nats",
+        ),
+        pytest.param(
+            "faststream.redis",
+            "faststream.redis.testing",
+            marks=pytest.mark.redis(),
+            id="redis",
+        ),
+    ),
+)
+def test_optional_modules_not_imported(module: str, test_client: str | None) -> None:
+    modules = imported_modules(module)
+
+    assert not modules.intersection((*LAZY_MODULES, test_client))